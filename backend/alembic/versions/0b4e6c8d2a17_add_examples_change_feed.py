@@ -0,0 +1,46 @@
+"""Add examples change feed index and updated_at trigger
+
+Revision ID: 0b4e6c8d2a17
+Revises: f2b7d91c4e05
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b4e6c8d2a17'
+down_revision: Union[str, None] = 'f2b7d91c4e05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_examples_updated_at_id', 'examples', ['updated_at', 'id'], unique=False)
+    # アプリケーションを経由しない更新でもupdated_atを進め、変更フィードから漏れないようにする
+    # （updated_atはタイムゾーンなしのUTCで保持している）
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp() AT TIME ZONE 'UTC';
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER examples_set_updated_at
+        BEFORE UPDATE ON examples
+        FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS examples_set_updated_at ON examples')
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+    op.drop_index('ix_examples_updated_at_id', table_name='examples')
@@ -0,0 +1,30 @@
+"""Add batch state partitions
+
+Revision ID: e8f0a6b3c214
+Revises: c51d2e8a9f63
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f0a6b3c214'
+down_revision: Union[str, None] = 'c51d2e8a9f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('batch_state', sa.Column('run_id', sa.String(length=255), nullable=True))
+    op.add_column('batch_state', sa.Column('range_start', sa.Integer(), nullable=True))
+    op.add_column('batch_state', sa.Column('range_end', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('batch_state', 'range_end')
+    op.drop_column('batch_state', 'range_start')
+    op.drop_column('batch_state', 'run_id')
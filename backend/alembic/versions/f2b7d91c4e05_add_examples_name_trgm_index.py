@@ -0,0 +1,34 @@
+"""Add examples name trigram index
+
+Revision ID: f2b7d91c4e05
+Revises: e8f0a6b3c214
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d91c4e05'
+down_revision: Union[str, None] = 'e8f0a6b3c214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_examples_name_trgm',
+        'examples',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_examples_name_trgm', table_name='examples')
+    # 拡張は他のオブジェクトが利用している可能性があるため削除しない
@@ -0,0 +1,4 @@
+import time
+
+# アプリケーションのimport開始時刻（起動時間の計測用）
+IMPORT_STARTED_AT = time.perf_counter()
@@ -0,0 +1,100 @@
+import asyncio
+from collections.abc import Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.application.async_example_usecase import AsyncExampleUseCase
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_engine, get_async_db
+from app.core.health import HealthMonitor, Probe, database_probe
+from app.domain.repositories.example_repository import IExampleRepository
+from app.infrastructure.clients import ClientRegistry
+from app.infrastructure.database.unit_of_work import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.email.smtp_client import SMTPClient
+from app.infrastructure.repositories.cached_example_repository import CachedExampleRepository
+from app.infrastructure.repositories.example_repository import ExampleRepository
+from app.infrastructure.storage.s3_client import S3Client
+
+# プロセス内で共有するfind_by_id用キャッシュ
+example_cache = TTLCache(
+    max_size=settings.EXAMPLE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.EXAMPLE_CACHE_TTL_SECONDS,
+)
+
+# 署名付きダウンロードURLのキャッシュ（有効期限の半分まで再利用する）
+presign_cache = TTLCache(
+    max_size=settings.S3_PRESIGN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.S3_PRESIGN_EXPIRES_SECONDS / 2,
+)
+
+# S3・SMTPクライアント（初回利用時に生成、lifespan終了時に接続を閉じる）
+clients = ClientRegistry()
+
+
+def get_s3_client() -> S3Client:
+    """プロセス内で共有するS3クライアント"""
+    return clients.s3()
+
+
+def get_smtp_client() -> SMTPClient:
+    """プロセス内で共有するSMTPクライアント"""
+    return clients.smtp()
+
+
+def build_health_probes() -> dict[str, Probe]:
+    """設定に応じてレディネスチェックのプローブを組み立てる"""
+    probes: dict[str, Probe] = {"database": database_probe(async_engine)}
+    if settings.HEALTH_CHECK_S3:
+
+        async def s3_probe() -> None:
+            # 初回はクライアント生成も別スレッドで行う
+            await asyncio.to_thread(lambda: get_s3_client().check_connection())
+
+        probes["s3"] = s3_probe
+    if settings.HEALTH_CHECK_SMTP:
+
+        async def smtp_probe() -> None:
+            await get_smtp_client().check_connection()
+
+        probes["smtp"] = smtp_probe
+    return probes
+
+
+# レディネスチェック用のバックグラウンド監視（lifespanで開始・停止）
+health_monitor = HealthMonitor(
+    build_health_probes(),
+    interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    timeout_seconds=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+)
+
+
+def build_example_repository(
+    db: Session, after_commit: Callable[[Callable[[], None]], None] | None = None
+) -> IExampleRepository:
+    """設定に応じてExampleリポジトリを組み立てる
+
+    after_commitにはUnit of Workのafter_commitを渡し、キャッシュの破棄をcommit後に行う。
+    """
+    repository: IExampleRepository = ExampleRepository(db)
+    if settings.EXAMPLE_CACHE_ENABLED:
+        repository = CachedExampleRepository(
+            repository,
+            example_cache,
+            negative_ttl_seconds=settings.EXAMPLE_CACHE_NEGATIVE_TTL_SECONDS,
+            after_commit=after_commit,
+        )
+    return repository
+
+
+def get_example_usecase(db: AsyncSession = Depends(get_async_db)) -> AsyncExampleUseCase:
+    """リクエストごとのExampleユースケース"""
+
+    # リポジトリはUnit of Workの生成後に（同期Session上で呼び出しごとに）組み立てられる
+    def repository_factory(session: Session) -> IExampleRepository:
+        return build_example_repository(session, uow.after_commit)
+
+    uow = AsyncSqlAlchemyUnitOfWork(db, repository_factory)
+    return AsyncExampleUseCase(uow, notify_email=settings.EXAMPLE_CREATED_NOTIFY_EMAIL)
@@ -1,38 +1,302 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import UTC, datetime
+from typing import Annotated, Literal
 
-from app.application.example_usecase import ExampleUseCase
-from app.core.database import get_db
-from app.infrastructure.repositories.example_repository import ExampleRepository
-from app.schemas.example import ExampleCreate, ExampleResponse
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.api.deps import get_example_usecase
+from app.application.async_example_usecase import AsyncExampleUseCase
+from app.core.config import settings
+from app.core.etag import etag_matches, make_etag
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import TypeAdapterJSONResponse, dump_json
+from app.domain.example import Example
+from app.schemas.example import (
+    ExampleBulkCreateResponse,
+    ExampleBulkItemResult,
+    ExampleChanges,
+    ExampleCreate,
+    ExamplePage,
+    ExampleResponse,
+    ExampleUpdate,
+)
 
 router = APIRouter()
 
 
+# エンティティはレスポンスのスキーマとして検証してからJSON化する（スキーマにない属性は出力しない）
+EXAMPLE_JSON = TypeAdapter(ExampleResponse)
+EXAMPLE_PAGE_JSON = TypeAdapter(ExamplePage)
+EXAMPLE_CHANGES_JSON = TypeAdapter(ExampleChanges)
+EXAMPLE_BULK_JSON = TypeAdapter(ExampleBulkCreateResponse)
+
+
 @router.post("/", response_model=ExampleResponse, status_code=201)
-def create_example(data: ExampleCreate, db: Session = Depends(get_db)):
+async def create_example(
+    data: ExampleCreate, usecase: AsyncExampleUseCase = Depends(get_example_usecase)
+):
     """サンプル作成"""
-    repository = ExampleRepository(db)
-    usecase = ExampleUseCase(repository)
-    example = usecase.create_example(data)
-    return example
+    example = await usecase.create_example(data)
+    return TypeAdapterJSONResponse(example, EXAMPLE_JSON, status_code=201)
+
+
+@router.post("/bulk", response_model=ExampleBulkCreateResponse, status_code=201)
+async def create_examples(
+    data: Annotated[
+        list[ExampleCreate], Body(min_length=1, max_length=settings.BULK_CREATE_MAX_ITEMS)
+    ],
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプル一括作成
+
+    全件を1トランザクションでINSERTし、要素ごとの成否を返す。
+    一部でも失敗した場合は207を返す。
+    """
+    saved = await usecase.create_examples(data, settings.BULK_INSERT_BATCH_SIZE)
+    results = [
+        ExampleBulkItemResult(index=i, status="created", example=result.example)
+        if result.example is not None
+        else ExampleBulkItemResult(index=i, status="failed", error=result.error)
+        for i, result in enumerate(saved)
+    ]
+    failed = sum(1 for result in saved if result.example is None)
+    return TypeAdapterJSONResponse(
+        ExampleBulkCreateResponse(created=len(saved) - failed, failed=failed, results=results),
+        EXAMPLE_BULK_JSON,
+        status_code=207 if failed else 201,
+    )
+
+
+EXPORT_CSV_COLUMNS = ["id", "name", "description", "created_at", "updated_at"]
+
+
+async def _chunked(
+    examples: AsyncIterable[Example], size: int
+) -> AsyncIterator[list[Example]]:
+    """エンティティをsize件ずつのリストにまとめる"""
+    chunk: list[Example] = []
+    async for example in examples:
+        chunk.append(example)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _iter_ndjson(
+    examples: AsyncIterable[Example], chunk_size: int
+) -> AsyncIterator[bytes]:
+    """NDJSON形式でチャンク単位に出力"""
+    async for chunk in _chunked(examples, chunk_size):
+        yield b"".join(dump_json(EXAMPLE_JSON, e) + b"\n" for e in chunk)
+
+
+async def _iter_csv(examples: AsyncIterable[Example], chunk_size: int) -> AsyncIterator[str]:
+    """CSV形式でチャンク単位に出力"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    async for chunk in _chunked(examples, chunk_size):
+        writer.writerows(
+            [e.id, e.name, e.description, e.created_at.isoformat(), e.updated_at.isoformat()]
+            for e in chunk
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # データが0件の場合もヘッダーは出力する
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/export")
+async def export_examples(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプル全件エクスポート（ストリーミング）
+
+    サーバーサイドカーソルからチャンク単位で読み出しつつ書き出すため、
+    クエリ完了を待たずに先頭から送信を開始する。
+    """
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+    examples = usecase.export_examples(chunk_size)
+    if export_format == "csv":
+        return StreamingResponse(
+            _iter_csv(examples, chunk_size),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="examples.csv"'},
+        )
+    return StreamingResponse(
+        _iter_ndjson(examples, chunk_size), media_type="application/x-ndjson"
+    )
+
+
+def _parse_offset(cursor: str | None) -> int:
+    """検索のカーソルから次ページの開始位置を取り出す"""
+    if cursor is None:
+        return 0
+    try:
+        offset = decode_cursor(cursor)["offset"]
+    except (ValueError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(offset, int) or offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return offset
+
+
+# /{example_id}より前に定義する（"search"がIDとして解釈されないように）
+@router.get("/search", response_model=ExamplePage)
+async def search_examples(
+    q: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプル検索（名前の部分一致）
+
+    完全一致・前方一致・部分一致の順に並べて返す。順位付きのため、ページングは
+    カーソルに格納した開始位置（offset）で行う。
+    """
+    offset = _parse_offset(cursor)
+    examples, next_offset = await usecase.search_examples(q, limit, offset)
+    next_cursor = encode_cursor({"offset": next_offset}) if next_offset is not None else None
+    return TypeAdapterJSONResponse(
+        {"items": examples, "next_cursor": next_cursor}, EXAMPLE_PAGE_JSON
+    )
+
+
+def _parse_since(cursor: str | None) -> tuple[datetime, int] | None:
+    """変更フィードのカーソルから前回末尾の(updated_at, id)を取り出す"""
+    if cursor is None:
+        return None
+    try:
+        payload = decode_cursor(cursor)
+        updated_at = datetime.fromisoformat(payload["updated_at"])
+        after_id = payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(after_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if updated_at.tzinfo is not None:
+        # updated_atはタイムゾーンなしのUTCで保持しているため揃える
+        updated_at = updated_at.astimezone(UTC).replace(tzinfo=None)
+    return updated_at, after_id
+
+
+@router.get("/changes", response_model=ExampleChanges)
+async def list_example_changes(
+    since: str | None = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプルの変更フィード（updated_at, idの昇順）
+
+    sinceには前回のnext_cursorを渡す（省略時は先頭から）。has_moreがfalseになるまで
+    続けて取得すれば、以降はsince以降に作成・更新された行のみを取得できる。
+    """
+    after = _parse_since(since)
+    examples, has_more = await usecase.list_changes(
+        limit, after, settings.CHANGES_SAFETY_LAG_SECONDS
+    )
+    if examples:
+        last = examples[-1]
+        next_cursor = encode_cursor({"updated_at": last.updated_at.isoformat(), "id": last.id})
+    else:
+        next_cursor = since
+    return TypeAdapterJSONResponse(
+        {"items": examples, "next_cursor": next_cursor, "has_more": has_more},
+        EXAMPLE_CHANGES_JSON,
+    )
 
 
 @router.get("/{example_id}", response_model=ExampleResponse)
-def get_example(example_id: int, db: Session = Depends(get_db)):
-    """サンプル取得"""
-    repository = ExampleRepository(db)
-    usecase = ExampleUseCase(repository)
-    example = usecase.get_example(example_id)
+async def get_example(
+    example_id: int,
+    if_none_match: str | None = Header(None),
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプル取得
+
+    If-None-Matchが指定された場合は更新日時のみを取得して比較し、
+    一致すればエンティティの取得・シリアライズを行わず304を返す。
+    """
+    if if_none_match:
+        version = await usecase.get_example_version(example_id)
+        if version is not None:
+            etag = make_etag(example_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+
+    example = await usecase.get_example(example_id)
+    if example is None:
+        raise HTTPException(status_code=404, detail="Example not found")
+    return TypeAdapterJSONResponse(
+        example, EXAMPLE_JSON, headers={"ETag": make_etag(example.id, example.updated_at)}
+    )
+
+
+@router.patch("/{example_id}", response_model=ExampleResponse)
+async def update_example(
+    example_id: int,
+    data: ExampleUpdate,
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプルの名前を変更（事前に読み込まず、UPDATE ... RETURNINGの1往復で更新）"""
+    try:
+        example = await usecase.rename_example(example_id, data.name)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     if example is None:
         raise HTTPException(status_code=404, detail="Example not found")
-    return example
+    return TypeAdapterJSONResponse(
+        example, EXAMPLE_JSON, headers={"ETag": make_etag(example.id, example.updated_at)}
+    )
+
+
+def _parse_after_id(cursor: str | None) -> int | None:
+    """カーソルから直前ページ末尾のIDを取り出す"""
+    if cursor is None:
+        return None
+    try:
+        after_id = decode_cursor(cursor)["id"]
+    except (ValueError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(after_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after_id
+
+
+@router.get("/", response_model=ExamplePage)
+async def list_examples(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(None),
+    usecase: AsyncExampleUseCase = Depends(get_example_usecase),
+):
+    """サンプル一覧（IDによるキーセットページング）
 
+    ページ範囲の件数・最大ID・最大更新日時からETagを生成する。
+    If-None-Matchが指定された場合のみ集計で比較し、一致すればページを取得せず304を返す。
+    指定がない場合は取得したページから同じETagを作るため、SQLは1回で済む。
+    """
+    after_id = _parse_after_id(cursor)
+    if if_none_match:
+        version = await usecase.get_page_version(limit, after_id)
+        etag = make_etag(limit, after_id, *version)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-@router.get("/", response_model=list[ExampleResponse])
-def list_examples(db: Session = Depends(get_db)):
-    """サンプル一覧"""
-    repository = ExampleRepository(db)
-    usecase = ExampleUseCase(repository)
-    examples = usecase.list_examples()
-    return examples
+    examples, next_id, version = await usecase.list_examples_page(limit, after_id)
+    etag = make_etag(limit, after_id, *version)
+    next_cursor = encode_cursor({"id": next_id}) if next_id is not None else None
+    return TypeAdapterJSONResponse(
+        {"items": examples, "next_cursor": next_cursor},
+        EXAMPLE_PAGE_JSON,
+        headers={"ETag": etag},
+    )
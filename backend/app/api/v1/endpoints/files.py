@@ -0,0 +1,110 @@
+import math
+import posixpath
+import time
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import get_s3_client, presign_cache
+from app.core.cache import MISSING
+from app.core.config import settings
+from app.infrastructure.storage.s3_client import MB, S3Client
+from app.schemas.file import (
+    FileUploadRequest,
+    MultipartAbortRequest,
+    MultipartCompleteRequest,
+    MultipartUploadRequest,
+    MultipartUploadResponse,
+    PresignedPart,
+    PresignedUrlResponse,
+)
+
+router = APIRouter()
+
+# S3のマルチパートアップロードの制約
+MIN_PART_SIZE = 5 * MB
+MAX_PARTS = 10000
+
+
+def _new_key(filename: str) -> str:
+    """アップロード先のキーを発行（既存オブジェクトを上書きしないよう一意にする）"""
+    name = posixpath.basename(filename.replace("\\", "/")) or "file"
+    return f"{settings.S3_PRESIGN_KEY_PREFIX}{uuid.uuid4().hex}/{name}"
+
+
+def _check_key(key: str) -> None:
+    """アップロード用プレフィックス配下以外のキーは扱わない"""
+    if not key.startswith(settings.S3_PRESIGN_KEY_PREFIX) or ".." in key.split("/"):
+        raise HTTPException(status_code=400, detail="Invalid key")
+
+
+@router.post("/upload-url", response_model=PresignedUrlResponse)
+def create_upload_url(data: FileUploadRequest, s3: S3Client = Depends(get_s3_client)):
+    """アップロード用の署名付きPUT URLを発行"""
+    key = _new_key(data.filename)
+    expires_in = settings.S3_PRESIGN_EXPIRES_SECONDS
+    url = s3.presign_put(key, data.content_type, data.size, expires_in)
+    return PresignedUrlResponse(
+        key=key,
+        url=url,
+        method="PUT",
+        expires_in=expires_in,
+        headers={"Content-Type": data.content_type, "Content-Length": str(data.size)},
+    )
+
+
+@router.get("/download-url", response_model=PresignedUrlResponse)
+def create_download_url(key: str = Query(min_length=1), s3: S3Client = Depends(get_s3_client)):
+    """ダウンロード用の署名付きGET URLを発行
+
+    同じキーのURLは有効期限の半分までキャッシュから返す（残りの有効期間を返却する）。
+    """
+    _check_key(key)
+    cached = presign_cache.get(key)
+    if cached is MISSING:
+        expires_at = time.time() + settings.S3_PRESIGN_EXPIRES_SECONDS
+        cached = (s3.presign_get(key, settings.S3_PRESIGN_EXPIRES_SECONDS), expires_at)
+        presign_cache.set(key, cached)
+    url, expires_at = cached
+    return PresignedUrlResponse(
+        key=key, url=url, method="GET", expires_in=int(expires_at - time.time())
+    )
+
+
+@router.post("/multipart", response_model=MultipartUploadResponse)
+def create_multipart_upload(
+    data: MultipartUploadRequest, s3: S3Client = Depends(get_s3_client)
+):
+    """マルチパートアップロードを開始し、全パートの署名付きURLを発行"""
+    part_size = max(settings.S3_MULTIPART_CHUNKSIZE_MB * MB, MIN_PART_SIZE)
+    part_size = max(part_size, math.ceil(data.size / MAX_PARTS))
+    part_count = math.ceil(data.size / part_size)
+
+    key = _new_key(data.filename)
+    expires_in = settings.S3_PRESIGN_EXPIRES_SECONDS
+    upload_id = s3.create_multipart_upload(key, data.content_type)
+    parts = []
+    for number in range(1, part_count + 1):
+        size = min(part_size, data.size - (number - 1) * part_size)
+        url = s3.presign_upload_part(key, upload_id, number, size, expires_in)
+        parts.append(PresignedPart(part_number=number, url=url, size=size))
+    return MultipartUploadResponse(
+        key=key, upload_id=upload_id, part_size=part_size, expires_in=expires_in, parts=parts
+    )
+
+
+@router.post("/multipart/complete", status_code=status.HTTP_204_NO_CONTENT)
+def complete_multipart_upload(
+    data: MultipartCompleteRequest, s3: S3Client = Depends(get_s3_client)
+):
+    """マルチパートアップロードを完了"""
+    _check_key(data.key)
+    parts = sorted((part.part_number, part.etag) for part in data.parts)
+    s3.complete_multipart_upload(data.key, data.upload_id, parts)
+
+
+@router.post("/multipart/abort", status_code=status.HTTP_204_NO_CONTENT)
+def abort_multipart_upload(data: MultipartAbortRequest, s3: S3Client = Depends(get_s3_client)):
+    """マルチパートアップロードを中止（アップロード済みのパートを破棄）"""
+    _check_key(data.key)
+    s3.abort_multipart_upload(data.key, data.upload_id)
@@ -1,24 +1,38 @@
-import logging
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
-from fastapi import APIRouter
-
-# from sqlalchemy import text
-# from sqlalchemy.orm import Session
-
-# from app.core.database import get_db
+from app.api.deps import health_monitor
 
 router = APIRouter()
-logger = logging.getLogger(__name__)
 
 
 @router.get("/health")
-# async def health_check(db: Session = Depends(get_db)):
 async def health_check():
-    """ヘルスチェックエンドポイント"""
-    # データベース接続確認
-    # db.execute(text("SELECT 1"))
-    logger.debug("Performing health check database query")
-    logger.info("Health check endpoint called")
-    logger.error("This is a test error log for health check")
-    # raise Exception("Test exception for health check logging")
-    return {"status": "healthy-2", "database": "connected"}
+    """ヘルスチェックエンドポイント（/health/liveと同じ、互換用）"""
+    return {"status": "healthy"}
+
+
+@router.get("/health/live")
+async def liveness():
+    """ライブネスチェック（I/O・ログ出力なし）"""
+    return {"status": "healthy"}
+
+
+@router.get("/health/ready")
+async def readiness():
+    """レディネスチェック（バックグラウンドで確認済みの結果を返す）"""
+    checks = {
+        name: {
+            "ok": result.ok,
+            "latency_ms": round(result.latency_ms, 1),
+            "checked_at": result.checked_at,
+            "error": result.error,
+        }
+        for name, result in health_monitor.results.items()
+    }
+    if health_monitor.is_ready():
+        return {"status": "ready", "checks": checks}
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "unavailable", "checks": checks},
+    )
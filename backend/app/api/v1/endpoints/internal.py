@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+
+from app.api.deps import example_cache, presign_cache
+from app.core.database import pool_metrics
+
+router = APIRouter()
+
+
+@router.get("/db-pool")
+async def db_pool_stats():
+    """DBコネクションプールの統計（プールサイズ調整用）"""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+
+@router.get("/cache")
+async def cache_stats():
+    """インメモリキャッシュのヒット・ミス統計"""
+    return {"examples": example_cache.stats(), "presign": presign_cache.stats()}
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import examples, health
+from app.api.v1.endpoints import examples, files, health, internal
 
 api_router = APIRouter()
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(examples.router, prefix="/examples", tags=["examples"])
+api_router.include_router(files.router, prefix="/files", tags=["files"])
+api_router.include_router(internal.router, prefix="/internal", tags=["internal"])
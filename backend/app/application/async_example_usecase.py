@@ -0,0 +1,132 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from app.domain.example import Example, ExampleSaveResult
+from app.domain.unit_of_work import IAsyncUnitOfWork
+from app.schemas.example import ExampleCreate
+
+
+class AsyncExampleUseCase:
+    """サンプルユースケース（非同期版）
+
+    書き込みを伴う処理はUnit of Workにまとめ、ユースケースごとに1回だけcommitする。
+    """
+
+    def __init__(self, uow: IAsyncUnitOfWork, notify_email: str | None = None):
+        self.uow = uow
+        self.repository = uow.examples
+        self.notify_email = notify_email
+
+    async def create_example(self, data: ExampleCreate) -> Example:
+        """サンプル作成"""
+        # IDと作成日時・更新日時は保存時にDBで設定される
+        example = Example(id=0, name=data.name, description=data.description)
+        async with self.uow:
+            if self.notify_email:
+                # 通知メールもエンティティと同じトランザクションで書き込む
+                await self.uow.outbox.add(
+                    self.notify_email,
+                    "Example created",
+                    f"Example '{data.name}' was created.",
+                    "noreply@example.com",
+                )
+            saved = await self.repository.save(example)
+            await self.uow.commit()
+        return saved
+
+    async def create_examples(
+        self, data: list[ExampleCreate], batch_size: int
+    ) -> list[ExampleSaveResult]:
+        """サンプル一括作成（失敗した要素はexampleがNoneでerrorに理由が入る）"""
+        examples = [
+            Example(id=0, name=item.name, description=item.description) for item in data
+        ]
+        async with self.uow:
+            saved = await self.repository.save_many(examples, batch_size)
+            await self.uow.commit()
+        return saved
+
+    async def rename_example(self, example_id: int, name: str) -> Example | None:
+        """サンプルの名前を変更（存在しない場合はNone、名前が不正な場合はValueError）"""
+        Example.validate_name(name)
+        async with self.uow:
+            updated = await self.repository.update_name(example_id, name)
+            await self.uow.commit()
+        return updated
+
+    async def get_example(self, example_id: int) -> Example | None:
+        """サンプル取得"""
+        return await self.repository.find_by_id(example_id)
+
+    async def list_examples(self) -> list[Example]:
+        """サンプル一覧"""
+        return await self.repository.find_all()
+
+    async def list_examples_page(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[list[Example], int | None, tuple[int, int | None, datetime | None]]:
+        """サンプル一覧（キーセットページング）
+
+        次ページが存在する場合は次回のafter_idと、読み込んだ範囲のバージョン情報
+        （get_page_versionと同じ値）を合わせて返す。
+        """
+        # 1件多く取得して次ページの有無を判定
+        examples = await self.repository.find_page(limit + 1, after_id)
+        version = _page_version(examples)
+        if len(examples) > limit:
+            examples = examples[:limit]
+            return examples, examples[-1].id, version
+        return examples, None, version
+
+    async def search_examples(
+        self, query: str, limit: int, offset: int = 0
+    ) -> tuple[list[Example], int | None]:
+        """サンプル検索（名前の部分一致、関連度順）
+
+        次ページが存在する場合は次回のoffsetを合わせて返す。
+        """
+        # 1件多く取得して次ページの有無を判定
+        examples = await self.repository.search_by_name(query, limit + 1, offset)
+        if len(examples) > limit:
+            return examples[:limit], offset + limit
+        return examples, None
+
+    async def list_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float = 0.0,
+    ) -> tuple[list[Example], bool]:
+        """(updated_at, id)の順でafterより後の変更を取得し、続きがあるかを合わせて返す
+
+        updated_atはcommitより前の時刻になるため、実行中のトランザクションの変更が
+        後から過去の時刻で見えるようになることがある。取りこぼさないよう、
+        直近safety_lag_seconds秒以内の変更は次回以降の取得に回す。
+        """
+        # 1件多く取得して続きの有無を判定
+        examples = await self.repository.find_changes(limit + 1, after, safety_lag_seconds)
+        if len(examples) > limit:
+            return examples[:limit], True
+        return examples, False
+
+    async def get_example_version(self, example_id: int) -> datetime | None:
+        """サンプルの更新日時（ETag生成用）"""
+        return await self.repository.find_version(example_id)
+
+    async def get_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """list_examples_pageと同じ範囲のバージョン情報（ETag生成用）"""
+        # list_examples_pageは次ページ判定のため1件多く読むので、同じ範囲を集計する
+        return await self.repository.find_page_version(limit + 1, after_id)
+
+    def export_examples(self, chunk_size: int) -> AsyncIterator[Example]:
+        """サンプル全件エクスポート（逐次読み出し）"""
+        return self.repository.stream_all(chunk_size)
+
+
+def _page_version(examples: list[Example]) -> tuple[int, int | None, datetime | None]:
+    """読み込んだページの件数・最大ID・最大更新日時（find_page_versionの集計と同じ値）"""
+    if not examples:
+        return 0, None, None
+    return len(examples), max(e.id for e in examples), max(e.updated_at for e in examples)
@@ -20,15 +20,104 @@ class Settings(BaseSettings):
     # Database - Full URL (for local development)
     _DATABASE_URL: Optional[str] = None
 
+    # Database - Read replicas (カンマ区切りで複数指定可)
+    DATABASE_READ_HOST: Optional[str] = None
+    # 書き込みを行ったリクエストは以降の読み取りもプライマリで行う
+    DATABASE_READ_YOUR_WRITES: bool = True
+
+    # Database - Connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # バッチなど短命プロセスではプールせず都度接続する
+    DB_USE_NULL_POOL: bool = False
+    # 起動時に確立しておく接続数（0で無効、DB_POOL_SIZEが上限）
+    DB_POOL_WARMUP_CONNECTIONS: int = 2
+    DB_POOL_WARMUP_TIMEOUT_SECONDS: float = 5.0
+
     # SMTP (MailHog)
     SMTP_HOST: str = "mailhog"
     SMTP_PORT: int = 1025
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = False
+    SMTP_START_TLS: Optional[bool] = None  # Noneはサーバーが対応していれば使用
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    SMTP_POOL_SIZE: int = 4
+
+    # Email outbox
+    EMAIL_OUTBOX_BATCH_SIZE: int = 100
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 30.0
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: float = 3600.0
+    # 確保したメールを他のワーカーから隠す時間（送信中に停止した場合の再送までの時間）
+    EMAIL_OUTBOX_LEASE_SECONDS: float = 300.0
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 5.0
+    # 設定するとサンプル作成時に通知メールをアウトボックスに追加する
+    EXAMPLE_CREATED_NOTIFY_EMAIL: Optional[str] = None
 
     # S3 (MinIO)
     S3_ENDPOINT: str = "http://minio:9000"
     S3_ACCESS_KEY: str = "minioadmin"
     S3_SECRET_KEY: str = "minioadmin"
     S3_BUCKET: str = "app-bucket"
+    # マルチパート転送（しきい値以上のサイズはチャンクに分割して並列転送）
+    S3_MULTIPART_THRESHOLD_MB: int = 8
+    S3_MULTIPART_CHUNKSIZE_MB: int = 8
+    S3_MAX_CONCURRENCY: int = 10
+    # upload_files / download_filesで並行に転送するキー数
+    S3_BULK_MAX_WORKERS: int = 8
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    # 署名付きURL用（未設定の場合はS3_ENDPOINT）
+    S3_PUBLIC_ENDPOINT: Optional[str] = None
+    S3_PRESIGN_EXPIRES_SECONDS: int = 900
+    S3_PRESIGN_KEY_PREFIX: str = "uploads/"
+    S3_PRESIGN_PUT_MAX_BYTES: int = 100 * 1024 * 1024
+    S3_PRESIGN_MULTIPART_MAX_BYTES: int = 50 * 1024 * 1024 * 1024
+    S3_PRESIGN_CACHE_MAX_SIZE: int = 10000
+
+    # Example cache (in-process, find_by_id)
+    EXAMPLE_CACHE_ENABLED: bool = False
+    EXAMPLE_CACHE_MAX_SIZE: int = 10000
+    EXAMPLE_CACHE_TTL_SECONDS: float = 30.0
+    EXAMPLE_CACHE_NEGATIVE_TTL_SECONDS: float = 5.0
+
+    # Pagination
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+    # 変更フィード（GET /examples/changes）で返さない直近の変更の秒数
+    # （updated_atより後にcommitされるトランザクションの変更を取りこぼさないため）
+    CHANGES_SAFETY_LAG_SECONDS: float = 5.0
+
+    # Bulk create
+    BULK_INSERT_BATCH_SIZE: int = 500
+    BULK_CREATE_MAX_ITEMS: int = 10000
+
+    # Export
+    EXPORT_CHUNK_SIZE: int = 1000
+    # バッチ（batch/）で1回にcommitする行数
+    BATCH_CHUNK_SIZE: int = 1000
+    # バッチのプロファイリング（batch/profiling.py）
+    BATCH_PROFILE_CPU: bool = False
+    BATCH_PROFILE_MEMORY: bool = False
+    BATCH_PROFILE_SQL: bool = False
+    BATCH_PROFILE_TOP_N: int = 20
+    # 設定するとサマリーと.profをS3にアップロードする（例: profiles/batch/）
+    BATCH_PROFILE_S3_PREFIX: Optional[str] = None
+
+    # Health check
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 3.0
+    HEALTH_CHECK_S3: bool = False
+    HEALTH_CHECK_SMTP: bool = False
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_LIBRARY_LEVEL: str = "WARNING"
+    # "orjson"を指定するとorjson（インストール時のみ）でJSON化する
+    LOG_JSON_ENCODER: str = "json"
 
     # Environment
     ENV: str = "development"
@@ -57,5 +146,12 @@ class Settings(BaseSettings):
         # Default fallback for tests
         return "postgresql://localhost/test"
 
+    @property
+    def DATABASE_READ_HOSTS(self) -> list[str]:
+        """リードレプリカのホスト一覧"""
+        if not self.DATABASE_READ_HOST:
+            return []
+        return [host.strip() for host in self.DATABASE_READ_HOST.split(",") if host.strip()]
+
 
 settings = Settings()
@@ -1,16 +1,150 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import asyncio
+import logging
+import random
+from typing import Any
+
+from sqlalchemy import Select, create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+from sqlalchemy.sql.dml import UpdateBase
 
 from app.core.config import settings
+from app.core.pool_metrics import PoolMetrics
+
+logger = logging.getLogger(__name__)
+
+# エンジン名ごとのプール統計
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def to_async_url(url: str) -> str:
+    """同期ドライバのURLをasyncpgドライバのURLに変換"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def to_replica_url(url: str, host: str) -> str:
+    """プライマリのURLのホスト部分をリードレプリカに差し替える"""
+    return make_url(url).set(host=host).render_as_string(hide_password=False)
+
+
+def _pool_options(name: str, base: type[Pool]) -> dict[str, Any]:
+    """設定に応じたプール関連のエンジン引数を組み立てる"""
+    if settings.DB_USE_NULL_POOL:
+        return {"poolclass": NullPool}
+    metrics = pool_metrics[name] = PoolMetrics(name)
+    return {
+        "poolclass": metrics.pool_class(base),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _attach_metrics(name: str, engine: Engine) -> None:
+    """プール統計の収集を開始（NullPool時は何もしない）"""
+    if name in pool_metrics:
+        pool_metrics[name].attach(engine)
+
+
+class RoutingSession(Session):
+    """読み取りをリードレプリカへ、書き込みをプライマリへ振り分けるセッション
+
+    レプリカはセッション（リクエスト）単位で1台を選択する。
+    DATABASE_READ_YOUR_WRITESが有効な場合、一度書き込みを行ったセッションは
+    以降の読み取りもプライマリで行い、レプリカ遅延による不整合を防ぐ。
+    """
+
+    def __init__(self, *, primary: Engine, replicas: list[Engine], **kw: Any):
+        super().__init__(**kw)
+        self.primary = primary
+        self.replica = random.choice(replicas) if replicas else None
+        self.pinned_to_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kw: Any) -> Engine:
+        # SELECT ... FOR UPDATEは行ロックを取るため書き込みと同様にプライマリで実行する
+        is_locking_read = isinstance(clause, Select) and clause._for_update_arg is not None
+        is_write = self._flushing or isinstance(clause, UpdateBase) or is_locking_read
+        if is_write and settings.DATABASE_READ_YOUR_WRITES:
+            self.pinned_to_primary = True
+        if is_write or self.pinned_to_primary or self.replica is None:
+            return self.primary
+        return self.replica
+
 
 # データベースが設定されている場合のみengineを作成
 if settings.DATABASE_URL and settings.DATABASE_URL != "test":
-    engine = create_engine(settings.DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # 同期エンジン（バッチ・Alembic用）
+    engine = create_engine(settings.DATABASE_URL, **_pool_options("primary", QueuePool))
+    _attach_metrics("primary", engine)
+    # 非同期エンジン（API用）
+    async_engine = create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        **_pool_options("primary_async", AsyncAdaptedQueuePool),
+    )
+    _attach_metrics("primary_async", async_engine.sync_engine)
+
+    # リードレプリカ
+    replica_engines: list[Engine] = []
+    async_replica_engines: list[AsyncEngine] = []
+    for i, host in enumerate(settings.DATABASE_READ_HOSTS):
+        replica_url = to_replica_url(settings.DATABASE_URL, host)
+        replica_engine = create_engine(replica_url, **_pool_options(f"replica_{i}", QueuePool))
+        _attach_metrics(f"replica_{i}", replica_engine)
+        replica_engines.append(replica_engine)
+        async_replica_engine = create_async_engine(
+            to_async_url(replica_url),
+            **_pool_options(f"replica_{i}_async", AsyncAdaptedQueuePool),
+        )
+        _attach_metrics(f"replica_{i}_async", async_replica_engine.sync_engine)
+        async_replica_engines.append(async_replica_engine)
+
+    SessionLocal = sessionmaker(
+        class_=RoutingSession,
+        autocommit=False,
+        autoflush=False,
+        primary=engine,
+        replicas=replica_engines,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        sync_session_class=RoutingSession,
+        autoflush=False,
+        expire_on_commit=False,
+        primary=async_engine.sync_engine,
+        replicas=[e.sync_engine for e in async_replica_engines],
+    )
 else:
     # データベースが未設定の場合はNoneを設定
     engine = None  # type: ignore
     SessionLocal = None  # type: ignore
+    async_engine = None  # type: ignore
+    AsyncSessionLocal = None  # type: ignore
+    replica_engines = []
+    async_replica_engines = []
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int, timeout_seconds: float) -> None:
+    """接続を同時にconnections本確立してプールに戻し、初回リクエストの接続待ちを避ける
+
+    DBに接続できない場合も起動は継続する（レディネスチェックで検知する）。
+    """
+
+    async def connect() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(connect() for _ in range(connections))), timeout=timeout_seconds
+        )
+    except Exception as e:
+        logger.warning(f"Failed to warm up connection pool: {e.__class__.__name__}: {e}")
 
 
 class Base(DeclarativeBase):
@@ -25,3 +159,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Database is not configured")
+    async with AsyncSessionLocal() as db:
+        yield db
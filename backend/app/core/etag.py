@@ -0,0 +1,18 @@
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    """バージョン情報から強いETagを生成"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Matchヘッダーのいずれかの値がETagと一致するか（弱い比較）"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates
+    )
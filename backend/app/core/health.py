@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class ProbeResult:
+    """プローブの実行結果"""
+
+    ok: bool
+    checked_at: float
+    latency_ms: float
+    error: str | None = None
+
+
+def database_probe(engine: AsyncEngine) -> Probe:
+    """DBにSELECT 1を発行するプローブ"""
+
+    async def probe() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    return probe
+
+
+class HealthMonitor:
+    """依存サービスをバックグラウンドで定期的に確認し、結果をキャッシュする
+
+    レディネスチェックのリクエストはキャッシュした結果を返すだけなので、
+    ヘルスチェックの頻度に関わらずDB接続を消費しない。
+    """
+
+    def __init__(self, probes: dict[str, Probe], interval_seconds: float, timeout_seconds: float):
+        self.probes = probes
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.results: dict[str, ProbeResult] = {}
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> None:
+        """全プローブを並行して1回実行"""
+        names = list(self.probes)
+        results = await asyncio.gather(*(self._run_probe(name) for name in names))
+        for name, result in zip(names, results):
+            previous = self.results.get(name)
+            if not result.ok and (previous is None or previous.ok):
+                logger.warning(f"Health probe failed: {name}", extra={"error": result.error})
+            elif result.ok and previous is not None and not previous.ok:
+                logger.info(f"Health probe recovered: {name}")
+            self.results[name] = result
+
+    async def _run_probe(self, name: str) -> ProbeResult:
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self.probes[name](), timeout=self.timeout_seconds)
+        except Exception as e:
+            return ProbeResult(
+                ok=False,
+                checked_at=time.time(),
+                latency_ms=(time.monotonic() - start) * 1000,
+                error=f"{e.__class__.__name__}: {e}",
+            )
+        return ProbeResult(
+            ok=True, checked_at=time.time(), latency_ms=(time.monotonic() - start) * 1000
+        )
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """バックグラウンドでの定期実行を開始"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """定期実行を停止"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def is_ready(self) -> bool:
+        """全プローブが成功しており、結果が古くなっていないか"""
+        # 監視ループが止まった場合に古い成功結果を返し続けないようにする
+        stale_before = time.time() - self.interval_seconds * 3 - self.timeout_seconds
+        return len(self.results) == len(self.probes) and all(
+            result.ok and result.checked_at >= stale_before for result in self.results.values()
+        )
@@ -0,0 +1,105 @@
+import atexit
+import json
+import logging
+import queue
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from app.core.config import settings
+
+# LogRecordの標準属性（これ以外の属性はextra=で渡された項目として出力する）
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+# 大量のDEBUGログを出すライブラリ
+_NOISY_LOGGERS = ("sqlalchemy", "botocore", "boto3", "s3transfer", "urllib3", "asyncio")
+
+
+def _json_dumps(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def resolve_json_encoder(name: str) -> Callable[[dict[str, Any]], str]:
+    """JSONエンコーダーを選択（orjsonが未インストールの場合は標準jsonを使う）"""
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return _json_dumps
+        return lambda data: orjson.dumps(data, default=str).decode()
+    return _json_dumps
+
+
+# JSON形式のカスタムフォーマッター
+class JsonFormatter(logging.Formatter):
+    def __init__(
+        self,
+        static_fields: dict[str, Any] | None = None,
+        dumps: Callable[[dict[str, Any]], str] = _json_dumps,
+    ):
+        super().__init__()
+        # 環境名など全ログ共通の項目は事前に組み立てておく
+        self.static_fields = dict(static_fields or {})
+        self.dumps = dumps
+
+    def format(self, record):
+        log_data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            **self.static_fields,
+        }
+
+        # extra=で渡された項目を追加
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                log_data[key] = value
+
+        # 例外情報がある場合は追加
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+
+        return self.dumps(log_data)
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """整形をリスナースレッドに任せるQueueHandler
+
+    標準のprepareは呼び出し元スレッドでformatを実行し例外情報も文字列に畳み込むため、
+    メッセージ引数の展開のみ行い、JSON化はQueueListener側のハンドラーで行う。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging() -> QueueListener:
+    """ルートロガーにキュー経由の非同期JSONログ出力を設定"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        JsonFormatter(
+            static_fields={"service": settings.PROJECT_NAME, "env": settings.ENV},
+            dumps=resolve_json_encoder(settings.LOG_JSON_ENCODER),
+        )
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [DeferredFormatQueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(settings.LOG_LIBRARY_LEVEL)
+
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # プロセス終了時にキューに残ったログを出力しきる
+    atexit.register(listener.stop)
+    return listener
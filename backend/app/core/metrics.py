@@ -0,0 +1,189 @@
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.pool_metrics import PoolMetrics
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTPリクエストの処理時間",
+    ["method", "route"],
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "HTTPリクエスト内のDBクエリ実行時間の合計",
+    ["method", "route"],
+)
+REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTPリクエスト数",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "処理中のHTTPリクエスト数",
+    ["method"],
+)
+
+
+class RequestTiming:
+    """1リクエスト内のDB実行時間の集計"""
+
+    __slots__ = ("db_seconds", "db_queries")
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.db_queries = 0
+
+
+_current_timing: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.db_seconds += elapsed
+        timing.db_queries += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    # 失敗したクエリの開始時刻を破棄（after_cursor_executeは呼ばれない）
+    starts = context.connection.info.get("query_start_time") if context.connection else None
+    if starts:
+        starts.pop()
+
+
+def _route_label(scope: Scope) -> str:
+    """ルートのパステンプレート（未マッチの場合は固定値でラベル数の増加を防ぐ）
+
+    マッチしたルートのテンプレートを使う。リクエストパスのパラメータ部分から復元すると、
+    /examples/0001のように正規化前の値を含むパスがそのままラベルになってしまう。
+    """
+    route = scope.get("route")
+    if route is None:
+        return "<unmatched>"
+    # path_formatは{id:int}のような型変換の指定を除いたテンプレート
+    template = getattr(route, "path_format", None) or route.path
+    # FastAPIのバージョンによってはinclude_routerのprefixがルートのパスに含まれないため、
+    # リクエストパスのうちルートのパターンに一致しない先頭部分（prefix）を補う
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is not None:
+        path = scope["path"]
+        for i, char in enumerate(path):
+            if char == "/" and path_regex.match(path[i:]):
+                return path[:i] + template
+    return template
+
+
+class MetricsMiddleware:
+    """ルート別のレイテンシ・ステータス・処理中件数を記録するASGIミドルウェア
+
+    レスポンスヘッダーにはDB時間と合計時間をServer-Timingとして付与する。
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (
+                        b"server-timing",
+                        f"db;dur={timing.db_seconds * 1000:.1f}, "
+                        f"total;dur={total_ms:.1f}".encode(),
+                    )
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            _current_timing.reset(token)
+            route = _route_label(scope)
+            REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - start)
+            REQUEST_DB_DURATION.labels(method, route).observe(timing.db_seconds)
+            REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+
+
+class StatsCollector(Collector):
+    """コネクションプールとインメモリキャッシュの統計をPrometheus形式で公開"""
+
+    def __init__(
+        self,
+        pools: Mapping[str, PoolMetrics],
+        caches: Mapping[str, Callable[[], dict]],
+    ):
+        self.pools = pools
+        self.caches = caches
+
+    def collect(self) -> Iterator[GaugeMetricFamily | CounterMetricFamily]:
+        gauges = {
+            name: GaugeMetricFamily(
+                f"db_pool_{name}", f"コネクションプールの{name}", labels=["pool"]
+            )
+            for name in ("size", "checked_in", "checked_out", "overflow", "wait_seconds_max")
+        }
+        counters = {
+            name: CounterMetricFamily(
+                f"db_pool_{name}", f"コネクションプールの{name}累計", labels=["pool"]
+            )
+            for name in ("connects", "checkouts", "timeouts", "invalidations", "wait_seconds")
+        }
+        for pool_name, metrics in self.pools.items():
+            snapshot = metrics.snapshot()
+            for name, family in gauges.items():
+                family.add_metric([pool_name], snapshot[name])
+            for name, family in counters.items():
+                key = "wait_seconds_total" if name == "wait_seconds" else name
+                family.add_metric([pool_name], snapshot[key])
+        yield from gauges.values()
+        yield from counters.values()
+
+        cache_size = GaugeMetricFamily("cache_entries", "キャッシュのエントリ数", labels=["cache"])
+        cache_counters = {
+            name: CounterMetricFamily(
+                f"cache_{name}", f"キャッシュの{name}累計", labels=["cache"]
+            )
+            for name in ("hits", "misses", "evictions")
+        }
+        for cache_name, stats in self.caches.items():
+            snapshot = stats()
+            cache_size.add_metric([cache_name], snapshot["size"])
+            for name, family in cache_counters.items():
+                family.add_metric([cache_name], snapshot[name])
+        yield cache_size
+        yield from cache_counters.values()
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """コネクションプールの統計
+
+    チェックアウト待ち時間はプールクラスの_do_getを計測して取得し、
+    接続数やチェックアウト回数はプールイベントから集計する。
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Engine | None = None
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def pool_class(self, base: type[Pool]) -> type[Pool]:
+        """チェックアウト待ち時間を計測するプールクラスを生成"""
+        metrics = self
+
+        class InstrumentedPool(base):  # type: ignore[valid-type, misc]
+            def _do_get(self):
+                start = time.perf_counter()
+                try:
+                    return super()._do_get()
+                except exc.TimeoutError:
+                    metrics._increment("timeouts")
+                    raise
+                finally:
+                    metrics.record_wait(time.perf_counter() - start)
+
+        InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+        return InstrumentedPool
+
+    def attach(self, engine: Engine) -> None:
+        """エンジンのプールイベントを購読"""
+        self.engine = engine
+        event.listen(engine, "connect", lambda *_: self._increment("connects"))
+        event.listen(engine, "checkout", lambda *_: self._increment("checkouts"))
+        event.listen(engine, "checkin", lambda *_: self._increment("checkins"))
+        event.listen(engine, "invalidate", lambda *_: self._increment("invalidations"))
+
+    def record_wait(self, seconds: float) -> None:
+        """チェックアウト待ち時間を記録"""
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict:
+        """現在のプール状態と累積カウンタを返す"""
+        with self._lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+        if self.engine is not None:
+            pool = self.engine.pool
+            data.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return data
@@ -0,0 +1,41 @@
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+def dump_json(adapter: TypeAdapter, content: Any) -> bytes:
+    """contentをadapterの型として検証（属性から読み出し）し、JSONのバイト列にする
+
+    エンティティを渡した場合も、JSONに含まれるのはadapterのスキーマにあるフィールドのみ。
+    スキーマのインスタンスは再検証されない。
+    """
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+class TypeAdapterJSONResponse(Response):
+    """レスポンススキーマのTypeAdapterでcontentを直接JSONのバイト列にするレスポンス
+
+    エンドポイントからこのレスポンスを返すと、FastAPIによるresponse_modelへの再検証と
+    dict経由のJSON化（jsonable_encoder・json.dumps）を省略できる。
+    adapterはresponse_modelと同じスキーマから作り、response_modelはOpenAPIのスキーマ用に
+    引き続き指定する。
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        self.adapter = adapter
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(self.adapter, content)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class OutboxEmail:
+    """送信待ちメール（アウトボックス）エンティティ"""
+
+    id: int
+    to: str
+    subject: str
+    body: str
+    from_email: str
+    status: str  # pending / sent / failed
+    attempts: int
+    next_attempt_at: datetime
+    created_at: datetime
+    last_error: str | None = None
+    sent_at: datetime | None = None
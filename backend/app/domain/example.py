@@ -2,19 +2,39 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Example:
-    """サンプルエンティティ"""
+    """サンプルエンティティ
+
+    一覧取得では行数分生成されるため、__slots__でインスタンスを軽量にしている。
+    """
 
     id: int
     name: str
     description: str | None
-    created_at: datetime
-    updated_at: datetime
+    # 未保存のエンティティではNone（保存時にDBで設定される）
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    @staticmethod
+    def validate_name(name: str) -> None:
+        """名前を検証（空文字列・空白のみは不可）"""
+        if not name or len(name.strip()) == 0:
+            raise ValueError("Name cannot be empty")
 
     def update_name(self, new_name: str) -> None:
         """名前を更新"""
-        if not new_name or len(new_name.strip()) == 0:
-            raise ValueError("Name cannot be empty")
+        self.validate_name(new_name)
         self.name = new_name
         self.updated_at = datetime.now(UTC)
+
+
+@dataclass(slots=True)
+class ExampleSaveResult:
+    """一括保存の要素ごとの結果
+
+    保存に失敗した場合はexampleがNoneとなり、errorに失敗理由（DBの詳細を含まない）が入る。
+    """
+
+    example: Example | None
+    error: str | None = None
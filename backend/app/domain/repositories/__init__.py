@@ -1,3 +1,11 @@
+from app.domain.repositories.async_email_outbox_repository import IAsyncEmailOutboxRepository
+from app.domain.repositories.async_example_repository import IAsyncExampleRepository
+from app.domain.repositories.email_outbox_repository import IEmailOutboxRepository
 from app.domain.repositories.example_repository import IExampleRepository
 
-__all__ = ["IExampleRepository"]
+__all__ = [
+    "IAsyncEmailOutboxRepository",
+    "IAsyncExampleRepository",
+    "IEmailOutboxRepository",
+    "IExampleRepository",
+]
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class IAsyncEmailOutboxRepository(ABC):
+    """メールアウトボックスリポジトリのインターフェース（非同期版、書き込みのみ）"""
+
+    @abstractmethod
+    async def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加（commitは呼び出し元の業務処理と同じトランザクションで行う）"""
+        pass
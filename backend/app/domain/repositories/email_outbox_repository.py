@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.email import OutboxEmail
+
+
+class IEmailOutboxRepository(ABC):
+    """メールアウトボックスリポジトリのインターフェース"""
+
+    @abstractmethod
+    def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加（commitは呼び出し元の業務処理と同じトランザクションで行う）"""
+        pass
+
+    @abstractmethod
+    def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        """送信時刻に達したメールを最大limit件確保する
+
+        確保したメールは試行回数を加算し、lease_seconds後まで他のワーカーから見えなくする。
+        """
+        pass
+
+    @abstractmethod
+    def mark_sent(self, email_ids: list[int]) -> None:
+        """送信済みにする"""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, email_id: int, error: str, retry_at: datetime | None) -> None:
+        """送信失敗を記録（retry_atがNoneの場合は再送しない）"""
+        pass
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 
-from app.domain.example import Example
+from app.domain.example import Example, ExampleSaveResult
 
 
 class IExampleRepository(ABC):
-    """Exampleリポジトリのインターフェース"""
+    """Exampleリポジトリのインターフェース
+
+    書き込みはcommitせず、Unit of Work（IAsyncUnitOfWork.commit）で確定する。
+    """
 
     @abstractmethod
     def find_by_id(self, example_id: int) -> Example | None:
@@ -16,7 +21,64 @@ class IExampleRepository(ABC):
         """全エンティティを取得"""
         pass
 
+    @abstractmethod
+    def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        pass
+
+    @abstractmethod
+    def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得（存在しない場合はNone）"""
+        pass
+
+    @abstractmethod
+    def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得"""
+        pass
+
+    @abstractmethod
+    def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得
+
+        完全一致・前方一致・部分一致の順に並べ、同順位はIDの昇順とする。
+        """
+        pass
+
+    @abstractmethod
+    def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得
+
+        safety_lag_secondsを指定した場合は、DBの現在時刻からその秒数より前に
+        更新されたもののみを対象とする。
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int) -> Iterator[Example]:
+        """全エンティティをchunk_size件ずつ読み出しながら逐次返す"""
+        pass
+
     @abstractmethod
     def save(self, example: Example) -> Example:
         """エンティティを保存"""
         pass
+
+    @abstractmethod
+    def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新し、更新後のエンティティを返す（存在しない場合はNone）"""
+        pass
+
+    @abstractmethod
+    def save_many(self, examples: list[Example], batch_size: int) -> list[ExampleSaveResult]:
+        """複数エンティティを1トランザクションで保存
+
+        戻り値は入力と同じ順序で、保存に失敗した要素はexampleがNoneでerrorに理由が入る。
+        """
+        pass
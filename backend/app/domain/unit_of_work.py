@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from app.domain.repositories.async_email_outbox_repository import IAsyncEmailOutboxRepository
+from app.domain.repositories.async_example_repository import IAsyncExampleRepository
+
+
+class IAsyncUnitOfWork(ABC):
+    """Unit of Workのインターフェース（非同期版）
+
+    リポジトリは同じトランザクションに書き込み（commitはしない）、
+    ユースケースがcommitで1回だけ確定する。async with文をcommitせずに抜けた場合
+    （例外を含む）は、そのトランザクションの書き込みを取り消す。
+    """
+
+    examples: IAsyncExampleRepository
+    outbox: IAsyncEmailOutboxRepository
+
+    async def __aenter__(self) -> "IAsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # commit済みの場合は取り消す書き込みがないため何もしない
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """書き込みを確定"""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """未確定の書き込みを取り消す"""
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """次のcommitが成功した後に実行する処理を登録（rollbackした場合は破棄）"""
+        pass
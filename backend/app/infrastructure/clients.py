@@ -0,0 +1,50 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from app.infrastructure.email.smtp_client import SMTPClient
+from app.infrastructure.storage.s3_client import S3Client
+
+
+class ClientRegistry:
+    """外部サービスのクライアントを初回利用時に1つだけ生成して共有する
+
+    生成はロックで1回に限定する（S3クライアントの生成は数百ミリ秒かかる）。
+    boto3のクライアントはスレッドセーフ。SMTPClientの接続プールはイベントループ上で使う。
+    """
+
+    def __init__(
+        self,
+        s3_factory: Callable[[], S3Client] = S3Client,
+        smtp_factory: Callable[[], SMTPClient] = SMTPClient,
+    ):
+        self._factories: dict[str, Callable[[], Any]] = {"s3": s3_factory, "smtp": smtp_factory}
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> Any:
+        client = self._clients.get(name)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._factories[name]()
+                    self._clients[name] = client
+        return client
+
+    def s3(self) -> S3Client:
+        """共有S3クライアント"""
+        return self._get("s3")
+
+    def smtp(self) -> SMTPClient:
+        """共有SMTPクライアント"""
+        return self._get("smtp")
+
+    async def close(self) -> None:
+        """生成済みのクライアントの接続を閉じる"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        if "smtp" in clients:
+            await clients["smtp"].close()
+        if "s3" in clients:
+            clients["s3"].close()
@@ -1,20 +1,115 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.core.database import Base
 
 
 def utc_now():
-    """UTC現在時刻を返す"""
-    return datetime.now(UTC)
+    """UTC現在時刻を返す
+
+    列はタイムゾーンなしのDateTimeのため、tzinfoを外したUTC時刻とする
+    （asyncpgはタイムゾーン付きのdatetimeをtimestamp列にバインドできない）。
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class UtcClock(FunctionElement):
+    """DBの時計によるUTC現在時刻（タイムゾーンなし）
+
+    PostgreSQLではupdated_atのトリガー（set_updated_at）と同じclock_timestamp()を使う。
+    secondsを指定した場合はその秒数だけ前の時刻となる。
+    """
+
+    type = DateTime()
+    name = "utc_clock"
+    inherit_cache = True
+
+    def __init__(self, seconds: float | None = None):
+        super().__init__(*([] if seconds is None else [literal(float(seconds))]))
+
+
+@compiles(UtcClock)
+def _compile_utc_clock(element, compiler, **kw):
+    if len(element.clauses):
+        raise NotImplementedError("UtcClock(seconds) is not supported on this dialect")
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcClock, "postgresql")
+def _compile_utc_clock_postgresql(element, compiler, **kw):
+    now = "(clock_timestamp() AT TIME ZONE 'UTC')"
+    if len(element.clauses):
+        return f"({now} - make_interval(secs => {compiler.process(element.clauses, **kw)}))"
+    return now
+
+
+@compiles(UtcClock, "sqlite")
+def _compile_utc_clock_sqlite(element, compiler, **kw):
+    # SQLAlchemyの保存形式（マイクロ秒6桁）に揃え、文字列の比較でも順序が一致するようにする
+    modifiers = "'now'"
+    if len(element.clauses):
+        modifiers += f", '-' || {compiler.process(element.clauses, **kw)} || ' seconds'"
+    return f"strftime('%Y-%m-%d %H:%M:%f000', {modifiers})"
 
 
 class ExampleModel(Base):
     __tablename__ = "examples"
+    __table_args__ = (
+        # 名前の部分一致検索（ILIKE '%q%'）用のトライグラムインデックス（要pg_trgm拡張）
+        Index(
+            "ix_examples_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # 変更フィード（(updated_at, id) > カーソル ORDER BY updated_at, id）用
+        Index("ix_examples_updated_at_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
+    # 変更フィードの取得範囲（find_changes）と同じDBの時計で作成・更新日時を設定する
+    created_at = Column(DateTime, default=UtcClock(), nullable=False)
+    # ORM・Coreからの更新はonupdateで、それ以外（SQLの直接実行など）は
+    # PostgreSQLのトリガー（examples_set_updated_at）で更新日時を設定する
+    updated_at = Column(DateTime, default=UtcClock(), onupdate=UtcClock(), nullable=False)
+
+
+class EmailOutboxModel(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # 送信待ちの取得（status = 'pending' AND next_attempt_at <= now）用
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    to = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    from_email = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=utc_now, nullable=False)
+    last_error = Column(Text, nullable=True)
     created_at = Column(DateTime, default=utc_now, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+
+class BatchStateModel(Base):
+    __tablename__ = "batch_state"
+
+    job_name = Column(String(255), primary_key=True)
+    status = Column(String(20), nullable=False)  # running / completed
+    # 同じrun_idでの再実行（リトライ）は完了済みならスキップ、途中なら再開する
+    run_id = Column(String(255), nullable=True)
+    # 担当するキー範囲（range_start以上range_end未満、Noneは無制限）
+    range_start = Column(Integer, nullable=True)
+    range_end = Column(Integer, nullable=True)
+    last_key = Column(Integer, nullable=True)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    rows_affected = Column(Integer, nullable=False, default=0)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
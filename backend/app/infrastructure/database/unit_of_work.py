@@ -0,0 +1,49 @@
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.example_repository import IExampleRepository
+from app.domain.unit_of_work import IAsyncUnitOfWork
+from app.infrastructure.repositories.async_email_outbox_repository import AsyncEmailOutboxRepository
+from app.infrastructure.repositories.async_example_repository import AsyncExampleRepository
+from app.infrastructure.repositories.example_repository import ExampleRepository
+
+
+class AsyncSqlAlchemyUnitOfWork(IAsyncUnitOfWork):
+    """AsyncSessionのトランザクションによるUnit of Work
+
+    リポジトリは同じSessionに書き込み（flushのみ）、commitで1回だけ確定する。
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository_factory: Callable[[Session], IExampleRepository] = ExampleRepository,
+    ):
+        self.db = db
+        self.examples = AsyncExampleRepository(db, repository_factory)
+        self.outbox = AsyncEmailOutboxRepository(db)
+        self.after_commit_callbacks: list[Callable[[], None]] = []
+
+    async def commit(self) -> None:
+        """書き込みを確定し、登録された処理を実行"""
+        await self.db.commit()
+        _run_callbacks(self.after_commit_callbacks)
+
+    async def rollback(self) -> None:
+        """未確定の書き込みを取り消す（登録された処理は実行しない）"""
+        await self.db.rollback()
+        self.after_commit_callbacks.clear()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """次のcommitが成功した後に実行する処理を登録"""
+        self.after_commit_callbacks.append(callback)
+
+
+def _run_callbacks(callbacks: list[Callable[[], None]]) -> None:
+    """登録順に実行し、一覧を空にする（次のトランザクションでは再実行しない）"""
+    pending = callbacks[:]
+    callbacks.clear()
+    for callback in pending:
+        callback()
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from datetime import timedelta
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.domain.email import OutboxEmail
+from app.domain.repositories.email_outbox_repository import IEmailOutboxRepository
+from app.infrastructure.database.models import utc_now
+from app.infrastructure.email.smtp_client import SMTPClient
+
+logger = logging.getLogger(__name__)
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """再送しても成功しない送信エラーか（宛先拒否・5xx応答）"""
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, aiosmtplib.SMTPResponseException) and 500 <= error.code < 600
+
+
+class EmailOutboxDispatcher:
+    """アウトボックスの送信待ちメールをSMTPで送信するワーカー
+
+    メールはbatch_size件ずつ確保し、SMTPClient.send_manyで並行送信する。
+    一時的な失敗は指数バックオフで再送し、max_attempts回で打ち切る。
+    DB操作は同期Sessionのため、イベントループを塞がないよう別スレッドで実行する。
+    """
+
+    def __init__(
+        self,
+        outbox: IEmailOutboxRepository,
+        smtp_client: SMTPClient,
+        batch_size: int,
+        max_attempts: int,
+        backoff_seconds: float,
+        backoff_max_seconds: float,
+        lease_seconds: float,
+    ):
+        self.outbox = outbox
+        self.smtp_client = smtp_client
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+
+    def backoff(self, attempts: int) -> float:
+        """attempts回目の失敗後、次の送信までの待ち時間（秒）"""
+        return min(self.backoff_seconds * 2 ** (attempts - 1), self.backoff_max_seconds)
+
+    @staticmethod
+    def _to_message(email: OutboxEmail) -> EmailMessage:
+        return SMTPClient.build_message(email.to, email.subject, email.body, email.from_email)
+
+    async def dispatch_once(self) -> tuple[int, int]:
+        """送信待ちメールを1バッチ送信し、(送信件数, 失敗件数)を返す"""
+        emails = await asyncio.to_thread(self.outbox.claim_due, self.batch_size, self.lease_seconds)
+        if not emails:
+            return 0, 0
+
+        results = await self.smtp_client.send_many([self._to_message(e) for e in emails])
+
+        sent_ids = [email.id for email, error in zip(emails, results) if error is None]
+        await asyncio.to_thread(self.outbox.mark_sent, sent_ids)
+        for email, error in zip(emails, results):
+            if error is None:
+                continue
+            retry_at = None
+            if email.attempts < self.max_attempts and not is_permanent_failure(error):
+                retry_at = utc_now() + timedelta(seconds=self.backoff(email.attempts))
+            logger.warning(
+                f"Failed to send outbox email {email.id}",
+                extra={
+                    "attempts": email.attempts,
+                    "retry": retry_at is not None,
+                    "error": str(error),
+                },
+            )
+            await asyncio.to_thread(
+                self.outbox.mark_failed, email.id, f"{error.__class__.__name__}: {error}", retry_at
+            )
+        return len(sent_ids), len(emails) - len(sent_ids)
+
+    async def run(self, poll_interval_seconds: float, stop_when_idle: bool = False) -> None:
+        """送信待ちがなくなるまで送信し、なければpoll_interval_seconds待って繰り返す"""
+        while True:
+            sent, failed = await self.dispatch_once()
+            if sent or failed:
+                logger.info(f"Dispatched outbox emails: sent={sent} failed={failed}")
+                continue
+            if stop_when_idle:
+                return
+            await asyncio.sleep(poll_interval_seconds)
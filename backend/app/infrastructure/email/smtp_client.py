@@ -1,28 +1,75 @@
-import aiosmtplib
 from email.message import EmailMessage
 
+import aiosmtplib
+
 from app.core.config import settings
+from app.infrastructure.email.smtp_pool import SMTPConnectionPool
 
 
 class SMTPClient:
-    """SMTP送信クライアント（MailHog用）"""
+    """SMTP送信クライアント（MailHog用）
 
-    async def send_email(
-        self,
+    送信には接続プールを使い、メールごとの接続・EHLO・QUITを省略する。
+    """
+
+    def __init__(self, pool_size: int | None = None):
+        self.pool = SMTPConnectionPool(
+            size=pool_size or settings.SMTP_POOL_SIZE,
+            connection_factory=self._create_connection,
+        )
+
+    @staticmethod
+    def _create_connection() -> aiosmtplib.SMTP:
+        return aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            start_tls=settings.SMTP_START_TLS,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+        )
+
+    @staticmethod
+    def build_message(
         to: str,
         subject: str,
         body: str,
         from_email: str = "noreply@example.com",
-    ) -> None:
-        """メール送信"""
+    ) -> EmailMessage:
+        """送信用のメッセージを組み立てる"""
         message = EmailMessage()
         message["From"] = from_email
         message["To"] = to
         message["Subject"] = subject
         message.set_content(body)
+        return message
 
-        await aiosmtplib.send(
-            message,
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-        )
+    async def check_connection(self) -> None:
+        """SMTPサーバーへの接続を確認（失敗時は例外）"""
+        smtp = self._create_connection()
+        await smtp.connect()
+        try:
+            await smtp.noop()
+        finally:
+            await smtp.quit()
+
+    async def send_email(
+        self,
+        to: str,
+        subject: str,
+        body: str,
+        from_email: str = "noreply@example.com",
+    ) -> None:
+        """メール送信"""
+        await self.pool.send(self.build_message(to, subject, body, from_email))
+
+    async def send_many(
+        self, messages: list[EmailMessage], concurrency: int | None = None
+    ) -> list[Exception | None]:
+        """複数メールをプールの接続で並行送信（失敗した要素は例外、成功はNone）"""
+        return await self.pool.send_many(messages, concurrency)
+
+    async def close(self) -> None:
+        """プールの接続を閉じる"""
+        await self.pool.close()
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# 再利用した接続がサーバー側で切断されていた場合の例外
+_DISCONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, ConnectionError)
+
+
+class SMTPConnectionPool:
+    """認証済みSMTP接続を最大size本まで保持して再利用するプール
+
+    接続は使用後にプールへ戻し、次の送信ではEHLO・認証を省略する。
+    サーバー側でアイドル切断された接続は、送信時に再接続して1回だけ再試行する。
+    """
+
+    def __init__(
+        self,
+        size: int,
+        connection_factory: Callable[[], aiosmtplib.SMTP],
+    ):
+        self.size = size
+        self.connection_factory = connection_factory
+        self._idle: list[aiosmtplib.SMTP] = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = self.connection_factory()
+        # usernameが設定されている場合はconnect内でログインまで行われる
+        await smtp.connect()
+        return smtp
+
+    @staticmethod
+    def _discard(smtp: aiosmtplib.SMTP) -> None:
+        if smtp.is_connected:
+            smtp.close()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """プールから接続を借りる（空きがなければ返却を待つ）"""
+        async with self._semaphore:
+            smtp = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.is_connected:
+                    smtp = candidate
+                    break
+            if smtp is None:
+                smtp = await self._connect()
+            try:
+                yield smtp
+            except BaseException:
+                # 状態が不明な接続は再利用しない
+                self._discard(smtp)
+                raise
+            if smtp.is_connected:
+                self._idle.append(smtp)
+
+    async def send(self, message: EmailMessage) -> None:
+        """プールの接続で1通送信"""
+        async with self.connection() as smtp:
+            try:
+                await smtp.send_message(message)
+                return
+            except _DISCONNECT_ERRORS:
+                logger.info("SMTP connection was dropped, reconnecting")
+                self._discard(smtp)
+            await smtp.connect()
+            await smtp.send_message(message)
+
+    async def send_many(
+        self, messages: list[EmailMessage], concurrency: int | None = None
+    ) -> list[Exception | None]:
+        """複数メールを最大concurrency本の接続で並行送信
+
+        各接続では1通ずつ順に送信する。戻り値はmessagesと同じ順序で、
+        成功した要素はNone、失敗した要素は発生した例外。
+        """
+        results: list[Exception | None] = [None] * len(messages)
+        pending = iter(enumerate(messages))
+
+        async def worker() -> None:
+            # 各ワーカーが共有イテレータから次のメールを取り出す
+            for index, message in pending:
+                try:
+                    await self.send(message)
+                except Exception as e:
+                    results[index] = e
+
+        workers = min(concurrency or self.size, self.size, len(messages))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
+    async def close(self) -> None:
+        """保持している接続をすべて閉じる"""
+        idle, self._idle = self._idle, []
+        for smtp in idle:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                self._discard(smtp)
@@ -0,0 +1,20 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.async_email_outbox_repository import IAsyncEmailOutboxRepository
+from app.infrastructure.repositories.email_outbox_repository import EmailOutboxRepository
+
+
+class AsyncEmailOutboxRepository(IAsyncEmailOutboxRepository):
+    """メールアウトボックスリポジトリ（非同期版）
+
+    同じAsyncSessionを使うリポジトリの処理と同一トランザクションで書き込まれる。
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加（commitしない）"""
+        await self.db.run_sync(
+            lambda session: EmailOutboxRepository(session).add(to, subject, body, from_email)
+        )
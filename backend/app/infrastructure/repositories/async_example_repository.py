@@ -0,0 +1,103 @@
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from typing import TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.domain.example import Example, ExampleSaveResult
+from app.domain.repositories.async_example_repository import IAsyncExampleRepository
+from app.domain.repositories.example_repository import IExampleRepository
+from app.infrastructure.database.models import ExampleModel
+from app.infrastructure.repositories.example_repository import (
+    EXAMPLE_COLUMNS,
+    ExampleRepository,
+)
+
+T = TypeVar("T")
+
+
+class AsyncExampleRepository(IAsyncExampleRepository):
+    """サンプルリポジトリ（非同期版）
+
+    クエリは同期版リポジトリの実装をAsyncSession.run_sync経由で実行する。
+    run_syncはAsyncSession自身と同じgreenlet機構で動作するため、
+    I/Oは非同期ドライバ（asyncpg）上で行われイベントループをブロックしない。
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository_factory: Callable[[Session], IExampleRepository] = ExampleRepository,
+    ):
+        self.db = db
+        self.repository_factory = repository_factory
+
+    async def _run(self, fn: Callable[[IExampleRepository], T]) -> T:
+        """同期版リポジトリの処理をAsyncSession上で実行"""
+        return await self.db.run_sync(lambda session: fn(self.repository_factory(session)))
+
+    async def find_by_id(self, example_id: int) -> Example | None:
+        """IDでエンティティを取得"""
+        return await self._run(lambda repository: repository.find_by_id(example_id))
+
+    async def find_all(self) -> list[Example]:
+        """全エンティティを取得"""
+        return await self._run(lambda repository: repository.find_all())
+
+    async def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        return await self._run(lambda repository: repository.find_page(limit, after_id))
+
+    async def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得（存在しない場合はNone）"""
+        return await self._run(lambda repository: repository.find_version(example_id))
+
+    async def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得"""
+        return await self._run(lambda repository: repository.find_page_version(limit, after_id))
+
+    async def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得"""
+        return await self._run(
+            lambda repository: repository.search_by_name(query, limit, offset)
+        )
+
+    async def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得"""
+        return await self._run(
+            lambda repository: repository.find_changes(limit, after, safety_lag_seconds)
+        )
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[Example]:
+        """全エンティティをchunk_size件ずつ読み出しながら逐次返す"""
+        stmt = (
+            select(*EXAMPLE_COLUMNS)
+            .order_by(ExampleModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        async for row in result:
+            yield Example(*row)
+
+    async def save(self, example: Example) -> Example:
+        """エンティティを保存"""
+        return await self._run(lambda repository: repository.save(example))
+
+    async def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新し、更新後のエンティティを返す（存在しない場合はNone）"""
+        return await self._run(lambda repository: repository.update_name(example_id, name))
+
+    async def save_many(
+        self, examples: list[Example], batch_size: int
+    ) -> list[ExampleSaveResult]:
+        """複数エンティティを1トランザクションで保存"""
+        return await self._run(lambda repository: repository.save_many(examples, batch_size))
@@ -0,0 +1,111 @@
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from datetime import datetime
+
+from app.core.cache import MISSING, TTLCache
+from app.domain.example import Example, ExampleSaveResult
+from app.domain.repositories.example_repository import IExampleRepository
+
+
+class CachedExampleRepository(IExampleRepository):
+    """find_by_idの結果をキャッシュするリポジトリ（デコレータ）
+
+    存在しないIDはnegative_ttl_secondsの間Noneとしてキャッシュする。
+    保存時の該当IDのエントリの破棄はafter_commit（Unit of Workのafter_commit）に登録し、
+    commitの成功後に行う。commit前に破棄すると、commitまでの間に他のリクエストが
+    古い値を再びキャッシュしてしまうため。after_commitを省略した場合は即時に破棄する。
+    エンティティは可変のため、キャッシュとの受け渡しはコピーで行う。
+    """
+
+    def __init__(
+        self,
+        repository: IExampleRepository,
+        cache: TTLCache,
+        negative_ttl_seconds: float | None = None,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.after_commit = after_commit
+
+    def find_by_id(self, example_id: int) -> Example | None:
+        """IDでエンティティを取得（キャッシュ優先）"""
+        cached = self.cache.get(example_id)
+        if cached is not MISSING:
+            return replace(cached) if cached is not None else None
+
+        example = self.repository.find_by_id(example_id)
+        if example is None:
+            self.cache.set(example_id, None, ttl_seconds=self.negative_ttl_seconds)
+        else:
+            self.cache.set(example_id, replace(example))
+        return example
+
+    def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得（キャッシュにあればそれを使う）"""
+        cached = self.cache.get(example_id)
+        if cached is not MISSING:
+            return cached.updated_at if cached is not None else None
+        return self.repository.find_version(example_id)
+
+    def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得"""
+        return self.repository.find_page_version(limit, after_id)
+
+    def find_all(self) -> list[Example]:
+        """全エンティティを取得"""
+        return self.repository.find_all()
+
+    def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        return self.repository.find_page(limit, after_id)
+
+    def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得（キャッシュしない）"""
+        return self.repository.search_by_name(query, limit, offset)
+
+    def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得"""
+        return self.repository.find_changes(limit, after, safety_lag_seconds)
+
+    def stream_all(self, chunk_size: int) -> Iterator[Example]:
+        """全エンティティをchunk_size件ずつ読み出しながら逐次返す"""
+        return self.repository.stream_all(chunk_size)
+
+    def save(self, example: Example) -> Example:
+        """エンティティを保存し、commit後にキャッシュを破棄"""
+        saved = self.repository.save(example)
+        self._invalidate([saved.id])
+        return saved
+
+    def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新し、commit後にキャッシュを破棄"""
+        updated = self.repository.update_name(example_id, name)
+        self._invalidate([example_id])
+        return updated
+
+    def save_many(self, examples: list[Example], batch_size: int) -> list[ExampleSaveResult]:
+        """複数エンティティを保存し、commit後にキャッシュを破棄"""
+        saved = self.repository.save_many(examples, batch_size)
+        self._invalidate([r.example.id for r in saved if r.example is not None])
+        return saved
+
+    def _invalidate(self, example_ids: list[int]) -> None:
+        """エントリを破棄（after_commitがあればcommit後に行う）"""
+
+        def evict() -> None:
+            for example_id in example_ids:
+                self.cache.delete(example_id)
+
+        if self.after_commit is None:
+            evict()
+        else:
+            self.after_commit(evict)
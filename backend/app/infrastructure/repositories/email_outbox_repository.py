@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.domain.email import OutboxEmail
+from app.domain.repositories.email_outbox_repository import IEmailOutboxRepository
+from app.infrastructure.database.models import EmailOutboxModel, utc_now
+
+
+class EmailOutboxRepository(IEmailOutboxRepository):
+    """メールアウトボックスリポジトリ"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加（commitしない）"""
+        self.db.add(
+            EmailOutboxModel(
+                to=to, subject=subject, body=body, from_email=from_email, status="pending"
+            )
+        )
+
+    def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        """送信時刻に達したメールを最大limit件確保する
+
+        FOR UPDATE SKIP LOCKEDで他のワーカーが確保中の行を飛ばし、
+        next_attempt_atをリース期限まで進めてからcommitする。
+        送信中にワーカーが停止しても、リース期限後に再度確保される。
+        """
+        now = utc_now()
+        models = self.db.scalars(
+            select(EmailOutboxModel)
+            .where(EmailOutboxModel.status == "pending", EmailOutboxModel.next_attempt_at <= now)
+            .order_by(EmailOutboxModel.next_attempt_at, EmailOutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for model in models:
+            model.attempts += 1
+            model.next_attempt_at = lease_until
+        emails = [self._to_entity(model) for model in models]
+        self.db.commit()
+        return emails
+
+    def mark_sent(self, email_ids: list[int]) -> None:
+        """送信済みにする"""
+        if not email_ids:
+            return
+        self.db.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(email_ids))
+            .values(status="sent", sent_at=utc_now(), last_error=None)
+        )
+        self.db.commit()
+
+    def mark_failed(self, email_id: int, error: str, retry_at: datetime | None) -> None:
+        """送信失敗を記録（retry_atがNoneの場合は再送しない）"""
+        values: dict = {"last_error": error}
+        if retry_at is None:
+            values["status"] = "failed"
+        else:
+            values["next_attempt_at"] = retry_at
+        self.db.execute(
+            update(EmailOutboxModel).where(EmailOutboxModel.id == email_id).values(**values)
+        )
+        self.db.commit()
+
+    def _to_entity(self, model: EmailOutboxModel) -> OutboxEmail:
+        """モデルをエンティティに変換"""
+        return OutboxEmail(
+            id=model.id,
+            to=model.to,
+            subject=model.subject,
+            body=model.body,
+            from_email=model.from_email,
+            status=model.status,
+            attempts=model.attempts,
+            next_attempt_at=model.next_attempt_at,
+            created_at=model.created_at,
+            last_error=model.last_error,
+            sent_at=model.sent_at,
+        )
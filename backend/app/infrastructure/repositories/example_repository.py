@@ -1,45 +1,209 @@
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import Insert, Row, Select, case, func, insert, select, tuple_, update
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
 from sqlalchemy.orm import Session
 
-from app.domain.example import Example
+from app.domain.example import Example, ExampleSaveResult
 from app.domain.repositories.example_repository import IExampleRepository
-from app.infrastructure.database.models import ExampleModel
+from app.infrastructure.database.models import ExampleModel, UtcClock
+
+# 読み取りで取得する列（Exampleのフィールドと同じ順序）
+EXAMPLE_COLUMNS = (
+    ExampleModel.id,
+    ExampleModel.name,
+    ExampleModel.description,
+    ExampleModel.created_at,
+    ExampleModel.updated_at,
+)
 
 
 class ExampleRepository(IExampleRepository):
-    """サンプルリポジトリ"""
+    """サンプルリポジトリ
+
+    書き込みはcommitせず、Unit of Work（AsyncSqlAlchemyUnitOfWork）のcommitで確定する。
+    """
 
     def __init__(self, db: Session):
         self.db = db
 
+    # 読み取りはORMモデルを経由せず、列のSELECT結果（Row）から直接エンティティを作る。
+    # ORMインスタンスの生成・identity mapへの登録・属性の計装を行わないため、
+    # 1行あたりの割り当てがRowとExampleの2つで済む（scripts/benchmark_example_reads.py）。
+
+    def _select(self) -> Select:
+        """エンティティの列のみを取得するSELECT文"""
+        return select(*EXAMPLE_COLUMNS)
+
     def find_by_id(self, example_id: int) -> Example | None:
         """IDでエンティティを取得"""
-        model = self.db.query(ExampleModel).filter(ExampleModel.id == example_id).first()
-        if model is None:
+        row = self.db.execute(self._select().where(ExampleModel.id == example_id)).first()
+        if row is None:
             return None
-        return self._to_entity(model)
+        return self._row_to_entity(row)
 
     def find_all(self) -> list[Example]:
         """全エンティティを取得"""
-        models = self.db.query(ExampleModel).all()
-        return [self._to_entity(m) for m in models]
+        rows = self.db.execute(self._select()).all()
+        return [self._row_to_entity(r) for r in rows]
 
-    def save(self, example: Example) -> Example:
-        """エンティティを保存"""
-        model = ExampleModel(
-            name=example.name,
-            description=example.description,
+    def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        stmt = self._select()
+        if after_id is not None:
+            stmt = stmt.where(ExampleModel.id > after_id)
+        rows = self.db.execute(stmt.order_by(ExampleModel.id).limit(limit)).all()
+        return [self._row_to_entity(r) for r in rows]
+
+    def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得（存在しない場合はNone）"""
+        return self.db.scalar(
+            select(ExampleModel.updated_at).where(ExampleModel.id == example_id)
         )
-        self.db.add(model)
-        self.db.commit()
-        self.db.refresh(model)
-        return self._to_entity(model)
-
-    def _to_entity(self, model: ExampleModel) -> Example:
-        """モデルをエンティティに変換"""
-        return Example(
-            id=model.id,
-            name=model.name,
-            description=model.description,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
+
+    def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得
+
+        範囲内の行だけを集計するため、コストはテーブルサイズではなくlimitに比例する。
+        """
+        window = select(ExampleModel.id, ExampleModel.updated_at)
+        if after_id is not None:
+            window = window.where(ExampleModel.id > after_id)
+        subquery = window.order_by(ExampleModel.id).limit(limit).subquery()
+        count, max_id, max_updated_at = self.db.execute(
+            select(func.count(), func.max(subquery.c.id), func.max(subquery.c.updated_at))
+        ).one()
+        return count, max_id, max_updated_at
+
+    def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得
+
+        PostgreSQLではILIKEの部分一致にpg_trgmのGINインデックス（ix_examples_name_trgm）が
+        使われ、同順位内はトライグラムの類似度順とする。SQLiteではLIKEによる全件走査となる。
+        """
+        rank = case(
+            (func.lower(ExampleModel.name) == query.lower(), 0),
+            (ExampleModel.name.istartswith(query, autoescape=True), 1),
+            else_=2,
         )
+        order_by = [rank]
+        if self.db.get_bind().dialect.name == "postgresql":
+            order_by.append(func.similarity(ExampleModel.name, query).desc())
+        stmt = (
+            self._select()
+            .where(ExampleModel.name.icontains(query, autoescape=True))
+            .order_by(*order_by, ExampleModel.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return [self._row_to_entity(r) for r in self.db.execute(stmt)]
+
+    def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得
+
+        行値の比較と並び順がインデックス（ix_examples_updated_at_id）と一致するため、
+        コストはテーブルサイズではなく変更件数に比例する。
+        safety_lag_secondsの基準時刻は、updated_atを設定するトリガー・列のデフォルトと
+        同じDBの時計から求める（アプリケーションサーバーとの時刻のずれの影響を受けない）。
+        """
+        stmt = self._select()
+        if after is not None:
+            stmt = stmt.where(tuple_(ExampleModel.updated_at, ExampleModel.id) > tuple_(*after))
+        if safety_lag_seconds is not None:
+            stmt = stmt.where(ExampleModel.updated_at <= UtcClock(safety_lag_seconds))
+        stmt = stmt.order_by(ExampleModel.updated_at, ExampleModel.id).limit(limit)
+        return [self._row_to_entity(r) for r in self.db.execute(stmt)]
+
+    def stream_all(self, chunk_size: int) -> Iterator[Example]:
+        """全エンティティをchunk_size件ずつ読み出しながら逐次返す
+
+        yield_perによりサーバーサイドカーソル（stream_results）で取得するため、
+        テーブルサイズに関わらずメモリ使用量は一定に保たれる。
+        """
+        stmt = self._select().order_by(ExampleModel.id).execution_options(yield_per=chunk_size)
+        for row in self.db.execute(stmt):
+            yield self._row_to_entity(row)
+
+    def save(self, example: Example) -> Example:
+        """エンティティを保存
+
+        INSERT ... RETURNINGの1往復で採番したIDと作成日時・更新日時を取得する。
+        commit後の再SELECTが不要なため、レプリカ振り分け時に
+        遅延したレプリカへ読み取りが向かうこともない。
+        """
+        row = self.db.execute(
+            self._insert_stmt(), [{"name": example.name, "description": example.description}]
+        ).one()
+        return self._row_to_entity(row)
+
+    def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新し、更新後のエンティティを返す（存在しない場合はNone）
+
+        事前に読み込まず、UPDATE ... RETURNINGの1往復で更新後の値を取得する
+        （updated_atはonupdate・トリガーで設定される）。
+        """
+        row = self.db.execute(
+            update(ExampleModel)
+            .where(ExampleModel.id == example_id)
+            .values(name=name)
+            .returning(*EXAMPLE_COLUMNS)
+            # セッション上のモデルを読み込んでいないため同期は不要
+            .execution_options(synchronize_session=False)
+        ).first()
+        return self._row_to_entity(row) if row is not None else None
+
+    def save_many(self, examples: list[Example], batch_size: int) -> list[ExampleSaveResult]:
+        """複数エンティティを1トランザクションで保存
+
+        batch_size件ごとに複数行INSERT ... RETURNINGを発行する。
+        バッチが失敗した場合はSAVEPOINT内で1行ずつ再実行し、失敗した行のみ理由付きで失敗とする。
+        """
+        rows = [{"name": e.name, "description": e.description} for e in examples]
+        results: list[ExampleSaveResult] = []
+        for start in range(0, len(rows), batch_size):
+            results.extend(self._insert_batch(rows[start : start + batch_size]))
+        return results
+
+    def _insert_stmt(self) -> Insert:
+        """RETURNING付きのINSERT文"""
+        return insert(ExampleModel).returning(*EXAMPLE_COLUMNS, sort_by_parameter_order=True)
+
+    def _insert_batch(self, rows: list[dict]) -> list[ExampleSaveResult]:
+        """1バッチ分をINSERT（失敗時は1行ずつ再実行して失敗行を特定）"""
+        try:
+            with self.db.begin_nested():
+                result = self.db.execute(self._insert_stmt(), rows)
+                return [ExampleSaveResult(self._row_to_entity(r)) for r in result]
+        except DBAPIError:
+            return [self._insert_one(row) for row in rows]
+
+    def _insert_one(self, row: dict) -> ExampleSaveResult:
+        """1行をSAVEPOINT内でINSERT（失敗時は理由付きの失敗）"""
+        try:
+            with self.db.begin_nested():
+                inserted = self.db.execute(self._insert_stmt(), [row]).one()
+                return ExampleSaveResult(self._row_to_entity(inserted))
+        except DBAPIError as e:
+            return ExampleSaveResult(None, self._save_error_reason(e))
+
+    @staticmethod
+    def _save_error_reason(error: DBAPIError) -> str:
+        """DBのエラーをクライアントに返せる失敗理由に変換（制約名やSQLは含めない）"""
+        if isinstance(error, IntegrityError):
+            return "Constraint violation"
+        if isinstance(error, DataError):
+            return "Invalid or too long value"
+        return "Failed to save example"
+
+    @staticmethod
+    def _row_to_entity(row: Row) -> Example:
+        """EXAMPLE_COLUMNSのSELECT・RETURNINGの結果行をエンティティに変換"""
+        return Example(*row)
@@ -1,32 +1,207 @@
-import boto3
-from botocore.client import Config
+import io
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
 from app.core.config import settings
 
+MB = 1024 * 1024
+
 
 class S3Client:
-    """S3クライアント（MinIO用）"""
+    """S3クライアント（MinIO用）
+
+    転送はマルチパートのしきい値・チャンクサイズ・並列数をTransferConfigで設定する。
+    一括転送ではスレッドプールで複数キーを並行に処理する。
+    boto3のimportは数百ミリ秒かかるため、起動時間に影響しないよう生成時に行う。
+    """
 
     def __init__(self):
-        self.client = boto3.client(
+        from boto3.s3.transfer import TransferConfig
+
+        self.client = self._create_client(settings.S3_ENDPOINT)
+        # 署名付きURLはクライアントから到達できるエンドポイントで発行する
+        self.presign_client = (
+            self._create_client(settings.S3_PUBLIC_ENDPOINT)
+            if settings.S3_PUBLIC_ENDPOINT
+            else self.client
+        )
+        self.bucket = settings.S3_BUCKET
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * MB,
+            multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE_MB * MB,
+            max_concurrency=settings.S3_MAX_CONCURRENCY,
+        )
+
+    @staticmethod
+    def _create_client(endpoint_url: str):
+        import boto3
+        from botocore.client import Config
+
+        return boto3.client(
             "s3",
-            endpoint_url=settings.S3_ENDPOINT,
+            endpoint_url=endpoint_url,
             aws_access_key_id=settings.S3_ACCESS_KEY,
             aws_secret_access_key=settings.S3_SECRET_KEY,
-            config=Config(signature_version="s3v4"),
+            config=Config(
+                signature_version="s3v4",
+                # 一括転送の並列数×マルチパートの並列数まで同時接続する
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+            ),
             region_name="us-east-1",
         )
-        self.bucket = settings.S3_BUCKET
+
+    def close(self) -> None:
+        """HTTP接続を閉じる"""
+        self.client.close()
+        if self.presign_client is not self.client:
+            self.presign_client.close()
+
+    def check_connection(self) -> None:
+        """バケットへの到達性を確認（失敗時は例外）"""
+        self.client.head_bucket(Bucket=self.bucket)
 
     def upload_file(self, file_path: str, object_name: str) -> None:
         """ファイルアップロード"""
-        self.client.upload_file(file_path, self.bucket, object_name)
+        self.client.upload_file(file_path, self.bucket, object_name, Config=self.transfer_config)
 
     def download_file(self, object_name: str, file_path: str) -> None:
         """ファイルダウンロード"""
-        self.client.download_file(self.bucket, object_name, file_path)
+        self.client.download_file(self.bucket, object_name, file_path, Config=self.transfer_config)
+
+    def upload_fileobj(self, fileobj: BinaryIO, object_name: str) -> None:
+        """ファイルライクオブジェクトからアップロード"""
+        self.client.upload_fileobj(fileobj, self.bucket, object_name, Config=self.transfer_config)
+
+    def download_fileobj(self, object_name: str, fileobj: BinaryIO) -> None:
+        """ファイルライクオブジェクトへダウンロード"""
+        self.client.download_fileobj(self.bucket, object_name, fileobj, Config=self.transfer_config)
+
+    def upload_bytes(self, data: bytes, object_name: str) -> None:
+        """バイト列をアップロード"""
+        self.upload_fileobj(io.BytesIO(data), object_name)
+
+    def download_bytes(self, object_name: str) -> bytes:
+        """オブジェクトをバイト列としてダウンロード"""
+        buffer = io.BytesIO()
+        self.download_fileobj(object_name, buffer)
+        return buffer.getvalue()
+
+    def upload_files(
+        self, files: list[tuple[str, str]], max_workers: int | None = None
+    ) -> list[Exception | None]:
+        """(ファイルパス, オブジェクト名)の組を並行アップロード
+
+        戻り値はfilesと同じ順序で、成功した要素はNone、失敗した要素は発生した例外。
+        """
+        return self._run_parallel(self.upload_file, files, max_workers)
+
+    def download_files(
+        self, objects: list[tuple[str, str]], max_workers: int | None = None
+    ) -> list[Exception | None]:
+        """(オブジェクト名, ファイルパス)の組を並行ダウンロード（戻り値はupload_filesと同じ）"""
+        return self._run_parallel(self.download_file, objects, max_workers)
+
+    def _run_parallel(
+        self,
+        transfer: Callable[[str, str], None],
+        items: list[tuple[str, str]],
+        max_workers: int | None,
+    ) -> list[Exception | None]:
+        def run(item: tuple[str, str]) -> Exception | None:
+            try:
+                transfer(*item)
+            except Exception as e:
+                return e
+            return None
+
+        if not items:
+            return []
+        workers = min(max_workers or settings.S3_BULK_MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+
+    def iter_keys(self, prefix: str = "", page_size: int = 1000) -> Iterator[str]:
+        """prefixに一致するオブジェクト名をページ単位で取得しながら逐次返す"""
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix, PaginationConfig={"PageSize": page_size}
+        )
+        for page in pages:
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    def list_objects(self, prefix: str = "") -> list[str]:
+        """オブジェクト一覧（1000件を超える場合も全件）"""
+        return list(self.iter_keys(prefix))
+
+    def presign_put(
+        self, object_name: str, content_type: str, content_length: int, expires_in: int
+    ) -> str:
+        """アップロード用の署名付きURLを発行
+
+        Content-TypeとContent-Lengthも署名に含まれるため、異なるサイズでは拒否される。
+        """
+        return self.presign_client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": object_name,
+                "ContentType": content_type,
+                "ContentLength": content_length,
+            },
+            ExpiresIn=expires_in,
+        )
+
+    def presign_get(self, object_name: str, expires_in: int) -> str:
+        """ダウンロード用の署名付きURLを発行"""
+        return self.presign_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": object_name},
+            ExpiresIn=expires_in,
+        )
+
+    def create_multipart_upload(self, object_name: str, content_type: str) -> str:
+        """マルチパートアップロードを開始し、アップロードIDを返す"""
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket, Key=object_name, ContentType=content_type
+        )
+        return response["UploadId"]
+
+    def presign_upload_part(
+        self,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        content_length: int,
+        expires_in: int,
+    ) -> str:
+        """マルチパートアップロードのパート用署名付きURLを発行"""
+        return self.presign_client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.bucket,
+                "Key": object_name,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+                "ContentLength": content_length,
+            },
+            ExpiresIn=expires_in,
+        )
+
+    def complete_multipart_upload(
+        self, object_name: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        """(パート番号, ETag)の一覧でマルチパートアップロードを完了"""
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": number, "ETag": etag} for number, etag in parts]
+            },
+        )
 
-    def list_objects(self) -> list[str]:
-        """オブジェクト一覧"""
-        response = self.client.list_objects_v2(Bucket=self.bucket)
-        return [obj["Key"] for obj in response.get("Contents", [])]
+    def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        """マルチパートアップロードを中止"""
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=object_name, UploadId=upload_id)
@@ -1,46 +1,51 @@
-import json
 import logging
-import traceback
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
+from app import IMPORT_STARTED_AT
+from app.api.deps import clients, example_cache, health_monitor, presign_cache
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.database import async_engine, async_replica_engines, pool_metrics, warm_up_pool
+from app.core.logging_config import setup_logging
+from app.core.metrics import MetricsMiddleware, StatsCollector
+
+# ロギング設定（JSON整形・出力はバックグラウンドスレッドで行う）
+setup_logging()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """起動時にDB接続を確立してバックグラウンド処理を開始し、終了時に停止する"""
+    warmup = min(settings.DB_POOL_WARMUP_CONNECTIONS, settings.DB_POOL_SIZE)
+    if async_engine is not None and warmup > 0 and not settings.DB_USE_NULL_POOL:
+        for engine in (async_engine, *async_replica_engines):
+            await warm_up_pool(engine, warmup, settings.DB_POOL_WARMUP_TIMEOUT_SECONDS)
+    health_monitor.start()
+    logger.info(
+        "Application startup complete",
+        extra={
+            "import_seconds": round(APP_CONSTRUCTED_AT - IMPORT_STARTED_AT, 3),
+            "startup_seconds": round(time.perf_counter() - IMPORT_STARTED_AT, 3),
+        },
+    )
+    yield
+    await health_monitor.stop()
+    # S3・SMTPの接続は生成済みの場合のみ閉じる
+    await clients.close()
 
 
-# JSON形式のカスタムフォーマッター
-class JsonFormatter(logging.Formatter):
-    def format(self, record):
-        log_data = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-
-        # 例外情報がある場合は追加
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-
-        return json.dumps(log_data, ensure_ascii=False)
-
-
-# ロギング設定
-handler = logging.StreamHandler()
-handler.setFormatter(JsonFormatter())
-logging.basicConfig(
-    level=logging.DEBUG,
-    handlers=[handler],
-)
-
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 
@@ -79,5 +84,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# リクエスト計測（最も外側で計測するため最後に追加）
+app.add_middleware(MetricsMiddleware)
+
 # APIルーター登録
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+# Prometheusメトリクス
+REGISTRY.register(
+    StatsCollector(
+        pool_metrics, {"examples": example_cache.stats, "presign": presign_cache.stats}
+    )
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheusテキスト形式のメトリクス"""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+# importとアプリケーション構築の完了時刻（起動時間の計測用）
+APP_CONSTRUCTED_AT = time.perf_counter()
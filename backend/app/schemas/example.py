@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
 
@@ -12,9 +13,38 @@ class ExampleCreate(ExampleBase):
     pass
 
 
+class ExampleUpdate(BaseModel):
+    name: str
+
+
 class ExampleResponse(ExampleBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     created_at: datetime
     updated_at: datetime
+
+
+class ExamplePage(BaseModel):
+    items: list[ExampleResponse]
+    next_cursor: str | None = None
+
+
+class ExampleChanges(BaseModel):
+    items: list[ExampleResponse]
+    # 次回のsinceに渡すカーソル（変更がない場合は渡されたsinceのまま）
+    next_cursor: str | None = None
+    has_more: bool
+
+
+class ExampleBulkItemResult(BaseModel):
+    index: int
+    status: Literal["created", "failed"]
+    example: ExampleResponse | None = None
+    error: str | None = None
+
+
+class ExampleBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[ExampleBulkItemResult]
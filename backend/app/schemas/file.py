@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+
+class FileUploadRequest(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    content_type: str = "application/octet-stream"
+    size: int = Field(gt=0, le=settings.S3_PRESIGN_PUT_MAX_BYTES)
+
+
+class MultipartUploadRequest(FileUploadRequest):
+    size: int = Field(gt=0, le=settings.S3_PRESIGN_MULTIPART_MAX_BYTES)
+
+
+class PresignedUrlResponse(BaseModel):
+    key: str
+    url: str
+    method: str
+    expires_in: int
+    # 署名に含まれるため、リクエスト時に同じ値で送る必要があるヘッダー
+    headers: dict[str, str] = {}
+
+
+class PresignedPart(BaseModel):
+    part_number: int
+    url: str
+    size: int
+
+
+class MultipartUploadResponse(BaseModel):
+    key: str
+    upload_id: str
+    part_size: int
+    expires_in: int
+    parts: list[PresignedPart]
+
+
+class CompletedPart(BaseModel):
+    part_number: int = Field(ge=1, le=10000)
+    etag: str
+
+
+class MultipartCompleteRequest(BaseModel):
+    key: str
+    upload_id: str
+    parts: list[CompletedPart] = Field(min_length=1)
+
+
+class MultipartAbortRequest(BaseModel):
+    key: str
+    upload_id: str
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+メールアウトボックス送信バッチ
+
+email_outboxテーブルの送信待ちメールをSMTPで送信します。
+--onceを指定すると送信待ちがなくなった時点で終了します（Step Functionsからの定期実行用）。
+指定しない場合は常駐してポーリングを続けます。
+
+Usage:
+    python batch/email_outbox_dispatcher.py [--once]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import engine
+from app.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from app.infrastructure.email.smtp_client import SMTPClient
+from app.infrastructure.repositories.email_outbox_repository import EmailOutboxRepository
+
+# ログ設定（標準出力に出力 → CloudWatch Logsに転送）
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+
+def get_session_factory() -> sessionmaker:
+    """プライマリに接続するSessionのファクトリを取得
+
+    送信待ちの確保（SELECT ... FOR UPDATE SKIP LOCKED）と状態の更新を行うため、
+    リードレプリカへ振り分けるSessionLocalは使わない。
+    """
+    if engine is None:
+        raise RuntimeError("Database is not configured. Check DATABASE_URL.")
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def dispatch(once: bool) -> None:
+    """アウトボックスの送信処理を実行"""
+    smtp_client = SMTPClient()
+    with get_session_factory()() as db:
+        dispatcher = EmailOutboxDispatcher(
+            EmailOutboxRepository(db),
+            smtp_client,
+            batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            backoff_seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+            backoff_max_seconds=settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS,
+            lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        )
+        try:
+            await dispatcher.run(settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS, stop_when_idle=once)
+        finally:
+            await smtp_client.close()
+
+
+def main() -> int:
+    """
+    メイン処理
+
+    Returns:
+        int: 終了コード (0: 成功, 1: 失敗)
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--once", action="store_true", help="送信待ちがなくなったら終了する")
+    args = parser.parse_args()
+
+    logger.info("Email outbox dispatcher started")
+    try:
+        asyncio.run(dispatch(args.once))
+    except KeyboardInterrupt:
+        logger.info("Email outbox dispatcher stopped")
+    except Exception as e:
+        logger.error(f"Email outbox dispatcher failed: {str(e)}", exc_info=True)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+バッチ処理のプロファイリング
+
+cProfile（CPU時間）・tracemalloc（メモリのピークと確保箇所）・SQL文ごとの実行時間を
+オプションで計測し、サマリーをJSONとしてログに出力します。
+S3のプレフィックスを指定した場合はサマリーとcProfileの結果（.prof）をアップロードします。
+"""
+import cProfile
+import io
+import json
+import logging
+import marshal
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.storage.s3_client import S3Client
+
+logger = logging.getLogger(__name__)
+
+# SQL文の集計キーとして使う先頭の文字数
+_STATEMENT_MAX_LENGTH = 300
+
+
+@dataclass(frozen=True)
+class ProfilingOptions:
+    """プロファイリングの設定"""
+
+    cpu: bool = False
+    memory: bool = False
+    sql: bool = False
+    top_n: int = 20
+    s3_prefix: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.cpu or self.memory or self.sql
+
+    @classmethod
+    def from_settings(cls) -> "ProfilingOptions":
+        """環境変数（BATCH_PROFILE_*）から設定を読み込む"""
+        return cls(
+            cpu=settings.BATCH_PROFILE_CPU,
+            memory=settings.BATCH_PROFILE_MEMORY,
+            sql=settings.BATCH_PROFILE_SQL,
+            top_n=settings.BATCH_PROFILE_TOP_N,
+            s3_prefix=settings.BATCH_PROFILE_S3_PREFIX,
+        )
+
+
+class SQLTimer:
+    """SQL文ごとの実行回数・合計時間・最大時間を集計する"""
+
+    def __init__(self):
+        self.stats: dict[str, list[float]] = {}  # 文 -> [回数, 合計秒, 最大秒]
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["profile_query_start"].pop()
+        key = " ".join(statement.split())[:_STATEMENT_MAX_LENGTH]
+        entry = self.stats.setdefault(key, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+
+    def _error(self, context):
+        starts = context.connection.info.get("profile_query_start") if context.connection else None
+        if starts:
+            starts.pop()
+
+    def start(self) -> None:
+        event.listen(Engine, "before_cursor_execute", self._before)
+        event.listen(Engine, "after_cursor_execute", self._after)
+        event.listen(Engine, "handle_error", self._error)
+
+    def stop(self) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before)
+        event.remove(Engine, "after_cursor_execute", self._after)
+        event.remove(Engine, "handle_error", self._error)
+
+    def summary(self, top_n: int) -> dict[str, Any]:
+        ranked = sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "statements": sum(int(count) for count, _, _ in self.stats.values()),
+            "total_seconds": round(sum(total for _, total, _ in self.stats.values()), 6),
+            "top": [
+                {
+                    "statement": statement,
+                    "count": int(count),
+                    "total_seconds": round(total, 6),
+                    "max_seconds": round(longest, 6),
+                }
+                for statement, (count, total, longest) in ranked[:top_n]
+            ],
+        }
+
+
+class BatchProfiler:
+    """with文の範囲をオプションに応じて計測する"""
+
+    def __init__(self, name: str, options: ProfilingOptions):
+        self.name = name
+        self.options = options
+        self.profile: cProfile.Profile | None = None
+        self.sql_timer: SQLTimer | None = None
+        self.result: dict[str, Any] = {}
+        self._started = 0.0
+
+    def __enter__(self) -> "BatchProfiler":
+        self._started = time.perf_counter()
+        if self.options.memory:
+            tracemalloc.start()
+        if self.options.sql:
+            self.sql_timer = SQLTimer()
+            self.sql_timer.start()
+        if self.options.cpu:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.profile is not None:
+            self.profile.disable()
+        elapsed = time.perf_counter() - self._started
+        self.result = {"job": self.name, "wall_seconds": round(elapsed, 3)}
+        if self.profile is not None:
+            self.result["cpu"] = self._cpu_summary()
+        if self.options.memory:
+            self.result["memory"] = self._memory_summary()
+            tracemalloc.stop()
+        if self.sql_timer is not None:
+            self.sql_timer.stop()
+            self.result["sql"] = self.sql_timer.summary(self.options.top_n)
+
+        logger.info(f"Batch profile summary: {json.dumps(self.result, ensure_ascii=False)}")
+        if self.options.s3_prefix:
+            try:
+                self.upload()
+            except Exception as e:
+                # 計測結果のアップロード失敗でバッチ自体を失敗させない
+                logger.warning(f"Failed to upload profile: {e.__class__.__name__}: {e}")
+
+    def _cpu_summary(self) -> dict[str, Any]:
+        stats = pstats.Stats(self.profile, stream=io.StringIO())
+        stats.sort_stats("cumulative")
+        top = []
+        for func in stats.fcn_list[: self.options.top_n]:
+            _, calls, total, cumulative, _ = stats.stats[func]
+            filename, line, name = func
+            top.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": calls,
+                    "total_seconds": round(total, 6),
+                    "cumulative_seconds": round(cumulative, 6),
+                }
+            )
+        return {"top": top}
+
+    def _memory_summary(self) -> dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        return {
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "top": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[: self.options.top_n]
+            ],
+        }
+
+    def upload(self) -> list[str]:
+        """サマリーと.profをS3にアップロードし、キーの一覧を返す"""
+        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        # パーティション名（例: job[0/4]）の「/」がキーの階層にならないよう置き換える
+        name = self.name.replace("/", "_")
+        prefix = f"{self.options.s3_prefix.rstrip('/')}/{name}/{timestamp}"
+        s3 = S3Client()
+        keys = [f"{prefix}/summary.json"]
+        s3.upload_bytes(json.dumps(self.result, ensure_ascii=False).encode(), keys[0])
+        if self.profile is not None:
+            # pstats.Stats.dump_statsと同じmarshal形式（snakeviz等で読める）
+            stats = pstats.Stats(self.profile, stream=io.StringIO())
+            keys.append(f"{prefix}/cpu.prof")
+            s3.upload_bytes(marshal.dumps(stats.stats), keys[1])
+        logger.info(f"Uploaded profile to s3://{s3.bucket}/{prefix}/")
+        return keys
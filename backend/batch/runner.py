@@ -0,0 +1,304 @@
+"""
+チャンク単位・チェックポイント付きのバッチ実行基盤
+
+テーブルをキーの昇順（キーセット）でchunk_size件ずつ読み出して処理し、
+チャンクごとに処理結果と進捗（最後に処理したキー）を同じトランザクションでcommitします。
+途中で失敗した場合もStep Functionsのリトライで続きのチャンクから再開します。
+
+キー範囲をパーティションに分割し、プロセスごとに並列実行することもできます。
+"""
+import logging
+import math
+import multiprocessing
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Row, create_engine, func, select
+from sqlalchemy.orm import InstrumentedAttribute, Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.database.models import BatchStateModel
+from batch.profiling import BatchProfiler, ProfilingOptions
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedJob(ABC):
+    """キーの昇順にチャンク単位で処理するバッチジョブ"""
+
+    name: str
+
+    @property
+    @abstractmethod
+    def key_column(self) -> InstrumentedAttribute:
+        """チャンク分割に使う一意な整数列（主キーなど）"""
+        pass
+
+    def columns(self) -> list[Any]:
+        """キー以外に読み出す列"""
+        return []
+
+    @abstractmethod
+    def process_chunk(self, db: Session, rows: Sequence[Row]) -> int:
+        """1チャンク分の行を処理し、更新した件数を返す（commitはランナーが行う）
+
+        チャンクは失敗時に再実行されることがあるため、処理は冪等にする。
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class KeyRange:
+    """キー範囲（start以上end未満、Noneは無制限）"""
+
+    start: int | None = None
+    end: int | None = None
+
+
+@dataclass
+class BatchResult:
+    """バッチの実行結果（再開前の実行分も含む累計）"""
+
+    job_name: str
+    rows_processed: int
+    rows_affected: int
+    chunks: int
+    seconds: float
+    resumed_from: int | None = None
+    skipped: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_processed / self.seconds if self.seconds > 0 else 0.0
+
+
+class BatchRunner:
+    """ChunkedJobをチャンクごとにcommitしながら実行する
+
+    チェックポイントの読み書きが遅延したレプリカに向かわないよう、
+    session_factoryにはプライマリに接続するSessionを渡す。
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], chunk_size: int):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    def _load_state(
+        self,
+        db: Session,
+        state_name: str,
+        restart: bool,
+        run_id: str | None,
+        key_range: KeyRange,
+    ) -> BatchStateModel:
+        """チェックポイントを取得
+
+        同じ実行（run_id未指定または一致）の途中であれば再開、完了済みであればそのまま返す。
+        それ以外（別のrun_id・restart指定・未指定で完了済み）は最初から実行する。
+        再開時のキー範囲は前回保存した範囲を使う。
+        """
+        state = db.get(BatchStateModel, state_name)
+        if state is None:
+            state = BatchStateModel(job_name=state_name)
+            db.add(state)
+        elif not restart and (run_id is None or state.run_id == run_id):
+            if state.status == "running" or run_id is not None:
+                return state
+        state.status = "running"
+        state.run_id = run_id
+        state.range_start = key_range.start
+        state.range_end = key_range.end
+        state.last_key = None
+        state.rows_processed = 0
+        state.rows_affected = 0
+        return state
+
+    def run(
+        self,
+        job: ChunkedJob,
+        restart: bool = False,
+        key_range: KeyRange = KeyRange(),
+        partition: str | None = None,
+        run_id: str | None = None,
+    ) -> BatchResult:
+        """ジョブを最後まで実行（前回が途中で終了している場合はその続きから）
+
+        partitionを指定するとチェックポイントをパーティションごとに分けて記録する。
+        """
+        started = time.perf_counter()
+        chunks = 0
+        state_name = f"{job.name}[{partition}]" if partition else job.name
+        with self.session_factory() as db:
+            state = self._load_state(db, state_name, restart, run_id, key_range)
+            db.commit()
+            if state.status == "completed":
+                logger.info(f"Skipping {state_name}: already completed in run {run_id}")
+                return BatchResult(
+                    job_name=state_name,
+                    rows_processed=state.rows_processed,
+                    rows_affected=state.rows_affected,
+                    chunks=0,
+                    seconds=time.perf_counter() - started,
+                    skipped=True,
+                )
+            resumed_from = state.last_key
+            if resumed_from is not None:
+                logger.info(f"Resuming {state_name} after key {resumed_from}")
+
+            try:
+                while True:
+                    chunk_started = time.perf_counter()
+                    stmt = (
+                        select(job.key_column, *job.columns())
+                        .order_by(job.key_column)
+                        .limit(self.chunk_size)
+                    )
+                    if state.last_key is not None:
+                        stmt = stmt.where(job.key_column > state.last_key)
+                    elif state.range_start is not None:
+                        stmt = stmt.where(job.key_column >= state.range_start)
+                    if state.range_end is not None:
+                        stmt = stmt.where(job.key_column < state.range_end)
+                    rows = db.execute(stmt).all()
+                    if not rows:
+                        break
+
+                    affected = job.process_chunk(db, rows)
+                    # 処理結果と進捗を同じトランザクションでcommitする
+                    state.last_key = rows[-1][0]
+                    state.rows_processed += len(rows)
+                    state.rows_affected += affected
+                    db.commit()
+
+                    chunks += 1
+                    elapsed = time.perf_counter() - chunk_started
+                    rate = len(rows) / elapsed if elapsed > 0 else 0.0
+                    logger.info(
+                        f"{state_name} chunk {chunks}: {len(rows)} rows in {elapsed:.2f}s "
+                        f"({rate:.0f} rows/s), last_key={state.last_key}",
+                        extra={
+                            "job": state_name,
+                            "chunk": chunks,
+                            "rows": len(rows),
+                            "rows_affected": affected,
+                            "rows_per_second": round(rate, 1),
+                            "last_key": state.last_key,
+                        },
+                    )
+
+                state.status = "completed"
+                db.commit()
+            except Exception:
+                # 最後にcommitしたチャンクまでの進捗は残る
+                db.rollback()
+                raise
+
+            return BatchResult(
+                job_name=state_name,
+                rows_processed=state.rows_processed,
+                rows_affected=state.rows_affected,
+                chunks=chunks,
+                seconds=time.perf_counter() - started,
+                resumed_from=resumed_from,
+            )
+
+
+def split_key_range(
+    db: Session, key_column: InstrumentedAttribute, partitions: int
+) -> list[KeyRange]:
+    """キーの最小値〜最大値をpartitions個の連続した範囲に等分する
+
+    先頭の範囲は下限なし、末尾の範囲は上限なしとし、分割後に追加された行も漏らさない。
+    """
+    low, high = db.execute(select(func.min(key_column), func.max(key_column))).one()
+    if low is None or partitions <= 1:
+        return [KeyRange()]
+    step = max(math.ceil((high - low + 1) / partitions), 1)
+    bounds = [low + step * i for i in range(1, partitions)]
+    starts = [None, *bounds]
+    ends = [*bounds, None]
+    return [KeyRange(start, end) for start, end in zip(starts, ends)]
+
+
+def run_partition(
+    database_url: str,
+    job: ChunkedJob,
+    chunk_size: int,
+    key_range: KeyRange,
+    partition: str,
+    run_id: str | None,
+    restart: bool,
+    profiling: ProfilingOptions | None = None,
+) -> BatchResult:
+    """1パーティションを実行（ワーカープロセス用、プロセス専用の接続を使う）
+
+    profilingを指定するとワーカープロセス内でパーティションごとに計測する。
+    """
+    engine = create_engine(database_url, poolclass=NullPool)
+    profiler = (
+        BatchProfiler(f"{job.name}[{partition}]", profiling)
+        if profiling is not None and profiling.enabled
+        else nullcontext()
+    )
+    try:
+        runner = BatchRunner(
+            sessionmaker(bind=engine, autoflush=False, expire_on_commit=False), chunk_size
+        )
+        with profiler:
+            return runner.run(job, restart, key_range, partition, run_id)
+    finally:
+        engine.dispose()
+
+
+def run_partitions(
+    database_url: str,
+    job: ChunkedJob,
+    chunk_size: int,
+    ranges: dict[str, KeyRange],
+    workers: int,
+    run_id: str | None = None,
+    restart: bool = False,
+    profiling: ProfilingOptions | None = None,
+) -> list[BatchResult]:
+    """パーティション名→キー範囲の各パーティションを最大workersプロセスで並列実行
+
+    ワーカーはspawnで起動し、親プロセスの接続を引き継がない。
+    いずれかのパーティションが失敗した場合は全パーティションの終了後に例外を送出する
+    （成功したパーティションの進捗は記録済みのため、リトライ時はスキップされる）。
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                run_partition,
+                database_url,
+                job,
+                chunk_size,
+                key_range,
+                name,
+                run_id,
+                restart,
+                profiling,
+            )
+            for name, key_range in ranges.items()
+        ]
+    errors = [f.exception() for f in futures if f.exception() is not None]
+    if errors:
+        raise errors[0]
+    return [f.result() for f in futures]
+
+
+def aggregate_results(job_name: str, results: list[BatchResult], seconds: float) -> BatchResult:
+    """パーティションごとの結果を合算（secondsは全体の経過時間）"""
+    return BatchResult(
+        job_name=job_name,
+        rows_processed=sum(r.rows_processed for r in results),
+        rows_affected=sum(r.rows_affected for r in results),
+        chunks=sum(r.chunks for r in results),
+        seconds=seconds,
+    )
@@ -2,22 +2,54 @@
 """
 サンプルバッチスクリプト
 
-データベースにアクセスし、サンプルデータの集計・保存を行います。
-Step Functionsから定期的に実行されることを想定しています。
+examplesテーブルをID順にチャンク単位で読み出し、名前の前後の空白を取り除きます。
+チャンクごとにcommitし、進捗をbatch_stateテーブルに記録するため、
+Step Functionsからリトライされた場合は前回の続きから処理します。
+
+--partitionsを指定するとIDの範囲を分割し、複数プロセスで並列に処理します。
+Step FunctionsのMapステートで分散する場合は、--planで分割結果（JSON）を出力し、
+各要素の範囲を--partition-index・--range-start・--range-endで各タスクに渡します。
+リトライ時に完了済みの範囲をスキップするため、共通の--run-id（例: $$.Execution.Name）も渡します。
+
+--profile-cpu・--profile-memory・--profile-sql（または環境変数BATCH_PROFILE_*）を指定すると
+計測結果のサマリーをJSONでログに出力します（並列実行時はパーティションごと）。
 
 Usage:
-    python batch/sample_batch.py
+    python batch/sample_batch.py [--chunk-size N] [--restart]
+    python batch/sample_batch.py --partitions 4 [--workers 4]
+    python batch/sample_batch.py --partitions 8 --plan
+    python batch/sample_batch.py --partitions 8 --partition-index 3 \
+        --range-start 3001 --range-end 4001 --run-id <id>
+    python batch/sample_batch.py --profile-cpu --profile-sql [--profile-s3-prefix profiles/]
 """
-import sys
+import argparse
+import json
 import logging
+import os
+import sys
+import time
+from collections.abc import Sequence
+from contextlib import nullcontext
 from datetime import datetime, timezone
 
-from sqlalchemy import text
+from sqlalchemy import Row, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
 
 # 既存のアプリケーションコードを再利用
-from app.core.database import SessionLocal
 from app.core.config import settings
+from app.core.database import engine
+from app.infrastructure.database.models import ExampleModel
+from batch.profiling import BatchProfiler, ProfilingOptions
+from batch.runner import (
+    BatchResult,
+    BatchRunner,
+    ChunkedJob,
+    KeyRange,
+    aggregate_results,
+    run_partitions,
+    split_key_range,
+)
 
 # ログ設定（標準出力に出力 → CloudWatch Logsに転送）
 logging.basicConfig(
@@ -28,77 +60,167 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_db_session():
-    """データベースセッションを取得"""
-    if SessionLocal is None:
-        raise RuntimeError("Database is not configured. Check DATABASE_URL.")
-    return SessionLocal()
-
+class TrimExampleNamesJob(ChunkedJob):
+    """サンプル: 名前の前後の空白を取り除く（再実行しても結果は同じ）
 
-def sample_select_query(db) -> int:
+    空白のみの名前は空文字列にすると名前の検証（Example.validate_name）に反するため変更しない。
     """
-    サンプル: データ参照（SELECT）
 
-    実際のユースケースに合わせて実装してください。
-    例: 特定条件のレコード数をカウント
-    """
-    logger.info("Executing SELECT query...")
-
-    # サンプル: テーブル一覧を取得（PostgreSQL）
-    result = db.execute(
-        text(
-            """
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'public'
-            """
-        )
-    )
-    tables = result.fetchall()
-    table_count = len(tables)
+    name = "trim_example_names"
 
-    logger.info(f"Found {table_count} tables in public schema")
-    for table in tables:
-        logger.info(f"  - {table[0]}")
+    @property
+    def key_column(self):
+        return ExampleModel.id
 
-    return table_count
+    def columns(self) -> list:
+        return [ExampleModel.name]
 
+    def process_chunk(self, db: Session, rows: Sequence[Row]) -> int:
+        changes = [
+            {"id": row.id, "name": trimmed}
+            for row in rows
+            if (trimmed := row.name.strip()) and trimmed != row.name
+        ]
+        if changes:
+            # 主キー指定の一括UPDATE（executemany）
+            db.execute(update(ExampleModel), changes)
+        return len(changes)
 
-def sample_insert_query(db, data: dict) -> None:
-    """
-    サンプル: データ登録（INSERT/UPDATE）
 
-    実際のユースケースに合わせて実装してください。
-    例: 集計結果をログテーブルに保存
+def get_session_factory() -> sessionmaker:
+    """プライマリに接続するSessionのファクトリを取得"""
+    if engine is None:
+        raise RuntimeError("Database is not configured. Check DATABASE_URL.")
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
-    注意: このサンプルでは実際のINSERTは行いません。
-    実装時は適切なテーブルとモデルを使用してください。
-    """
-    logger.info("Executing INSERT/UPDATE query...")
-    logger.info(f"Data to insert: {data}")
 
-    # 実際の実装例（コメントアウト）:
-    # from app.domain.models import BatchLog
-    # batch_log = BatchLog(
-    #     execution_time=data["execution_time"],
-    #     table_count=data["table_count"],
-    #     status="completed",
-    #     created_at=datetime.now(timezone.utc)
-    # )
-    # db.add(batch_log)
-    # db.commit()
-    # logger.info(f"Inserted batch log with id: {batch_log.id}")
+def plan_partitions(job: ChunkedJob, partitions: int) -> dict[str, KeyRange]:
+    """IDの範囲をパーティションに分割（名前は「番号/分割数」）"""
+    with get_session_factory()() as db:
+        key_ranges = split_key_range(db, job.key_column, partitions)
+    return {f"{i}/{partitions}": r for i, r in enumerate(key_ranges)}
+
+
+def run_parallel(
+    job: ChunkedJob, args: argparse.Namespace, profiling: ProfilingOptions
+) -> BatchResult:
+    """IDの範囲をパーティションに分割して実行し、結果を合算する"""
+    started = time.perf_counter()
+    session_factory = get_session_factory()
+    if args.partition_index is not None:
+        name = f"{args.partition_index}/{args.partitions}"
+        if args.range_start is not None or args.range_end is not None:
+            # --planの出力を使う（タスクごとに分割し直すと、途中で追加された行で範囲がずれる）
+            ranges = {name: KeyRange(args.range_start, args.range_end)}
+        else:
+            planned = plan_partitions(job, args.partitions)
+            ranges = {name: planned[name]} if name in planned else {}
+    else:
+        ranges = plan_partitions(job, args.partitions)
+
+    workers = args.workers or min(len(ranges), os.cpu_count() or 1)
+    logger.info(f"Running {len(ranges)} partition(s) with {workers} worker(s): {ranges}")
+    if workers <= 1:
+        runner = BatchRunner(session_factory, chunk_size=args.chunk_size)
+        with profiling_context(job.name, profiling):
+            results = [
+                runner.run(job, args.restart, key_range, name, args.run_id)
+                for name, key_range in ranges.items()
+            ]
+    else:
+        results = run_partitions(
+            settings.DATABASE_URL,
+            job,
+            args.chunk_size,
+            ranges,
+            workers,
+            run_id=args.run_id,
+            restart=args.restart,
+            profiling=profiling if profiling.enabled else None,
+        )
+    for result in results:
+        logger.info(
+            f"Partition {result.job_name}: {result.rows_processed} rows, "
+            f"updated {result.rows_affected}, {result.seconds:.2f}s"
+            + (" (skipped)" if result.skipped else "")
+        )
+    return aggregate_results(job.name, results, time.perf_counter() - started)
 
-    logger.info("INSERT/UPDATE completed (sample - no actual data written)")
 
+def profiling_context(name: str, options: ProfilingOptions):
+    """計測が有効な場合はBatchProfiler、無効な場合は何もしないコンテキスト"""
+    return BatchProfiler(name, options) if options.enabled else nullcontext()
 
-def main() -> int:
+
+def main(argv: list[str] | None = None) -> int:
     """
     メイン処理
 
     Returns:
         int: 終了コード (0: 成功, 1: 失敗)
     """
+    parser = argparse.ArgumentParser(description="サンプルバッチ")
+    parser.add_argument("--chunk-size", type=int, default=settings.BATCH_CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="チェックポイントを無視して最初から")
+    parser.add_argument("--partitions", type=int, default=1, help="IDの範囲の分割数")
+    parser.add_argument(
+        "--partition-index", type=int, default=None, help="このプロセスで処理するパーティション"
+    )
+    parser.add_argument("--range-start", type=int, default=None, help="担当範囲の下限（以上）")
+    parser.add_argument("--range-end", type=int, default=None, help="担当範囲の上限（未満）")
+    parser.add_argument(
+        "--plan", action="store_true", help="分割結果をJSONで出力して終了（Mapステートの入力用）"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="並列プロセス数（既定: パーティション数とCPU数の小さい方）",
+    )
+    parser.add_argument(
+        "--run-id", default=None, help="実行ID（同じIDでのリトライは完了済みの範囲をスキップ）"
+    )
+    defaults = ProfilingOptions.from_settings()
+    parser.add_argument(
+        "--profile-cpu", action="store_true", default=defaults.cpu, help="cProfileで計測"
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        default=defaults.memory,
+        help="tracemallocでメモリのピークと確保箇所を計測",
+    )
+    parser.add_argument(
+        "--profile-sql", action="store_true", default=defaults.sql, help="SQL文ごとの実行時間を計測"
+    )
+    parser.add_argument(
+        "--profile-s3-prefix",
+        default=defaults.s3_prefix,
+        help="計測結果をアップロードするS3のプレフィックス",
+    )
+    args = parser.parse_args(argv)
+    partition_args = (args.partition_index, args.range_start, args.range_end)
+    if args.partitions <= 1 and any(value is not None for value in partition_args):
+        parser.error("--partition-index/--range-start/--range-end require --partitions > 1")
+    if args.partition_index is not None and not 0 <= args.partition_index < args.partitions:
+        parser.error("--partition-index must be in the range [0, --partitions)")
+    profiling = ProfilingOptions(
+        cpu=args.profile_cpu,
+        memory=args.profile_memory,
+        sql=args.profile_sql,
+        top_n=defaults.top_n,
+        s3_prefix=args.profile_s3_prefix,
+    )
+
+    if args.plan:
+        planned = plan_partitions(TrimExampleNamesJob(), args.partitions)
+        items = [
+            {"partition_index": i, "range_start": r.start, "range_end": r.end}
+            for i, r in enumerate(planned.values())
+        ]
+        print(json.dumps(items))
+        return 0
+
     start_time = datetime.now(timezone.utc)
     logger.info("=" * 50)
     logger.info("Batch execution started")
@@ -106,33 +228,24 @@ def main() -> int:
     logger.info(f"Start time: {start_time.isoformat()}")
     logger.info("=" * 50)
 
-    db = None
     try:
-        # データベースセッション取得
-        logger.info("Connecting to database...")
-        db = get_db_session()
-        logger.info("Database connection established")
-
-        # サンプル処理1: データ参照
-        table_count = sample_select_query(db)
-
-        # サンプル処理2: データ登録
-        sample_insert_query(
-            db,
-            {
-                "execution_time": start_time.isoformat(),
-                "table_count": table_count,
-            },
-        )
-
-        # 処理完了
-        end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
+        job = TrimExampleNamesJob()
+        if args.partitions > 1:
+            result = run_parallel(job, args, profiling)
+        else:
+            runner = BatchRunner(get_session_factory(), chunk_size=args.chunk_size)
+            with profiling_context(job.name, profiling):
+                result = runner.run(job, restart=args.restart, run_id=args.run_id)
 
         logger.info("=" * 50)
         logger.info("Batch execution completed successfully")
-        logger.info(f"End time: {end_time.isoformat()}")
-        logger.info(f"Duration: {duration:.2f} seconds")
+        logger.info(
+            f"Rows processed: {result.rows_processed}, updated: {result.rows_affected}, "
+            f"chunks: {result.chunks}, resumed from: {result.resumed_from}"
+        )
+        logger.info(
+            f"Duration: {result.seconds:.2f} seconds ({result.rows_per_second:.0f} rows/s)"
+        )
         logger.info("=" * 50)
 
         return 0
@@ -143,10 +256,6 @@ def main() -> int:
     except Exception as e:
         logger.error(f"Batch execution failed: {str(e)}", exc_info=True)
         return 1
-    finally:
-        if db:
-            db.close()
-            logger.info("Database connection closed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+一覧取得の読み取り経路のベンチマーク
+
+ORMモデル経由（Session.query → ExampleModel → Example）と、
+列のSELECT結果から直接Exampleを作る経路（ExampleRepository.find_all）について、
+1行あたりの時間とメモリ割り当てのピークを比較し、結果をJSONで出力します。
+--validateを指定するとExampleResponseへの変換（APIのレスポンス生成）も含めて計測します。
+
+既定ではインメモリのSQLiteを使います。--database-urlで既存のDBを指定した場合は
+examplesテーブルの既存データを読み取るだけで、行の追加は行いません。
+
+Usage:
+    python scripts/benchmark_example_reads.py [--rows 50000] [--runs 5] [--validate]
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.domain.example import Example  # noqa: E402
+from app.infrastructure.database.models import Base, ExampleModel, utc_now  # noqa: E402
+from app.infrastructure.repositories.example_repository import ExampleRepository  # noqa: E402
+from app.schemas.example import ExampleResponse  # noqa: E402
+
+
+def read_orm(db: Session) -> list[Example]:
+    """ORMモデルを読み込んでからエンティティに変換する（従来の経路）"""
+    return [
+        Example(
+            id=m.id,
+            name=m.name,
+            description=m.description,
+            created_at=m.created_at,
+            updated_at=m.updated_at,
+        )
+        for m in db.query(ExampleModel).all()
+    ]
+
+
+def read_core(db: Session) -> list[Example]:
+    """列のSELECT結果から直接エンティティを作る"""
+    return ExampleRepository(db).find_all()
+
+
+def measure(
+    session_factory: sessionmaker, read: Callable[[Session], list], runs: int, validate: bool
+) -> dict:
+    """runs回計測し、中央値の時間と割り当てのピークを返す"""
+
+    def run_once() -> int:
+        with session_factory() as db:
+            examples = read(db)
+            if validate:
+                examples = [ExampleResponse.model_validate(e) for e in examples]
+            return len(examples)
+
+    samples = []
+    for _ in range(runs):
+        gc.collect()
+        started = time.perf_counter()
+        rows = run_once()
+        samples.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    run_once()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(samples)
+    return {
+        "rows": rows,
+        "median_seconds": round(median, 4),
+        "us_per_row": round(median / rows * 1e6, 3) if rows else 0.0,
+        "peak_bytes": peak,
+        "bytes_per_row": round(peak / rows) if rows else 0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="一覧取得の読み取り経路のベンチマーク")
+    parser.add_argument("--rows", type=int, default=50000, help="SQLiteに投入する行数")
+    parser.add_argument("--runs", type=int, default=5, help="計測回数")
+    parser.add_argument("--validate", action="store_true", help="ExampleResponseへの変換も含める")
+    parser.add_argument("--database-url", default=None, help="計測対象のDB（既定: SQLite）")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url or "sqlite://")
+    if args.database_url is None:
+        Base.metadata.create_all(engine)
+        now = utc_now()
+        with engine.begin() as conn:
+            conn.execute(
+                insert(ExampleModel),
+                [
+                    {
+                        "name": f"Example {i}",
+                        "description": "x" * 40,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for i in range(args.rows)
+                ],
+            )
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    orm = measure(session_factory, read_orm, args.runs, args.validate)
+    core = measure(session_factory, read_core, args.runs, args.validate)
+    report = {
+        "validate": args.validate,
+        "orm": orm,
+        "core": core,
+        "speedup": round(orm["median_seconds"] / core["median_seconds"], 2)
+        if core["median_seconds"]
+        else None,
+        "saved_us_per_row": round(orm["us_per_row"] - core["us_per_row"], 3),
+        "saved_bytes_per_row": orm["bytes_per_row"] - core["bytes_per_row"],
+    }
+    print(json.dumps(report, indent=2))
+    engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
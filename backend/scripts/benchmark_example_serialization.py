@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+一覧レスポンスのJSON化のベンチマーク
+
+GET /examples/ のレスポンス生成について、以下の方式の1件あたりの時間を比較し、JSONで出力します。
+
+- jsonable_encoder: ExamplePageに検証（from_attributes）→ jsonable_encoder → json.dumps
+  （response_classを指定した場合や、dump_jsonの高速化がないFastAPIの経路）
+- validate_dump_json: ExamplePageに検証 → dump_json（新しいFastAPIの既定の経路）
+- type_adapter: TypeAdapterJSONResponse（ExamplePageに検証 → dump_json、再検証なし）
+
+Usage:
+    python scripts/benchmark_example_serialization.py [--items 1000] [--runs 50]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.api.v1.endpoints.examples import EXAMPLE_PAGE_JSON  # noqa: E402
+from app.core.responses import TypeAdapterJSONResponse  # noqa: E402
+from app.domain.example import Example  # noqa: E402
+from app.schemas.example import ExamplePage  # noqa: E402
+
+PAGE_ADAPTER = TypeAdapter(ExamplePage)
+
+
+def serialize_jsonable_encoder(examples: list[Example]) -> bytes:
+    page = ExamplePage.model_validate(
+        {"items": examples, "next_cursor": None}, from_attributes=True
+    )
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+def serialize_validate_dump_json(examples: list[Example]) -> bytes:
+    page = PAGE_ADAPTER.validate_python(
+        {"items": examples, "next_cursor": None}, from_attributes=True
+    )
+    return PAGE_ADAPTER.dump_json(page)
+
+
+def serialize_type_adapter(examples: list[Example]) -> bytes:
+    content = {"items": examples, "next_cursor": None}
+    return TypeAdapterJSONResponse(content, EXAMPLE_PAGE_JSON).body
+
+
+def measure(serialize: Callable[[list[Example]], bytes], examples: list[Example], runs: int):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        serialize(examples)
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    return {
+        "median_seconds": round(median, 6),
+        "us_per_item": round(median / len(examples) * 1e6, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="一覧レスポンスのJSON化のベンチマーク")
+    parser.add_argument("--items", type=int, default=1000, help="1ページの件数")
+    parser.add_argument("--runs", type=int, default=50, help="計測回数")
+    args = parser.parse_args()
+
+    now = datetime.now(UTC)
+    examples = [
+        Example(id=i, name=f"Example {i}", description="x" * 40, created_at=now, updated_at=now)
+        for i in range(1, args.items + 1)
+    ]
+    # 各方式の出力が同じJSONになることを確認してから計測する
+    outputs = {
+        json.dumps(json.loads(serialize(examples)), sort_keys=True)
+        for serialize in (
+            serialize_jsonable_encoder,
+            serialize_validate_dump_json,
+            serialize_type_adapter,
+        )
+    }
+    if len(outputs) != 1:
+        print("Serialized outputs differ", file=sys.stderr)
+        return 1
+
+    baseline = measure(serialize_jsonable_encoder, examples, args.runs)
+    results = {
+        "jsonable_encoder": baseline,
+        "validate_dump_json": measure(serialize_validate_dump_json, examples, args.runs),
+        "type_adapter": measure(serialize_type_adapter, examples, args.runs),
+    }
+    for result in results.values():
+        result["speedup"] = round(baseline["median_seconds"] / result["median_seconds"], 2)
+    print(json.dumps({"items": args.items, "runs": args.runs, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
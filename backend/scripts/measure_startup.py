@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+起動時間計測スクリプト
+
+新しいPythonプロセスでapp.mainのimport（アプリケーション構築を含む）にかかる時間を
+複数回計測し、結果をJSONで出力します。Fargateのコールドスタート悪化の検知に使います。
+--max-secondsを指定すると中央値が超えた場合に終了コード1を返します。
+
+Usage:
+    python scripts/measure_startup.py [--runs 5] [--top 10] [--max-seconds 2.0]
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+MEASURE_CODE = (
+    "import time; started = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure_once() -> float:
+    """1回分のimport時間（秒）"""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> list[dict]:
+    """-X importtimeの出力から累積時間の大きいトップレベルモジュールを返す"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)", line)
+        # インデントが2段以内のモジュール（app.mainから直接・間接に読み込まれたもの）
+        if match and len(match.group(2)) <= 2:
+            modules.append({"module": match.group(3), "seconds": int(match.group(1)) / 1e6})
+    return sorted(modules, key=lambda m: m["seconds"], reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="app.mainのimport・構築時間を計測")
+    parser.add_argument("--runs", type=int, default=5, help="計測回数")
+    parser.add_argument("--top", type=int, default=10, help="表示する遅いimportの件数")
+    parser.add_argument("--max-seconds", type=float, default=None, help="中央値の上限")
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+    median = statistics.median(samples)
+    report = {
+        "runs": args.runs,
+        "median_seconds": round(median, 3),
+        "min_seconds": round(min(samples), 3),
+        "max_seconds": round(max(samples), 3),
+        "slowest_imports": slowest_imports(args.top),
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"Startup regression: {median:.3f}s > {args.max_seconds:.3f}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from app.infrastructure.database.models import ExampleModel, utc_now
+from batch.profiling import BatchProfiler, ProfilingOptions
+from batch.runner import BatchRunner
+from batch.sample_batch import TrimExampleNamesJob
+from tests.integration.conftest import TestingSessionLocal
+
+
+def add_examples(count: int) -> None:
+    with TestingSessionLocal() as db:
+        now = utc_now()
+        db.add_all(
+            ExampleModel(name=f" name {i} ", created_at=now, updated_at=now)
+            for i in range(count)
+        )
+        db.commit()
+
+
+def test_profiles_cpu_memory_and_sql(test_db):
+    add_examples(5)
+    options = ProfilingOptions(cpu=True, memory=True, sql=True, top_n=5)
+
+    with BatchProfiler("trim_example_names", options) as profiler:
+        BatchRunner(TestingSessionLocal, chunk_size=2).run(TrimExampleNamesJob())
+
+    result = profiler.result
+    assert result["job"] == "trim_example_names"
+    assert 0 < len(result["cpu"]["top"]) <= 5
+    assert result["memory"]["peak_bytes"] > 0
+    assert result["sql"]["statements"] > 0
+    assert any("UPDATE examples" in s["statement"] for s in result["sql"]["top"])
+
+
+def test_sql_listener_is_removed_after_exit(test_db):
+    with BatchProfiler("job", ProfilingOptions(sql=True)) as profiler:
+        pass
+    add_examples(1)
+
+    assert profiler.result["sql"]["statements"] == 0
+
+
+def test_upload_failure_does_not_fail_batch(test_db):
+    options = ProfilingOptions(cpu=True, s3_prefix="profiles")
+    with patch.object(BatchProfiler, "upload", side_effect=RuntimeError("no bucket")) as upload:
+        with BatchProfiler("job", options):
+            pass
+
+    upload.assert_called_once()
+
+
+def test_upload_writes_summary_and_cpu_profile(test_db):
+    options = ProfilingOptions(cpu=True, s3_prefix="profiles/")
+    with patch("batch.profiling.S3Client") as s3_client:
+        s3_client.return_value.bucket = "bucket"
+        with BatchProfiler("job[0/2]", options):
+            pass
+
+    keys = [c.args[1] for c in s3_client.return_value.upload_bytes.call_args_list]
+    assert len(keys) == 2
+    assert keys[0].startswith("profiles/job[0_2]/") and keys[0].endswith("/summary.json")
+    assert keys[1].endswith("/cpu.prof")
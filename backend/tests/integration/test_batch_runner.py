@@ -0,0 +1,154 @@
+from collections.abc import Sequence
+
+import pytest
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models import BatchStateModel, ExampleModel, utc_now
+from batch.runner import (
+    BatchRunner,
+    KeyRange,
+    aggregate_results,
+    run_partitions,
+    split_key_range,
+)
+from batch.sample_batch import TrimExampleNamesJob, main
+from tests.integration.conftest import SQLALCHEMY_DATABASE_URL, TestingSessionLocal
+
+
+class FailingTrimJob(TrimExampleNamesJob):
+    """fail_after件目のチャンクで失敗するジョブ"""
+
+    def __init__(self, fail_after: int):
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def process_chunk(self, db: Session, rows: Sequence[Row]) -> int:
+        self.calls += 1
+        if self.calls == self.fail_after:
+            raise RuntimeError("worker stopped")
+        return super().process_chunk(db, rows)
+
+
+@pytest.fixture
+def examples(test_db):
+    with TestingSessionLocal() as db:
+        now = utc_now()
+        db.add_all(
+            ExampleModel(name=f"  name {i} ", created_at=now, updated_at=now) for i in range(5)
+        )
+        db.commit()
+
+
+def names() -> list[str]:
+    with TestingSessionLocal() as db:
+        return [m.name for m in db.query(ExampleModel).order_by(ExampleModel.id)]
+
+
+def test_runs_all_chunks(examples):
+    result = BatchRunner(TestingSessionLocal, chunk_size=2).run(TrimExampleNamesJob())
+
+    assert (result.rows_processed, result.rows_affected, result.chunks) == (5, 5, 3)
+    assert names() == [f"name {i}" for i in range(5)]
+    with TestingSessionLocal() as db:
+        state = db.get(BatchStateModel, "trim_example_names")
+        assert (state.status, state.last_key) == ("completed", 5)
+
+
+def test_resumes_after_failure(examples):
+    runner = BatchRunner(TestingSessionLocal, chunk_size=2)
+
+    with pytest.raises(RuntimeError):
+        runner.run(FailingTrimJob(fail_after=2))
+    # 1チャンク目のみcommitされている
+    assert names()[:2] == ["name 0", "name 1"]
+    assert names()[2] == "  name 2 "
+
+    job = FailingTrimJob(fail_after=0)
+    result = runner.run(job)
+
+    assert result.resumed_from == 2
+    assert job.calls == 2
+    assert result.rows_processed == 5
+    assert names() == [f"name {i}" for i in range(5)]
+
+
+def test_completed_job_starts_over(examples):
+    runner = BatchRunner(TestingSessionLocal, chunk_size=10)
+    runner.run(TrimExampleNamesJob())
+
+    result = runner.run(TrimExampleNamesJob())
+
+    assert result.resumed_from is None
+    assert (result.rows_processed, result.rows_affected) == (5, 0)
+
+
+def test_blank_names_are_left_unchanged(test_db):
+    with TestingSessionLocal() as db:
+        now = utc_now()
+        db.add_all(
+            ExampleModel(name=name, created_at=now, updated_at=now) for name in ["   ", " a "]
+        )
+        db.commit()
+
+    result = BatchRunner(TestingSessionLocal, chunk_size=10).run(TrimExampleNamesJob())
+
+    # 空白のみの名前を空文字列にはしない
+    assert result.rows_affected == 1
+    assert names() == ["   ", "a"]
+
+
+def test_split_key_range(examples):
+    with TestingSessionLocal() as db:
+        ranges = split_key_range(db, ExampleModel.id, 2)
+
+    # 先頭は下限なし・末尾は上限なしで、後から追加された行も対象にする
+    assert ranges == [KeyRange(None, 4), KeyRange(4, None)]
+
+
+def test_partition_with_same_run_id_is_skipped(examples):
+    runner = BatchRunner(TestingSessionLocal, chunk_size=2)
+    job = TrimExampleNamesJob()
+
+    first = runner.run(job, key_range=KeyRange(None, 3), partition="0/2", run_id="run-1")
+    retried = runner.run(job, key_range=KeyRange(None, 3), partition="0/2", run_id="run-1")
+    next_run = runner.run(job, key_range=KeyRange(None, 3), partition="0/2", run_id="run-2")
+
+    assert (first.rows_processed, first.skipped) == (2, False)
+    assert retried.skipped is True
+    assert (next_run.rows_processed, next_run.skipped) == (2, False)
+    assert names()[2:] == [f"  name {i} " for i in range(2, 5)]
+
+
+def test_run_partitions_in_processes(examples):
+    ranges = {"0/2": KeyRange(None, 3), "1/2": KeyRange(3, None)}
+
+    results = run_partitions(
+        SQLALCHEMY_DATABASE_URL, TrimExampleNamesJob(), 2, ranges, workers=2, run_id="run-1"
+    )
+    total = aggregate_results("trim_example_names", results, seconds=1.0)
+
+    assert [r.job_name for r in results] == [
+        "trim_example_names[0/2]",
+        "trim_example_names[1/2]",
+    ]
+    assert (total.rows_processed, total.rows_affected) == (5, 5)
+    assert names() == [f"name {i}" for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--partition-index", "0"],
+        ["--range-start", "1", "--range-end", "10"],
+        ["--partitions", "2", "--partition-index", "2"],
+        ["--partitions", "2", "--partition-index", "-1"],
+    ],
+)
+def test_rejects_inconsistent_partition_arguments(argv, capsys):
+    # 担当範囲の指定が無視されて全件を処理しないよう、実行前に引数エラーとする
+    with pytest.raises(SystemExit) as exc_info:
+        main(argv)
+
+    assert exc_info.value.code == 2
+    assert "--partition" in capsys.readouterr().err
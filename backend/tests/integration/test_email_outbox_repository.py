@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from app.infrastructure.database.models import EmailOutboxModel, utc_now
+from app.infrastructure.repositories.email_outbox_repository import EmailOutboxRepository
+from tests.integration.conftest import TestingSessionLocal
+
+
+def test_add_is_committed_with_caller_transaction(test_db):
+    with TestingSessionLocal() as db:
+        repository = EmailOutboxRepository(db)
+        repository.add("a@example.com", "subject", "body", "noreply@example.com")
+        db.rollback()
+        assert db.query(EmailOutboxModel).count() == 0
+
+        repository.add("a@example.com", "subject", "body", "noreply@example.com")
+        db.commit()
+        assert db.query(EmailOutboxModel).count() == 1
+
+
+def test_claim_due_leases_rows(test_db):
+    with TestingSessionLocal() as db:
+        repository = EmailOutboxRepository(db)
+        for i in range(3):
+            repository.add(f"user{i}@example.com", "subject", "body", "noreply@example.com")
+        db.commit()
+
+        claimed = repository.claim_due(limit=2, lease_seconds=300)
+        assert [e.to for e in claimed] == ["user0@example.com", "user1@example.com"]
+        assert all(e.attempts == 1 for e in claimed)
+
+        # リース中の行は再度確保されない
+        assert [e.to for e in repository.claim_due(limit=10, lease_seconds=300)] == [
+            "user2@example.com"
+        ]
+
+
+def test_mark_sent_and_failed(test_db):
+    with TestingSessionLocal() as db:
+        repository = EmailOutboxRepository(db)
+        repository.add("a@example.com", "subject", "body", "noreply@example.com")
+        repository.add("b@example.com", "subject", "body", "noreply@example.com")
+        db.commit()
+        first, second = repository.claim_due(limit=10, lease_seconds=300)
+
+        repository.mark_sent([first.id])
+        repository.mark_failed(second.id, "ConnectionError: refused", utc_now() - timedelta(1))
+
+        rows = {m.id: m for m in db.query(EmailOutboxModel)}
+        assert rows[first.id].status == "sent"
+        assert rows[first.id].sent_at is not None
+        assert rows[second.id].status == "pending"
+        assert rows[second.id].last_error == "ConnectionError: refused"
+        # 再送時刻に達していれば再度確保される
+        assert [e.id for e in repository.claim_due(limit=10, lease_seconds=300)] == [second.id]
@@ -0,0 +1,119 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects import postgresql
+
+from app.domain.example import Example
+from app.infrastructure.database.models import ExampleModel, UtcClock, utc_now
+from app.infrastructure.repositories.example_repository import ExampleRepository
+from batch.runner import BatchRunner
+from batch.sample_batch import TrimExampleNamesJob
+from tests.integration.conftest import TestingSessionLocal, engine
+
+
+def _example(name: str | None) -> Example:
+    now = datetime.now(UTC)
+    return Example(id=0, name=name, description=None, created_at=now, updated_at=now)
+
+
+def test_save_many_inserts_in_batches(test_db):
+    with TestingSessionLocal() as db:
+        repository = ExampleRepository(db)
+
+        saved = repository.save_many([_example(f"Example {i}") for i in range(5)], batch_size=2)
+
+        assert [r.example.name for r in saved] == [f"Example {i}" for i in range(5)]
+        assert len({r.example.id for r in saved}) == 5
+        assert len(repository.find_all()) == 5
+
+
+def test_save_many_reports_failed_rows(test_db):
+    with TestingSessionLocal() as db:
+        repository = ExampleRepository(db)
+
+        # nameはNOT NULL制約のため2件目のみ失敗する
+        saved = repository.save_many(
+            [_example("Example 1"), _example(None), _example("Example 3")], batch_size=10
+        )
+
+        assert saved[0].example is not None and saved[0].example.name == "Example 1"
+        assert saved[1].example is None
+        assert saved[1].error == "Constraint violation"
+        assert saved[2].example is not None and saved[2].example.name == "Example 3"
+        assert [e.name for e in repository.find_all()] == ["Example 1", "Example 3"]
+
+
+def test_reads_do_not_load_orm_instances(test_db):
+    with TestingSessionLocal() as db:
+        repository = ExampleRepository(db)
+        saved = repository.save_many([_example(f"Example {i}") for i in range(3)], batch_size=10)
+        db.expunge_all()
+
+        page = repository.find_page(limit=2, after_id=saved[0].example.id)
+        found = repository.find_by_id(saved[0].example.id)
+
+        assert [e.name for e in page] == ["Example 1", "Example 2"]
+        assert found == saved[0].example
+        # 列のSELECTのみのため、identity mapにモデルが登録されない
+        assert len(db.identity_map) == 0
+
+
+def test_find_changes_includes_bulk_updates(test_db):
+    with TestingSessionLocal() as db:
+        repository = ExampleRepository(db)
+        saved = repository.save_many([_example(f" Example {i}") for i in range(3)], batch_size=10)
+        last = repository.find_changes(limit=10)[-1]
+
+    # バッチの一括UPDATEでもupdated_atが進み、変更フィードに現れる
+    BatchRunner(TestingSessionLocal, chunk_size=2).run(TrimExampleNamesJob())
+
+    with TestingSessionLocal() as db:
+        changes = ExampleRepository(db).find_changes(
+            limit=10, after=(last.updated_at, last.id)
+        )
+    assert [e.id for e in changes] == [r.example.id for r in saved]
+    assert [e.name for e in changes] == [f"Example {i}" for i in range(3)]
+
+
+def test_save_and_update_name_use_one_statement_each(test_db):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with TestingSessionLocal() as db:
+            repository = ExampleRepository(db)
+            saved = repository.save(Example(id=0, name="Old", description=None))
+            updated = repository.update_name(saved.id, "New")
+            missing = repository.update_name(999, "New")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # 保存・更新ともにRETURNINGで値を受け取り、再SELECTしない
+    assert statements == ["INSERT", "UPDATE", "UPDATE"]
+    assert saved.id > 0 and saved.created_at is not None
+    assert (updated.id, updated.name, updated.created_at) == (saved.id, "New", saved.created_at)
+    assert updated.updated_at >= saved.updated_at
+    assert missing is None
+
+
+def test_find_changes_cutoff_uses_database_clock(test_db):
+    with TestingSessionLocal() as db:
+        now = utc_now()
+        db.execute(
+            insert(ExampleModel),
+            [{"name": "Old", "created_at": now, "updated_at": now - timedelta(minutes=2)}],
+        )
+        recent = ExampleRepository(db).save(Example(id=0, name="Recent", description=None))
+        db.commit()
+
+        changes = ExampleRepository(db).find_changes(limit=10, safety_lag_seconds=60)
+
+    assert [e.name for e in changes] == ["Old"]
+    # 列のデフォルトもDBの時計で設定される
+    assert abs(recent.updated_at - now) < timedelta(seconds=5)
+    # PostgreSQLではトリガーと同じclock_timestamp()を基準にする
+    cutoff = select(ExampleModel.id).where(ExampleModel.updated_at <= UtcClock(60))
+    assert "clock_timestamp()" in str(cutoff.compile(dialect=postgresql.dialect()))
@@ -1,3 +1,15 @@
+import csv
+import io
+import json
+
+from sqlalchemy import event
+
+from app.api.deps import example_cache
+from app.core.config import settings
+from app.schemas.example import ExamplePage, ExampleResponse
+from tests.integration.conftest import async_engine
+
+
 def test_create_example(client):
     response = client.post(
         "/api/v1/examples/", json={"name": "Test Example", "description": "Test Description"}
@@ -20,6 +32,41 @@ def test_get_example(client):
     assert response.json()["name"] == "Test Example"
 
 
+def test_update_example(client, monkeypatch):
+    monkeypatch.setattr(settings, "EXAMPLE_CACHE_ENABLED", True)
+    example_cache.clear()
+    try:
+        created = client.post("/api/v1/examples/", json={"name": "Old", "description": "D"})
+        created = created.json()
+        client.get(f"/api/v1/examples/{created['id']}")  # キャッシュに載せる
+
+        response = client.patch(f"/api/v1/examples/{created['id']}", json={"name": "New"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["name"], data["description"], data["created_at"]) == (
+            "New",
+            "D",
+            created["created_at"],
+        )
+        assert data["updated_at"] >= created["updated_at"]
+        # 更新時にキャッシュが破棄されるため、更新後の値を取得できる
+        fetched = client.get(f"/api/v1/examples/{created['id']}")
+        assert fetched.json() == data
+        assert fetched.headers["ETag"] == response.headers["ETag"]
+    finally:
+        example_cache.clear()
+
+
+def test_update_example_not_found_and_invalid_name(client):
+    created = client.post("/api/v1/examples/", json={"name": "Old"}).json()
+
+    assert client.patch("/api/v1/examples/999", json={"name": "New"}).status_code == 404
+    response = client.patch(f"/api/v1/examples/{created['id']}", json={"name": "  "})
+    assert response.status_code == 422
+    assert client.get(f"/api/v1/examples/{created['id']}").json()["name"] == "Old"
+
+
 def test_list_examples(client):
     # 複数作成
     client.post("/api/v1/examples/", json={"name": "Example 1"})
@@ -28,4 +75,212 @@ def test_list_examples(client):
     # 一覧取得
     response = client.get("/api/v1/examples/")
     assert response.status_code == 200
-    assert len(response.json()) == 2
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["next_cursor"] is None
+
+
+def test_responses_match_response_models(client):
+    # TypeAdapterJSONResponseで返しても、レスポンスはresponse_modelのスキーマと一致する
+    created = client.post("/api/v1/examples/", json={"name": "Example"}).json()
+    fetched = client.get(f"/api/v1/examples/{created['id']}").json()
+    page = client.get("/api/v1/examples/").json()
+
+    assert set(created) == set(ExampleResponse.model_fields)
+    assert ExampleResponse.model_validate(fetched).model_dump(mode="json") == fetched
+    assert ExamplePage.model_validate(page).model_dump(mode="json") == page
+
+
+def test_search_examples(client):
+    for name in ["My Apple", "apple pie", "Banana", "Apple", "100% apple"]:
+        client.post("/api/v1/examples/", json={"name": name})
+
+    response = client.get("/api/v1/examples/search", params={"q": "apple", "limit": 2})
+    assert response.status_code == 200
+    first = response.json()
+    rest = client.get(
+        "/api/v1/examples/search", params={"q": "apple", "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [e["name"] for e in first["items"]] == ["Apple", "apple pie"]
+    assert [e["name"] for e in rest["items"]] == ["My Apple", "100% apple"]
+    assert rest["next_cursor"] is None
+    # %・_はワイルドカードではなく文字として扱う
+    escaped = client.get("/api/v1/examples/search", params={"q": "0% a"}).json()
+    assert [e["name"] for e in escaped["items"]] == ["100% apple"]
+
+
+def test_search_examples_validates_query(client):
+    assert client.get("/api/v1/examples/search").status_code == 422
+    assert client.get("/api/v1/examples/search", params={"q": ""}).status_code == 422
+    response = client.get("/api/v1/examples/search", params={"q": "a", "cursor": "bad"})
+    assert response.status_code == 400
+
+
+def test_list_example_changes(client, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_LAG_SECONDS", 0)
+    ids = [client.post("/api/v1/examples/", json={"name": f"E{i}"}).json()["id"] for i in range(3)]
+
+    first = client.get("/api/v1/examples/changes", params={"limit": 2}).json()
+    rest = client.get("/api/v1/examples/changes", params={"since": first["next_cursor"]}).json()
+    empty = client.get("/api/v1/examples/changes", params={"since": rest["next_cursor"]}).json()
+
+    assert [e["id"] for e in first["items"]] == ids[:2]
+    assert first["has_more"] is True
+    assert [e["id"] for e in rest["items"]] == ids[2:]
+    assert rest["has_more"] is False
+    # 変更がない場合は同じカーソルを返す
+    assert empty == {"items": [], "next_cursor": rest["next_cursor"], "has_more": False}
+    assert client.get("/api/v1/examples/changes", params={"since": "bad"}).status_code == 400
+
+
+def test_list_example_changes_holds_back_recent_changes(client, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_LAG_SECONDS", 60)
+    client.post("/api/v1/examples/", json={"name": "Recent"})
+
+    response = client.get("/api/v1/examples/changes")
+
+    assert response.json() == {"items": [], "next_cursor": None, "has_more": False}
+
+
+def test_list_examples_paginates_with_cursor(client):
+    for i in range(5):
+        client.post("/api/v1/examples/", json={"name": f"Example {i}"})
+
+    first = client.get("/api/v1/examples/", params={"limit": 2}).json()
+    assert [e["name"] for e in first["items"]] == ["Example 0", "Example 1"]
+    assert first["next_cursor"] is not None
+
+    second = client.get(
+        "/api/v1/examples/", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert [e["name"] for e in second["items"]] == ["Example 2", "Example 3"]
+
+    third = client.get(
+        "/api/v1/examples/", params={"limit": 2, "cursor": second["next_cursor"]}
+    ).json()
+    assert [e["name"] for e in third["items"]] == ["Example 4"]
+    assert third["next_cursor"] is None
+
+
+def test_list_examples_invalid_cursor(client):
+    response = client.get("/api/v1/examples/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_export_examples_ndjson(client):
+    client.post("/api/v1/examples/", json={"name": "Example 1"})
+    client.post("/api/v1/examples/", json={"name": "Example 2", "description": "Desc"})
+
+    response = client.get("/api/v1/examples/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["name"] for line in lines] == ["Example 1", "Example 2"]
+    assert lines[1]["description"] == "Desc"
+
+
+def test_export_examples_csv(client):
+    client.post("/api/v1/examples/", json={"name": "Example 1"})
+
+    response = client.get("/api/v1/examples/export", params={"format": "csv"})
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id", "name", "description", "created_at", "updated_at"]
+    assert rows[1][1] == "Example 1"
+
+
+def test_export_examples_csv_empty_has_header(client):
+    response = client.get("/api/v1/examples/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["id,name,description,created_at,updated_at"]
+
+
+def test_create_examples_bulk(client):
+    response = client.post(
+        "/api/v1/examples/bulk",
+        json=[{"name": "Bulk 1"}, {"name": "Bulk 2", "description": "Desc"}],
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 0
+    assert [r["example"]["name"] for r in data["results"]] == ["Bulk 1", "Bulk 2"]
+    assert all(r["example"]["id"] for r in data["results"])
+
+    listed = client.get("/api/v1/examples/").json()
+    assert len(listed["items"]) == 2
+
+
+def test_create_examples_bulk_rejects_empty(client):
+    response = client.post("/api/v1/examples/bulk", json=[])
+    assert response.status_code == 422
+
+
+def test_get_example_with_cache_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "EXAMPLE_CACHE_ENABLED", True)
+    example_cache.clear()
+    try:
+        assert client.get("/api/v1/examples/1").status_code == 404
+        create_response = client.post("/api/v1/examples/", json={"name": "Cached"})
+        example_id = create_response.json()["id"]
+
+        # 作成時に否定キャッシュが破棄されるため取得できる
+        assert client.get(f"/api/v1/examples/{example_id}").json()["name"] == "Cached"
+        hits = example_cache.stats()["hits"]
+        assert client.get(f"/api/v1/examples/{example_id}").json()["name"] == "Cached"
+        assert example_cache.stats()["hits"] == hits + 1
+    finally:
+        example_cache.clear()
+
+
+def test_get_example_etag_not_modified(client):
+    example_id = client.post("/api/v1/examples/", json={"name": "Test"}).json()["id"]
+
+    response = client.get(f"/api/v1/examples/{example_id}")
+    etag = response.headers["etag"]
+
+    not_modified = client.get(f"/api/v1/examples/{example_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    modified = client.get(f"/api/v1/examples/{example_id}", headers={"If-None-Match": '"stale"'})
+    assert modified.status_code == 200
+    assert modified.json()["name"] == "Test"
+
+
+def test_list_examples_without_if_none_match_uses_one_query(client):
+    for i in range(3):
+        client.post("/api/v1/examples/", json={"name": f"Example {i}"})
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/examples/?limit=2")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    # 集計を行わず、取得したページ（次ページ判定の1件を含む）からETagを作る
+    assert len(statements) == 1
+    etag = response.headers["etag"]
+    not_modified = client.get("/api/v1/examples/?limit=2", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+
+def test_list_examples_etag_changes_on_insert(client):
+    client.post("/api/v1/examples/", json={"name": "Example 1"})
+    etag = client.get("/api/v1/examples/").headers["etag"]
+
+    not_modified = client.get("/api/v1/examples/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    client.post("/api/v1/examples/", json={"name": "Example 2"})
+    modified = client.get("/api/v1/examples/", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert len(modified.json()["items"]) == 2
+    assert modified.headers["etag"] != etag
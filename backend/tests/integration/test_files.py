@@ -0,0 +1,91 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.api.deps import get_s3_client, presign_cache
+from app.infrastructure.storage.s3_client import MB, S3Client
+from app.main import app
+
+
+class RecordingS3Client(S3Client):
+    """マルチパートのAPI呼び出しを記録し、署名のみ実際に行うS3Client"""
+
+    def __init__(self):
+        super().__init__()
+        self.presign_get_calls = 0
+        self.completed: list = []
+
+    def presign_get(self, object_name: str, expires_in: int) -> str:
+        self.presign_get_calls += 1
+        return super().presign_get(object_name, expires_in)
+
+    def create_multipart_upload(self, object_name: str, content_type: str) -> str:
+        return "upload-1"
+
+    def complete_multipart_upload(self, object_name, upload_id, parts) -> None:
+        self.completed.append((object_name, upload_id, parts))
+
+
+@pytest.fixture
+def s3(client):
+    s3_client = RecordingS3Client()
+    app.dependency_overrides[get_s3_client] = lambda: s3_client
+    presign_cache.clear()
+    return s3_client
+
+
+def test_upload_url_signs_size_and_type(client, s3):
+    response = client.post(
+        "/api/v1/files/upload-url",
+        json={"filename": "../report.csv", "content_type": "text/csv", "size": 42},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["method"] == "PUT"
+    assert data["key"].startswith("uploads/") and data["key"].endswith("/report.csv")
+    assert data["headers"] == {"Content-Type": "text/csv", "Content-Length": "42"}
+    query = parse_qs(urlparse(data["url"]).query)
+    assert query["X-Amz-SignedHeaders"] == ["content-length;content-type;host"]
+
+
+def test_upload_url_rejects_too_large(client, s3):
+    response = client.post(
+        "/api/v1/files/upload-url", json={"filename": "big.bin", "size": 10 * 1024 * MB}
+    )
+    assert response.status_code == 422
+
+
+def test_download_url_is_cached(client, s3):
+    first = client.get("/api/v1/files/download-url", params={"key": "uploads/a/file.txt"})
+    second = client.get("/api/v1/files/download-url", params={"key": "uploads/a/file.txt"})
+    assert first.status_code == 200
+    assert first.json()["url"] == second.json()["url"]
+    assert s3.presign_get_calls == 1
+
+
+def test_download_url_rejects_key_outside_prefix(client, s3):
+    response = client.get("/api/v1/files/download-url", params={"key": "private/secret.txt"})
+    assert response.status_code == 400
+
+
+def test_multipart_upload_parts(client, s3):
+    size = 12 * MB
+    response = client.post(
+        "/api/v1/files/multipart", json={"filename": "video.mp4", "size": size}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["upload_id"] == "upload-1"
+    assert [p["part_number"] for p in data["parts"]] == [1, 2]
+    assert sum(p["size"] for p in data["parts"]) == size
+
+    response = client.post(
+        "/api/v1/files/multipart/complete",
+        json={
+            "key": data["key"],
+            "upload_id": "upload-1",
+            "parts": [{"part_number": 2, "etag": "b"}, {"part_number": 1, "etag": "a"}],
+        },
+    )
+    assert response.status_code == 204
+    assert s3.completed == [(data["key"], "upload-1", [(1, "a"), (2, "b")])]
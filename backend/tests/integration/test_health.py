@@ -1,4 +1,49 @@
+import asyncio
+
+from app.api.deps import health_monitor
+
+
 def test_health_check(client):
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
+
+
+def test_liveness(client):
+    response = client.get("/api/v1/health/live")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_readiness_serves_cached_result(client, monkeypatch):
+    calls = []
+
+    async def probe() -> None:
+        calls.append(1)
+
+    monkeypatch.setattr(health_monitor, "probes", {"database": probe})
+    monkeypatch.setattr(health_monitor, "results", {})
+
+    # バックグラウンドでの確認前はready扱いにしない
+    assert client.get("/api/v1/health/ready").status_code == 503
+
+    asyncio.run(health_monitor.run_once())
+    for _ in range(3):
+        response = client.get("/api/v1/health/ready")
+        assert response.status_code == 200
+        assert response.json()["checks"]["database"]["ok"] is True
+    # リクエストごとにはプローブを実行しない
+    assert len(calls) == 1
+
+
+def test_readiness_reports_failed_probe(client, monkeypatch):
+    async def failing_probe() -> None:
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(health_monitor, "probes", {"database": failing_probe})
+    monkeypatch.setattr(health_monitor, "results", {})
+
+    asyncio.run(health_monitor.run_once())
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["error"] == "ConnectionError: refused"
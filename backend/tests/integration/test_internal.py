@@ -0,0 +1,8 @@
+def test_db_pool_stats(client):
+    response = client.get("/api/v1/internal/db-pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert "primary_async" in data
+    assert {"checked_out", "overflow", "wait_seconds_max", "timeouts"} <= set(
+        data["primary_async"]
+    )
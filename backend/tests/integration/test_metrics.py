@@ -0,0 +1,58 @@
+from app.api.v1.endpoints import examples
+from app.core.metrics import _route_label
+
+
+def test_server_timing_header(client):
+    response = client.get("/api/v1/examples/")
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    assert "db;dur=" in server_timing
+    assert "total;dur=" in server_timing
+
+
+def test_metrics_endpoint(client):
+    client.get("/api/v1/examples/")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/api/v1/examples/",status="200"}' in body
+    assert "http_request_duration_seconds_bucket" in body
+    assert "http_requests_in_progress" in body
+    assert 'db_pool_checked_out{pool="primary_async"}' in body
+    assert 'cache_hits_total{cache="examples"}' in body
+
+
+def test_unmatched_route_label(client):
+    client.get("/no-such-path")
+
+    body = client.get("/metrics").text
+    assert 'route="<unmatched>",status="404"' in body
+
+
+def test_route_label_uses_path_template(client):
+    client.get("/api/v1/examples/12345")
+
+    body = client.get("/metrics").text
+    assert 'route="/api/v1/examples/{example_id}",status="404"' in body
+
+
+def test_route_label_ignores_unnormalized_path_params(client):
+    # 0埋めや符号付きのIDでもルートのテンプレートで集計し、ラベル数を増やさない
+    for path in ["/api/v1/examples/0001", "/api/v1/examples/+7"]:
+        client.get(path)
+
+    body = client.get("/metrics").text
+    assert 'route="/api/v1/examples/{example_id}",status="404"' in body
+    assert 'route="/api/v1/examples/0001"' not in body
+    assert 'route="/api/v1/examples/+7"' not in body
+
+
+def test_route_label_does_not_depend_on_path_param_values():
+    # パスパラメータを変換した値（int）がリクエストパスの表記と一致しない場合もテンプレートにする
+    [route] = [
+        r for r in examples.router.routes if r.path == "/{example_id}" and "GET" in r.methods
+    ]
+    for path, example_id in [("/api/v1/examples/0001", 1), ("/api/v1/examples/+7", 7)]:
+        scope = {"route": route, "path": path, "path_params": {"example_id": example_id}}
+        assert _route_label(scope) == "/api/v1/examples/{example_id}"
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import MISSING, TTLCache
+from app.domain.example import Example
+from app.infrastructure.database.models import EmailOutboxModel, ExampleModel
+from app.infrastructure.database.unit_of_work import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.repositories.cached_example_repository import CachedExampleRepository
+from app.infrastructure.repositories.example_repository import ExampleRepository
+from tests.integration.conftest import (
+    TestingAsyncSessionLocal,
+    TestingSessionLocal,
+    async_engine,
+)
+
+
+def count(model) -> int:
+    with TestingSessionLocal() as db:
+        return db.query(model).count()
+
+
+async def test_commit_writes_examples_and_outbox_together(test_db):
+    async with TestingAsyncSessionLocal() as db, AsyncSqlAlchemyUnitOfWork(db) as uow:
+        await uow.outbox.add("admin@example.com", "Created", "body", "noreply@example.com")
+        await uow.examples.save(Example(id=0, name="First", description=None))
+        await uow.examples.save(Example(id=0, name="Second", description=None))
+        await uow.commit()
+
+    assert (count(ExampleModel), count(EmailOutboxModel)) == (2, 1)
+
+
+async def test_exit_without_commit_discards_writes(test_db):
+    async with TestingAsyncSessionLocal() as db:
+        with pytest.raises(RuntimeError):
+            async with AsyncSqlAlchemyUnitOfWork(db) as uow:
+                await uow.outbox.add("admin@example.com", "Created", "body", "noreply@example.com")
+                await uow.examples.save(Example(id=0, name="First", description=None))
+                raise RuntimeError("failed after save")
+
+        async with AsyncSqlAlchemyUnitOfWork(db) as uow:
+            await uow.examples.save(Example(id=0, name="Not committed", description=None))
+
+    assert (count(ExampleModel), count(EmailOutboxModel)) == (0, 0)
+
+
+async def test_async_unit_of_work_commits_once(test_db):
+    async with TestingAsyncSessionLocal() as db:
+        async with AsyncSqlAlchemyUnitOfWork(db) as uow:
+            saved = await uow.examples.save_many(
+                [Example(id=0, name=f"Example {i}", description=None) for i in range(3)],
+                batch_size=2,
+            )
+            await uow.commit()
+
+    assert [r.example.name for r in saved] == [f"Example {i}" for i in range(3)]
+    assert count(ExampleModel) == 3
+
+
+async def test_cache_is_evicted_only_after_commit(test_db):
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    async with TestingAsyncSessionLocal() as db, AsyncSqlAlchemyUnitOfWork(db) as uow:
+        example = await uow.examples.save(Example(id=0, name="Old", description=None))
+        await uow.commit()
+
+    def repository_factory(session):
+        return CachedExampleRepository(ExampleRepository(session), cache, None, uow.after_commit)
+
+    async with TestingAsyncSessionLocal() as db:
+        async with AsyncSqlAlchemyUnitOfWork(db, repository_factory) as uow:
+            assert (await uow.examples.find_by_id(example.id)).name == "Old"
+            await uow.examples.update_name(example.id, "Rolled back")
+        # rollback時は破棄しない（DBの値は変わっていない）
+        assert cache.get(example.id).name == "Old"
+
+        async with AsyncSqlAlchemyUnitOfWork(db, repository_factory) as uow:
+            await uow.examples.update_name(example.id, "New")
+            # commit前に破棄すると、他のリクエストが古い値を再びキャッシュし得る
+            assert cache.get(example.id).name == "Old"
+            await uow.commit()
+        assert cache.get(example.id) is MISSING
+
+
+async def test_bound_datetimes_are_naive_utc(test_db):
+    bound = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # 型変換前の値（Python側のdefaultを含む）を記録する
+        for params in context.compiled_parameters:
+            bound.extend(v for v in params.values() if isinstance(v, datetime))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with TestingAsyncSessionLocal() as db, AsyncSqlAlchemyUnitOfWork(db) as uow:
+            await uow.outbox.add("admin@example.com", "Created", "body", "noreply@example.com")
+            await uow.examples.save(Example(id=0, name="First", description=None))
+            await uow.examples.save_many(
+                [Example(id=0, name="Second", description=None)], batch_size=10
+            )
+            await uow.commit()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    # 列はタイムゾーンなしのため、asyncpgでも失敗しないようtzinfoなしでバインドする
+    assert bound
+    assert all(value.tzinfo is None for value in bound)
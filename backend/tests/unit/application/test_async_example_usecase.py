@@ -0,0 +1,229 @@
+from datetime import datetime
+
+import pytest
+
+from app.application.async_example_usecase import AsyncExampleUseCase
+from app.schemas.example import ExampleCreate
+from tests.unit.mocks.mock_unit_of_work import MockAsyncUnitOfWork
+
+
+class TestAsyncExampleUseCase:
+    """AsyncExampleUseCaseのユニットテスト"""
+
+    def setup_method(self):
+        """各テストメソッド実行前に呼ばれる"""
+        self.uow = MockAsyncUnitOfWork()
+        self.mock_repo = self.uow.examples
+        self.usecase = AsyncExampleUseCase(self.uow)
+
+    async def test_create_example_success(self):
+        """サンプル作成の正常系テスト"""
+        data = ExampleCreate(name="Test Example", description="Test Description")
+
+        result = await self.usecase.create_example(data)
+
+        assert result.id == 1  # 自動採番
+        assert result.name == "Test Example"
+        assert result.description == "Test Description"
+        assert isinstance(result.created_at, datetime)
+        assert isinstance(result.updated_at, datetime)
+
+    async def test_create_example_saves_to_repository(self):
+        """サンプル作成時にリポジトリに保存される"""
+        data = ExampleCreate(name="Test Example", description="Test Description")
+
+        await self.usecase.create_example(data)
+
+        # リポジトリにデータが保存されていることを確認
+        saved_examples = await self.mock_repo.find_all()
+        assert len(saved_examples) == 1
+        assert saved_examples[0].name == "Test Example"
+
+    async def test_create_multiple_examples(self):
+        """複数のサンプルを作成できる"""
+        result1 = await self.usecase.create_example(ExampleCreate(name="Example 1"))
+        result2 = await self.usecase.create_example(ExampleCreate(name="Example 2"))
+
+        assert result1.id == 1
+        assert result2.id == 2
+        assert len(await self.mock_repo.find_all()) == 2
+
+    async def test_create_example_without_description(self):
+        """descriptionなしでの作成"""
+        result = await self.usecase.create_example(ExampleCreate(name="Test Example"))
+
+        assert result.name == "Test Example"
+        assert result.description is None
+
+    async def test_create_examples_bulk(self):
+        """一括作成で入力順にIDが採番される"""
+        data = [ExampleCreate(name=f"Example {i}") for i in range(3)]
+
+        results = await self.usecase.create_examples(data, batch_size=2)
+
+        assert [r.example.id for r in results] == [1, 2, 3]
+        assert [r.example.name for r in results] == ["Example 0", "Example 1", "Example 2"]
+        assert len(await self.mock_repo.find_all()) == 3
+
+    async def test_get_example_success(self):
+        """サンプル取得の正常系テスト"""
+        created = await self.usecase.create_example(ExampleCreate(name="Test"))
+
+        result = await self.usecase.get_example(created.id)
+
+        assert result is not None
+        assert result.id == created.id
+        assert result.name == "Test"
+
+    async def test_get_example_not_found(self):
+        """存在しないIDでの取得はNoneを返す"""
+        assert await self.usecase.get_example(999) is None
+
+    async def test_list_examples_empty(self):
+        """データがない場合は空リストを返す"""
+        assert await self.usecase.list_examples() == []
+
+    async def test_list_examples_with_data(self):
+        """複数データの一覧取得"""
+        for i in range(1, 4):
+            await self.usecase.create_example(ExampleCreate(name=f"Example {i}"))
+
+        result = await self.usecase.list_examples()
+
+        assert [e.name for e in result] == ["Example 1", "Example 2", "Example 3"]
+
+    async def test_list_examples_page(self):
+        """キーセットページングで次ページのIDを返す"""
+        for i in range(3):
+            await self.usecase.create_example(ExampleCreate(name=f"Example {i}"))
+
+        items, next_id, version = await self.usecase.list_examples_page(limit=2)
+        rest, last_id, _ = await self.usecase.list_examples_page(limit=2, after_id=next_id)
+
+        assert [e.id for e in items] == [1, 2]
+        assert next_id == 2
+        assert [e.id for e in rest] == [3]
+        assert last_id is None
+        # 次ページ判定用の1件を含めた範囲で集計した値と一致する
+        assert version == await self.usecase.get_page_version(limit=2)
+
+    async def test_search_examples_ranks_exact_prefix_substring(self):
+        """検索結果は完全一致・前方一致・部分一致の順（大文字小文字を区別しない）"""
+        for name in ["My Apple", "apple pie", "Banana", "Apple"]:
+            await self.usecase.create_example(ExampleCreate(name=name))
+
+        items, next_offset = await self.usecase.search_examples("apple", limit=10)
+
+        assert [e.name for e in items] == ["Apple", "apple pie", "My Apple"]
+        assert next_offset is None
+
+    async def test_search_examples_paginates_with_offset(self):
+        """次ページがある場合は次回のoffsetを返す"""
+        for i in range(5):
+            await self.usecase.create_example(ExampleCreate(name=f"Example {i}"))
+
+        items, next_offset = await self.usecase.search_examples("ample", limit=2)
+        rest, last_offset = await self.usecase.search_examples("ample", limit=2, offset=4)
+
+        assert [e.id for e in items] == [1, 2]
+        assert next_offset == 2
+        assert [e.id for e in rest] == [5]
+        assert last_offset is None
+
+    async def test_search_examples_reflects_renamed_example(self):
+        """名前の変更後は新しい名前で検索される"""
+        example = await self.usecase.create_example(ExampleCreate(name="Old name"))
+
+        await self.usecase.rename_example(example.id, "New name")
+
+        assert (await self.usecase.search_examples("old", limit=10))[0] == []
+        items, _ = await self.usecase.search_examples("new", limit=10)
+        assert [e.id for e in items] == [example.id]
+
+    async def test_list_changes_in_update_order(self):
+        """変更は(updated_at, id)の順に返し、続きがあればhas_moreがTrueになる"""
+        first = await self.usecase.create_example(ExampleCreate(name="First"))
+        second = await self.usecase.create_example(ExampleCreate(name="Second"))
+        await self.usecase.rename_example(first.id, "First updated")
+
+        items, has_more = await self.usecase.list_changes(limit=1)
+        rest, rest_has_more = await self.usecase.list_changes(
+            limit=10, after=(items[0].updated_at, items[0].id)
+        )
+
+        assert [e.id for e in items] == [second.id]
+        assert has_more is True
+        assert [e.id for e in rest] == [first.id]
+        assert rest_has_more is False
+
+    async def test_list_changes_holds_back_recent_changes(self):
+        """safety_lag_seconds以内の変更は返さない"""
+        await self.usecase.create_example(ExampleCreate(name="Recent"))
+
+        items, has_more = await self.usecase.list_changes(limit=10, safety_lag_seconds=60)
+
+        assert items == []
+        assert has_more is False
+
+    async def test_rename_example(self):
+        """名前の変更"""
+        example = await self.usecase.create_example(ExampleCreate(name="Old"))
+
+        result = await self.usecase.rename_example(example.id, "New")
+
+        assert result.name == "New"
+        assert (await self.usecase.search_examples("new", limit=10))[0] == [result]
+
+    async def test_rename_example_not_found(self):
+        """存在しないIDの名前変更はNoneを返す"""
+        assert await self.usecase.rename_example(999, "New") is None
+
+    async def test_rename_example_with_empty_name_raises_error(self):
+        """空の名前への変更はリポジトリを呼ばずに失敗する"""
+        example = await self.usecase.create_example(ExampleCreate(name="Old"))
+
+        with pytest.raises(ValueError, match="Name cannot be empty"):
+            await self.usecase.rename_example(example.id, " ")
+        assert (await self.mock_repo.find_by_id(example.id)).name == "Old"
+
+    async def test_export_examples(self):
+        """エクスポートで全件を逐次返す"""
+        for i in range(3):
+            await self.usecase.create_example(ExampleCreate(name=f"Example {i}"))
+
+        names = [e.name async for e in self.usecase.export_examples(chunk_size=2)]
+
+        assert names == ["Example 0", "Example 1", "Example 2"]
+
+    async def test_create_example_enqueues_notification(self):
+        """通知先が設定されている場合は作成時に通知メールをアウトボックスに追加する"""
+        usecase = AsyncExampleUseCase(self.uow, notify_email="admin@example.com")
+
+        await usecase.create_example(ExampleCreate(name="Notified"))
+
+        [email] = self.uow.outbox.repository.emails.values()
+        assert email.to == "admin@example.com"
+        assert "Notified" in email.body
+        # 通知メールとエンティティを1回のcommitで書き込む
+        assert self.uow.commits == 1
+        assert len(await self.mock_repo.find_all()) == 1
+
+    async def test_create_example_rolls_back_on_failure(self):
+        """保存に失敗した場合は通知メールも書き込まれない"""
+        usecase = AsyncExampleUseCase(self.uow, notify_email="admin@example.com")
+
+        async def fail(example):
+            raise RuntimeError("insert failed")
+
+        self.mock_repo.save = fail
+        with pytest.raises(RuntimeError):
+            await usecase.create_example(ExampleCreate(name="Failed"))
+
+        assert self.uow.commits == 0
+        assert self.uow.outbox.repository.emails == {}
+
+    async def test_create_examples_bulk_commits_once(self):
+        """一括作成は件数に関わらず1回だけcommitする"""
+        await self.usecase.create_examples([ExampleCreate(name=f"E{i}") for i in range(5)], 2)
+
+        assert self.uow.commits == 1
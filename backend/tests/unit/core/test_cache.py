@@ -0,0 +1,71 @@
+from app.core.cache import MISSING, TTLCache
+
+
+class FakeClock:
+    """テスト用の時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """TTLCacheのユニットテスト"""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_size=2, ttl_seconds=10, clock=self.clock)
+
+    def test_get_missing_returns_sentinel(self):
+        """未登録のキーはMISSINGを返しミスとして数える"""
+        assert self.cache.get("a") is MISSING
+        assert self.cache.stats()["misses"] == 1
+
+    def test_set_and_get(self):
+        """登録した値を取得できヒットとして数える"""
+        self.cache.set("a", 1)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_none_is_cached(self):
+        """Noneも値としてキャッシュできる（否定キャッシュ）"""
+        self.cache.set("a", None)
+
+        assert self.cache.get("a") is None
+
+    def test_entry_expires_after_ttl(self):
+        """TTL経過後は期限切れとなる"""
+        self.cache.set("a", 1)
+        self.clock.now = 10
+
+        assert self.cache.get("a") is MISSING
+        assert self.cache.stats()["expirations"] == 1
+
+    def test_per_entry_ttl(self):
+        """エントリごとにTTLを指定できる"""
+        self.cache.set("a", None, ttl_seconds=1)
+        self.clock.now = 1
+
+        assert self.cache.get("a") is MISSING
+
+    def test_evicts_least_recently_used(self):
+        """上限超過時は最も古く使われたエントリを破棄する"""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        assert self.cache.get("b") is MISSING
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+        assert self.cache.stats()["evictions"] == 1
+
+    def test_delete(self):
+        """削除したエントリは取得できない"""
+        self.cache.set("a", 1)
+        self.cache.delete("a")
+
+        assert self.cache.get("a") is MISSING
@@ -0,0 +1,22 @@
+from app.core.etag import etag_matches, make_etag
+
+
+class TestEtag:
+    """ETagヘルパーのユニットテスト"""
+
+    def test_make_etag_is_stable_and_quoted(self):
+        """同じ入力からは同じ引用符付きETagが生成される"""
+        etag = make_etag(1, "2026-01-01")
+
+        assert etag == make_etag(1, "2026-01-01")
+        assert etag != make_etag(1, "2026-01-02")
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_etag_matches_list_and_weak(self):
+        """カンマ区切り・弱いETag・*に一致する"""
+        etag = make_etag(1)
+
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
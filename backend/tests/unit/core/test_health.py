@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from app.core.health import HealthMonitor
+
+
+async def ok_probe() -> None:
+    pass
+
+
+async def failing_probe() -> None:
+    raise ConnectionError("refused")
+
+
+async def slow_probe() -> None:
+    await asyncio.sleep(1)
+
+
+class TestHealthMonitor:
+    """HealthMonitorのユニットテスト"""
+
+    async def test_not_ready_before_first_check(self):
+        """一度も確認していない間はready扱いにしない"""
+        monitor = HealthMonitor({"database": ok_probe}, interval_seconds=10, timeout_seconds=1)
+
+        assert monitor.is_ready() is False
+
+    async def test_ready_when_all_probes_succeed(self):
+        """全プローブ成功でready"""
+        monitor = HealthMonitor(
+            {"database": ok_probe, "s3": ok_probe}, interval_seconds=10, timeout_seconds=1
+        )
+
+        await monitor.run_once()
+
+        assert monitor.is_ready() is True
+        assert monitor.results["database"].ok is True
+
+    async def test_not_ready_when_probe_fails(self):
+        """1つでも失敗すればnot ready、エラー内容を保持する"""
+        monitor = HealthMonitor(
+            {"database": ok_probe, "smtp": failing_probe}, interval_seconds=10, timeout_seconds=1
+        )
+
+        await monitor.run_once()
+
+        assert monitor.is_ready() is False
+        assert monitor.results["smtp"].error == "ConnectionError: refused"
+
+    async def test_probe_timeout_is_failure(self):
+        """タイムアウトしたプローブは失敗として扱う"""
+        monitor = HealthMonitor({"database": slow_probe}, interval_seconds=10, timeout_seconds=0.01)
+
+        await monitor.run_once()
+
+        assert monitor.results["database"].ok is False
+
+    async def test_stale_results_are_not_ready(self):
+        """監視が止まり結果が古くなった場合はnot ready"""
+        monitor = HealthMonitor({"database": ok_probe}, interval_seconds=1, timeout_seconds=1)
+        await monitor.run_once()
+
+        monitor.results["database"].checked_at = time.time() - 60
+
+        assert monitor.is_ready() is False
+
+    async def test_start_and_stop(self):
+        """開始するとバックグラウンドで確認が行われ、停止できる"""
+        monitor = HealthMonitor({"database": ok_probe}, interval_seconds=10, timeout_seconds=1)
+
+        monitor.start()
+        for _ in range(100):
+            if monitor.results:
+                break
+            await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert monitor.is_ready() is True
@@ -0,0 +1,68 @@
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from app.core.logging_config import DeferredFormatQueueHandler, JsonFormatter
+
+
+def _record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.ERROR, __file__, 10, "hello %s", ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    """JsonFormatterのユニットテスト"""
+
+    def test_formats_message_and_static_fields(self):
+        """メッセージと共通項目を出力する"""
+        formatter = JsonFormatter(static_fields={"env": "test"})
+
+        data = json.loads(formatter.format(_record()))
+
+        assert data["message"] == "hello world"
+        assert data["level"] == "ERROR"
+        assert data["env"] == "test"
+
+    def test_includes_extra_fields(self):
+        """extra=で渡された項目を出力する"""
+        formatter = JsonFormatter()
+
+        data = json.loads(formatter.format(_record(request_path="/api/v1/examples")))
+
+        assert data["request_path"] == "/api/v1/examples"
+
+
+class TestDeferredFormatQueueHandler:
+    """DeferredFormatQueueHandlerのユニットテスト"""
+
+    def test_listener_receives_extras_and_exception(self):
+        """キュー経由でもextraと例外情報が失われない"""
+        log_queue = queue.SimpleQueue()
+        records: list[str] = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record):
+                records.append(self.format(record))
+
+        capture = CaptureHandler()
+        capture.setFormatter(JsonFormatter())
+        listener = QueueListener(log_queue, capture)
+        logger = logging.getLogger("test.deferred")
+        logger.propagate = False
+        logger.addHandler(DeferredFormatQueueHandler(log_queue))
+        listener.start()
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("failed %s", "here", exc_info=True, extra={"request_method": "GET"})
+        finally:
+            listener.stop()
+            logger.handlers.clear()
+
+        data = json.loads(records[0])
+        assert data["message"] == "failed here"
+        assert data["request_method"] == "GET"
+        assert "ValueError: boom" in data["exception"]
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.pool_metrics import PoolMetrics
+
+
+class TestPoolMetrics:
+    """PoolMetricsのユニットテスト"""
+
+    def setup_method(self):
+        self.metrics = PoolMetrics("test")
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=self.metrics.pool_class(QueuePool),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01,
+        )
+        self.metrics.attach(self.engine)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_counts_checkouts_and_waits(self):
+        """チェックアウト・チェックイン・待ち時間が集計される"""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            snapshot = self.metrics.snapshot()
+            assert snapshot["checked_out"] == 1
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot["connects"] == 1
+        assert snapshot["checkouts"] == 1
+        assert snapshot["checkins"] == 1
+        assert snapshot["wait_count"] == 1
+        assert snapshot["checked_out"] == 0
+        assert snapshot["size"] == 1
+
+    def test_counts_timeouts(self):
+        """プール枯渇によるタイムアウトが集計される"""
+        with self.engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                self.engine.connect()
+
+        assert self.metrics.snapshot()["timeouts"] == 1
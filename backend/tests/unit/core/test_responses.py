@@ -0,0 +1,44 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from pydantic import TypeAdapter
+
+from app.core.responses import TypeAdapterJSONResponse
+from app.domain.example import Example
+from app.schemas.example import ExamplePage, ExampleResponse
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@dataclass(slots=True)
+class ExampleWithInternalField(Example):
+    """レスポンスのスキーマにないフィールドを持つエンティティ"""
+
+    internal_note: str = "secret"
+
+
+class TestTypeAdapterJSONResponse:
+    """TypeAdapterJSONResponseのユニットテスト"""
+
+    def test_renders_entity_as_response_schema(self):
+        """エンティティをレスポンスのスキーマと同じJSONにする"""
+        example = Example(id=1, name="Test", description=None, created_at=NOW, updated_at=NOW)
+
+        response = TypeAdapterJSONResponse(example, TypeAdapter(ExampleResponse))
+
+        expected = ExampleResponse.model_validate(example).model_dump(mode="json")
+        assert json.loads(response.body) == expected
+
+    def test_omits_fields_not_in_schema(self):
+        """スキーマにないエンティティのフィールドはJSONに含まれない"""
+        example = ExampleWithInternalField(
+            id=1, name="Test", description=None, created_at=NOW, updated_at=NOW
+        )
+
+        response = TypeAdapterJSONResponse(
+            {"items": [example], "next_cursor": None}, TypeAdapter(ExamplePage)
+        )
+
+        [item] = json.loads(response.body)["items"]
+        assert set(item) == set(ExampleResponse.model_fields)
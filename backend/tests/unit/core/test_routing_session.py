@@ -0,0 +1,48 @@
+from sqlalchemy import create_engine, insert, select
+
+from app.core.config import settings
+from app.core.database import RoutingSession
+from app.infrastructure.database.models import ExampleModel
+
+
+class TestRoutingSession:
+    """RoutingSessionのユニットテスト"""
+
+    def setup_method(self):
+        self.primary = create_engine("sqlite://")
+        self.replica = create_engine("sqlite://")
+
+    def test_reads_go_to_replica(self):
+        """読み取りはレプリカへ振り分けられる"""
+        session = RoutingSession(primary=self.primary, replicas=[self.replica])
+
+        assert session.get_bind(clause=select(ExampleModel)) is self.replica
+
+    def test_writes_go_to_primary_and_pin(self, monkeypatch):
+        """書き込み後の読み取りはプライマリに固定される"""
+        monkeypatch.setattr(settings, "DATABASE_READ_YOUR_WRITES", True)
+        session = RoutingSession(primary=self.primary, replicas=[self.replica])
+
+        assert session.get_bind(clause=insert(ExampleModel)) is self.primary
+        assert session.get_bind(clause=select(ExampleModel)) is self.primary
+
+    def test_locking_reads_go_to_primary(self):
+        """SELECT ... FOR UPDATEはプライマリへ振り分けられる"""
+        session = RoutingSession(primary=self.primary, replicas=[self.replica])
+        clause = select(ExampleModel).with_for_update(skip_locked=True)
+
+        assert session.get_bind(clause=clause) is self.primary
+
+    def test_read_your_writes_disabled(self, monkeypatch):
+        """read-your-writes無効時は書き込み後もレプリカから読む"""
+        monkeypatch.setattr(settings, "DATABASE_READ_YOUR_WRITES", False)
+        session = RoutingSession(primary=self.primary, replicas=[self.replica])
+
+        assert session.get_bind(clause=insert(ExampleModel)) is self.primary
+        assert session.get_bind(clause=select(ExampleModel)) is self.replica
+
+    def test_without_replicas_uses_primary(self):
+        """レプリカ未設定時はすべてプライマリ"""
+        session = RoutingSession(primary=self.primary, replicas=[])
+
+        assert session.get_bind(clause=select(ExampleModel)) is self.primary
@@ -69,3 +69,17 @@ class TestExample:
         assert example.id == 1
         assert example.description == "Description"
         assert example.created_at == now  # created_atは変更されない
+
+    def test_validate_name(self):
+        """名前の検証は空文字列・空白のみを拒否する"""
+        Example.validate_name("Name")
+
+        with pytest.raises(ValueError, match="Name cannot be empty"):
+            Example.validate_name(" ")
+
+    def test_new_example_has_no_timestamps(self):
+        """未保存のエンティティの作成日時・更新日時はNone（保存時にDBで設定）"""
+        example = Example(id=0, name="New", description=None)
+
+        assert example.created_at is None
+        assert example.updated_at is None
@@ -0,0 +1,90 @@
+from datetime import UTC, datetime
+
+from app.core.cache import TTLCache
+from app.domain.example import Example
+from app.infrastructure.repositories.cached_example_repository import CachedExampleRepository
+from tests.unit.mocks.mock_example_repository import MockExampleRepository
+
+
+class CountingRepository(MockExampleRepository):
+    """find_by_idの呼び出し回数を数えるモック"""
+
+    def __init__(self):
+        super().__init__()
+        self.find_by_id_calls = 0
+
+    def find_by_id(self, example_id: int) -> Example | None:
+        self.find_by_id_calls += 1
+        return super().find_by_id(example_id)
+
+
+def _example(name: str) -> Example:
+    now = datetime.now(UTC)
+    return Example(id=0, name=name, description=None, created_at=now, updated_at=now)
+
+
+class TestCachedExampleRepository:
+    """CachedExampleRepositoryのユニットテスト"""
+
+    def setup_method(self):
+        self.inner = CountingRepository()
+        self.cache = TTLCache(max_size=2, ttl_seconds=60)
+        self.repository = CachedExampleRepository(self.inner, self.cache)
+
+    def test_find_by_id_is_cached(self):
+        """2回目以降はキャッシュから返す"""
+        saved = self.repository.save(_example("Test"))
+
+        self.repository.find_by_id(saved.id)
+        result = self.repository.find_by_id(saved.id)
+
+        assert result.name == "Test"
+        assert self.inner.find_by_id_calls == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_not_found_is_negative_cached(self):
+        """存在しないIDもキャッシュする"""
+        assert self.repository.find_by_id(999) is None
+        assert self.repository.find_by_id(999) is None
+        assert self.inner.find_by_id_calls == 1
+
+    def test_save_invalidates_negative_entry(self):
+        """保存時に否定キャッシュが破棄される"""
+        assert self.repository.find_by_id(1) is None
+
+        self.repository.save(_example("Created"))
+
+        assert self.repository.find_by_id(1).name == "Created"
+
+    def test_returned_entity_is_a_copy(self):
+        """返却したエンティティを変更してもキャッシュは影響を受けない"""
+        saved = self.repository.save(_example("Original"))
+        self.repository.find_by_id(saved.id).update_name("Changed")
+
+        assert self.repository.find_by_id(saved.id).name == "Original"
+
+    def test_eviction_falls_back_to_repository(self):
+        """LRUで破棄されたエントリは再取得される"""
+        for name in ["A", "B", "C"]:
+            self.repository.save(_example(name))
+        for example_id in [1, 2, 3]:
+            self.repository.find_by_id(example_id)
+
+        self.repository.find_by_id(1)
+
+        assert self.inner.find_by_id_calls == 4
+        assert self.cache.stats()["evictions"] == 2
+
+    def test_writes_evict_after_commit(self):
+        """after_commitを指定した場合はcommit後（登録した処理の実行時）に破棄する"""
+        callbacks = []
+        repository = CachedExampleRepository(self.inner, self.cache, after_commit=callbacks.append)
+        saved = repository.save(_example("Old"))
+        repository.find_by_id(saved.id)
+
+        repository.update_name(saved.id, "New")
+        assert repository.find_by_id(saved.id).name == "Old"
+
+        for callback in callbacks:
+            callback()
+        assert repository.find_by_id(saved.id).name == "New"
@@ -0,0 +1,71 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.infrastructure.clients import ClientRegistry
+
+
+class FakeS3Client:
+    """生成回数とclose呼び出しを記録するS3クライアント"""
+
+    instances = 0
+
+    def __init__(self):
+        FakeS3Client.instances += 1
+        # 生成に時間がかかる状況を再現
+        time.sleep(0.01)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSMTPClient:
+    """close呼び出しを記録するSMTPクライアント"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestClientRegistry:
+    """ClientRegistryのユニットテスト"""
+
+    def setup_method(self):
+        FakeS3Client.instances = 0
+        self.registry = ClientRegistry(s3_factory=FakeS3Client, smtp_factory=FakeSMTPClient)
+
+    def test_creates_lazily_once(self):
+        """初回利用時に1回だけ生成し、以降は同じインスタンスを返す"""
+        assert FakeS3Client.instances == 0
+
+        first = self.registry.s3()
+
+        assert self.registry.s3() is first
+        assert FakeS3Client.instances == 1
+
+    def test_concurrent_access_creates_one_instance(self):
+        """複数スレッドから同時に取得しても生成は1回"""
+        barrier = threading.Barrier(8)
+
+        def get():
+            barrier.wait()
+            return self.registry.s3()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: get(), range(8)))
+
+        assert FakeS3Client.instances == 1
+        assert all(client is results[0] for client in results)
+
+    async def test_close_only_created_clients(self):
+        """closeは生成済みのクライアントのみ閉じ、次回利用時に再生成する"""
+        s3 = self.registry.s3()
+
+        await self.registry.close()
+
+        assert s3.closed is True
+        assert FakeS3Client.instances == 1
+        assert self.registry.s3() is not s3
@@ -0,0 +1,91 @@
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from tests.unit.mocks.mock_email_outbox_repository import MockEmailOutboxRepository
+
+
+class FakeSMTPClient:
+    """宛先ごとに送信結果を決めるテスト用SMTPClient"""
+
+    def __init__(self, errors: dict[str, Exception] | None = None):
+        self.errors = errors or {}
+        self.sent: list[str] = []
+
+    async def send_many(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        results: list[Exception | None] = []
+        for message in messages:
+            error = self.errors.get(message["To"])
+            if error is None:
+                self.sent.append(message["To"])
+            results.append(error)
+        return results
+
+
+class TestEmailOutboxDispatcher:
+    """EmailOutboxDispatcherのユニットテスト"""
+
+    def setup_method(self):
+        self.outbox = MockEmailOutboxRepository()
+
+    def make_dispatcher(self, smtp_client: FakeSMTPClient, max_attempts: int = 3):
+        return EmailOutboxDispatcher(
+            self.outbox,
+            smtp_client,
+            batch_size=2,
+            max_attempts=max_attempts,
+            backoff_seconds=10,
+            backoff_max_seconds=60,
+            lease_seconds=300,
+        )
+
+    async def test_sends_all_pending_in_batches(self):
+        """送信待ちをバッチごとに送信し、送信済みにする"""
+        for i in range(3):
+            self.outbox.add(f"user{i}@example.com", "subject", "body", "noreply@example.com")
+        smtp_client = FakeSMTPClient()
+
+        await self.make_dispatcher(smtp_client).run(0, stop_when_idle=True)
+
+        assert len(smtp_client.sent) == 3
+        assert all(e.status == "sent" for e in self.outbox.emails.values())
+
+    async def test_temporary_failure_is_retried_later(self):
+        """一時的な失敗はバックオフ後に再送する"""
+        self.outbox.add("flaky@example.com", "subject", "body", "noreply@example.com")
+        smtp_client = FakeSMTPClient({"flaky@example.com": aiosmtplib.SMTPServerDisconnected("x")})
+
+        assert await self.make_dispatcher(smtp_client).dispatch_once() == (0, 1)
+
+        email = self.outbox.emails[1]
+        assert email.status == "pending"
+        assert email.attempts == 1
+        assert email.last_error.startswith("SMTPServerDisconnected")
+        # バックオフ中は確保されない
+        assert self.outbox.claim_due(10, 300) == []
+
+    async def test_permanent_failure_is_not_retried(self):
+        """宛先拒否は再送しない"""
+        self.outbox.add("bad@example.com", "subject", "body", "noreply@example.com")
+        smtp_client = FakeSMTPClient({"bad@example.com": aiosmtplib.SMTPRecipientsRefused([])})
+
+        await self.make_dispatcher(smtp_client).dispatch_once()
+
+        assert self.outbox.emails[1].status == "failed"
+
+    async def test_gives_up_after_max_attempts(self):
+        """max_attempts回失敗したら打ち切る"""
+        self.outbox.add("flaky@example.com", "subject", "body", "noreply@example.com")
+        self.outbox.emails[1].attempts = 2
+        smtp_client = FakeSMTPClient({"flaky@example.com": ConnectionError("refused")})
+
+        await self.make_dispatcher(smtp_client, max_attempts=3).dispatch_once()
+
+        assert self.outbox.emails[1].status == "failed"
+
+    def test_backoff_is_exponential_and_capped(self):
+        """待ち時間は試行ごとに倍増し、上限で頭打ちになる"""
+        dispatcher = self.make_dispatcher(FakeSMTPClient())
+
+        assert [dispatcher.backoff(n) for n in (1, 2, 3, 4, 5)] == [10, 20, 40, 60, 60]
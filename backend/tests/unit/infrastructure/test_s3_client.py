@@ -0,0 +1,88 @@
+import io
+
+from botocore.stub import Stubber
+
+from app.infrastructure.storage.s3_client import S3Client
+
+
+class TestS3Client:
+    """S3Clientのユニットテスト（botocoreのStubberでAPI応答を差し替え）"""
+
+    def setup_method(self):
+        self.s3 = S3Client()
+        self.stubber = Stubber(self.s3.client)
+
+    def teardown_method(self):
+        self.stubber.deactivate()
+
+    def test_iter_keys_follows_pagination(self):
+        """1000件で打ち切らず、続きのページも取得する"""
+        self.stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [{"Key": "logs/a"}, {"Key": "logs/b"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+            },
+            {"Bucket": self.s3.bucket, "Prefix": "logs/", "MaxKeys": 2},
+        )
+        self.stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "logs/c"}], "IsTruncated": False},
+            {
+                "Bucket": self.s3.bucket,
+                "Prefix": "logs/",
+                "MaxKeys": 2,
+                "ContinuationToken": "token",
+            },
+        )
+        self.stubber.activate()
+
+        assert list(self.s3.iter_keys("logs/", page_size=2)) == ["logs/a", "logs/b", "logs/c"]
+        self.stubber.assert_no_pending_responses()
+
+    def test_list_objects_empty(self):
+        """オブジェクトがない場合は空リスト"""
+        self.stubber.add_response("list_objects_v2", {"IsTruncated": False})
+        self.stubber.activate()
+
+        assert self.s3.list_objects() == []
+
+    def test_upload_bytes(self):
+        """バイト列を一時ファイルなしでアップロードする"""
+        self.stubber.add_response("put_object", {})
+        self.stubber.activate()
+
+        self.s3.upload_bytes(b"hello", "data.bin")
+
+        self.stubber.assert_no_pending_responses()
+
+    def test_upload_files_reports_each_result(self, monkeypatch):
+        """一括アップロードは入力順に成功(None)・失敗(例外)を返す"""
+        uploaded = []
+
+        def fake_upload_file(file_path: str, object_name: str) -> None:
+            if file_path == "missing.txt":
+                raise FileNotFoundError(file_path)
+            uploaded.append(object_name)
+
+        monkeypatch.setattr(self.s3, "upload_file", fake_upload_file)
+
+        results = self.s3.upload_files(
+            [("a.txt", "a"), ("missing.txt", "b"), ("c.txt", "c")], max_workers=2
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], FileNotFoundError)
+        assert results[2] is None
+        assert sorted(uploaded) == ["a", "c"]
+
+    def test_download_fileobj_uses_buffer(self, monkeypatch):
+        """download_bytesはメモリ上のバッファに書き込む"""
+
+        def fake_download_fileobj(object_name: str, fileobj: io.BytesIO) -> None:
+            fileobj.write(b"content of " + object_name.encode())
+
+        monkeypatch.setattr(self.s3, "download_fileobj", fake_download_fileobj)
+
+        assert self.s3.download_bytes("key") == b"content of key"
@@ -0,0 +1,124 @@
+import asyncio
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.infrastructure.email.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """テスト用のSMTP接続"""
+
+    def __init__(self, server: "FakeServer"):
+        self.server = server
+        self.is_connected = False
+
+    async def connect(self) -> None:
+        self.server.connects += 1
+        self.is_connected = True
+
+    async def send_message(self, message: EmailMessage) -> None:
+        if self.server.drop_next:
+            self.server.drop_next = False
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("idle timeout")
+        if message["To"] in self.server.rejected:
+            raise aiosmtplib.SMTPRecipientsRefused([])
+        self.server.active += 1
+        self.server.max_active = max(self.server.max_active, self.server.active)
+        await asyncio.sleep(0)
+        self.server.active -= 1
+        self.server.sent.append(message["To"])
+
+    def close(self) -> None:
+        self.is_connected = False
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+
+class FakeServer:
+    """FakeSMTPの接続状況を記録する"""
+
+    def __init__(self):
+        self.connects = 0
+        self.active = 0
+        self.max_active = 0
+        self.drop_next = False
+        self.rejected: set[str] = set()
+        self.sent: list[str] = []
+
+
+def make_message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["To"] = to
+    message.set_content("body")
+    return message
+
+
+class TestSMTPConnectionPool:
+    """SMTPConnectionPoolのユニットテスト"""
+
+    def setup_method(self):
+        self.server = FakeServer()
+        self.pool = SMTPConnectionPool(size=2, connection_factory=lambda: FakeSMTP(self.server))
+
+    async def test_reuses_connection(self):
+        """連続した送信で接続を使い回す"""
+        await self.pool.send(make_message("a@example.com"))
+        await self.pool.send(make_message("b@example.com"))
+
+        assert self.server.connects == 1
+        assert self.server.sent == ["a@example.com", "b@example.com"]
+
+    async def test_reconnects_when_dropped(self):
+        """サーバーに切断された接続は再接続して再送する"""
+        await self.pool.send(make_message("a@example.com"))
+        self.server.drop_next = True
+
+        await self.pool.send(make_message("b@example.com"))
+
+        assert self.server.connects == 2
+        assert self.server.sent == ["a@example.com", "b@example.com"]
+
+    async def test_send_many_limits_concurrency(self):
+        """send_manyはプールサイズを超えて並行送信しない"""
+        messages = [make_message(f"user{i}@example.com") for i in range(10)]
+
+        results = await self.pool.send_many(messages)
+
+        assert results == [None] * 10
+        assert len(self.server.sent) == 10
+        assert self.server.max_active == 2
+        assert self.server.connects == 2
+
+    async def test_send_many_reports_failures(self):
+        """失敗したメールは例外を返し、他のメールは送信を続ける"""
+        self.server.rejected = {"bad@example.com"}
+        recipients = ("a@example.com", "bad@example.com", "b@example.com")
+        messages = [make_message(to) for to in recipients]
+
+        results = await self.pool.send_many(messages)
+
+        assert results[0] is None
+        assert isinstance(results[1], aiosmtplib.SMTPRecipientsRefused)
+        assert results[2] is None
+        assert sorted(self.server.sent) == ["a@example.com", "b@example.com"]
+
+    async def test_close(self):
+        """closeで保持している接続を閉じる"""
+        await self.pool.send(make_message("a@example.com"))
+
+        await self.pool.close()
+        await self.pool.send(make_message("b@example.com"))
+
+        assert self.server.connects == 2
+
+    async def test_send_many_with_explicit_concurrency(self):
+        """concurrencyを指定するとその本数までに制限する"""
+        messages = [make_message(f"user{i}@example.com") for i in range(5)]
+
+        await self.pool.send_many(messages, concurrency=1)
+
+        assert self.server.max_active == 1
+        assert self.server.connects == 1
@@ -1,3 +1,13 @@
+from tests.unit.mocks.mock_async_email_outbox_repository import MockAsyncEmailOutboxRepository
+from tests.unit.mocks.mock_async_example_repository import MockAsyncExampleRepository
+from tests.unit.mocks.mock_email_outbox_repository import MockEmailOutboxRepository
 from tests.unit.mocks.mock_example_repository import MockExampleRepository
+from tests.unit.mocks.mock_unit_of_work import MockAsyncUnitOfWork
 
-__all__ = ["MockExampleRepository"]
+__all__ = [
+    "MockAsyncEmailOutboxRepository",
+    "MockAsyncExampleRepository",
+    "MockAsyncUnitOfWork",
+    "MockEmailOutboxRepository",
+    "MockExampleRepository",
+]
@@ -0,0 +1,13 @@
+from app.domain.repositories.async_email_outbox_repository import IAsyncEmailOutboxRepository
+from tests.unit.mocks.mock_email_outbox_repository import MockEmailOutboxRepository
+
+
+class MockAsyncEmailOutboxRepository(IAsyncEmailOutboxRepository):
+    """テスト用モックリポジトリ（非同期版、MockEmailOutboxRepositoryに委譲）"""
+
+    def __init__(self, repository: MockEmailOutboxRepository | None = None):
+        self.repository = repository or MockEmailOutboxRepository()
+
+    async def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加"""
+        self.repository.add(to, subject, body, from_email)
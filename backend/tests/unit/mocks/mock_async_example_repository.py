@@ -0,0 +1,67 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from app.domain.example import Example, ExampleSaveResult
+from app.domain.repositories.async_example_repository import IAsyncExampleRepository
+from tests.unit.mocks.mock_example_repository import MockExampleRepository
+
+
+class MockAsyncExampleRepository(IAsyncExampleRepository):
+    """テスト用モックリポジトリ（非同期版、MockExampleRepositoryに委譲）"""
+
+    def __init__(self, repository: MockExampleRepository | None = None):
+        self.repository = repository or MockExampleRepository()
+
+    async def find_by_id(self, example_id: int) -> Example | None:
+        """IDでエンティティを取得"""
+        return self.repository.find_by_id(example_id)
+
+    async def find_all(self) -> list[Example]:
+        """全エンティティを取得"""
+        return self.repository.find_all()
+
+    async def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        return self.repository.find_page(limit, after_id)
+
+    async def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得"""
+        return self.repository.find_version(example_id)
+
+    async def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得"""
+        return self.repository.find_page_version(limit, after_id)
+
+    async def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得"""
+        return self.repository.search_by_name(query, limit, offset)
+
+    async def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得"""
+        return self.repository.find_changes(limit, after, safety_lag_seconds)
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[Example]:
+        """全エンティティを逐次返す"""
+        for example in self.repository.stream_all(chunk_size):
+            yield example
+
+    async def save(self, example: Example) -> Example:
+        """エンティティを保存"""
+        return self.repository.save(example)
+
+    async def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新"""
+        return self.repository.update_name(example_id, name)
+
+    async def save_many(
+        self, examples: list[Example], batch_size: int
+    ) -> list[ExampleSaveResult]:
+        """複数エンティティを保存"""
+        return self.repository.save_many(examples, batch_size)
@@ -0,0 +1,57 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from app.domain.email import OutboxEmail
+from app.domain.repositories.email_outbox_repository import IEmailOutboxRepository
+from app.infrastructure.database.models import utc_now
+
+
+class MockEmailOutboxRepository(IEmailOutboxRepository):
+    """テスト用モックリポジトリ（インメモリ実装）"""
+
+    def __init__(self):
+        self.emails: dict[int, OutboxEmail] = {}
+        self.next_id = 1
+
+    def add(self, to: str, subject: str, body: str, from_email: str) -> None:
+        """送信待ちメールを追加"""
+        now = utc_now()
+        self.emails[self.next_id] = OutboxEmail(
+            id=self.next_id,
+            to=to,
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            status="pending",
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+        )
+        self.next_id += 1
+
+    def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        """送信時刻に達したメールを最大limit件確保する"""
+        now = utc_now()
+        due = sorted(
+            (e for e in self.emails.values() if e.status == "pending" and e.next_attempt_at <= now),
+            key=lambda e: (e.next_attempt_at, e.id),
+        )[:limit]
+        for email in due:
+            email.attempts += 1
+            email.next_attempt_at = now + timedelta(seconds=lease_seconds)
+        return [replace(email) for email in due]
+
+    def mark_sent(self, email_ids: list[int]) -> None:
+        """送信済みにする"""
+        for email_id in email_ids:
+            self.emails[email_id].status = "sent"
+            self.emails[email_id].sent_at = utc_now()
+
+    def mark_failed(self, email_id: int, error: str, retry_at: datetime | None) -> None:
+        """送信失敗を記録"""
+        email = self.emails[email_id]
+        email.last_error = error
+        if retry_at is None:
+            email.status = "failed"
+        else:
+            email.next_attempt_at = retry_at
@@ -1,5 +1,10 @@
-from app.domain.example import Example
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from app.domain.example import Example, ExampleSaveResult
 from app.domain.repositories.example_repository import IExampleRepository
+from app.infrastructure.database.models import utc_now
 
 
 class MockExampleRepository(IExampleRepository):
@@ -8,6 +13,10 @@ class MockExampleRepository(IExampleRepository):
     def __init__(self):
         self.examples: dict[int, Example] = {}
         self.next_id = 1
+        # 名前（小文字）の全サフィックスの前方一致インデックス: (サフィックス, ID)の昇順リスト
+        # 部分一致はいずれかのサフィックスへの前方一致として二分探索で求める
+        self.name_index: list[tuple[str, int]] = []
+        self.indexed_names: dict[int, str] = {}
 
     def find_by_id(self, example_id: int) -> Example | None:
         """IDでエンティティを取得"""
@@ -17,16 +26,111 @@ class MockExampleRepository(IExampleRepository):
         """全エンティティを取得"""
         return list(self.examples.values())
 
+    def find_page(self, limit: int, after_id: int | None = None) -> list[Example]:
+        """IDの昇順でafter_idより後のエンティティを最大limit件取得"""
+        ids = sorted(i for i in self.examples if after_id is None or i > after_id)
+        return [self.examples[i] for i in ids[:limit]]
+
+    def find_version(self, example_id: int) -> datetime | None:
+        """エンティティの更新日時のみを取得"""
+        example = self.examples.get(example_id)
+        return example.updated_at if example is not None else None
+
+    def find_page_version(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[int, int | None, datetime | None]:
+        """find_pageと同じ範囲の件数・最大ID・最大更新日時を取得"""
+        page = self.find_page(limit, after_id)
+        if not page:
+            return 0, None, None
+        return len(page), max(e.id for e in page), max(e.updated_at for e in page)
+
+    def search_by_name(self, query: str, limit: int, offset: int = 0) -> list[Example]:
+        """名前にqueryを含むエンティティを関連度順に取得（前方一致インデックスを使用）"""
+        needle = query.lower()
+        ids = set()
+        position = bisect_left(self.name_index, (needle, 0))
+        while position < len(self.name_index):
+            suffix, example_id = self.name_index[position]
+            if not suffix.startswith(needle):
+                break
+            ids.add(example_id)
+            position += 1
+
+        def rank(example_id: int) -> tuple[int, int]:
+            name = self.examples[example_id].name.lower()
+            return (0 if name == needle else 1 if name.startswith(needle) else 2, example_id)
+
+        ranked = sorted(ids, key=rank)
+        return [self.examples[i] for i in ranked[offset : offset + limit]]
+
+    def find_changes(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        safety_lag_seconds: float | None = None,
+    ) -> list[Example]:
+        """(updated_at, id)の昇順でafterより後に更新されたエンティティを最大limit件取得"""
+        until = None
+        if safety_lag_seconds is not None:
+            until = utc_now() - timedelta(seconds=safety_lag_seconds)
+        changes = sorted(
+            (
+                e
+                for e in self.examples.values()
+                if (after is None or (e.updated_at, e.id) > after)
+                and (until is None or e.updated_at <= until)
+            ),
+            key=lambda e: (e.updated_at, e.id),
+        )
+        return changes[:limit]
+
+    def _index_name(self, example: Example) -> None:
+        """名前の前方一致インデックスを更新"""
+        previous = self.indexed_names.pop(example.id, None)
+        if previous is not None:
+            for start in range(len(previous)):
+                self.name_index.remove((previous[start:], example.id))
+        name = example.name.lower()
+        self.indexed_names[example.id] = name
+        for start in range(len(name)):
+            insort(self.name_index, (name[start:], example.id))
+
+    def stream_all(self, chunk_size: int) -> Iterator[Example]:
+        """全エンティティを逐次返す"""
+        for example_id in sorted(self.examples):
+            yield self.examples[example_id]
+
     def save(self, example: Example) -> Example:
         """エンティティを保存"""
         if example.id == 0:
-            # 新規作成
+            # 新規作成（IDと作成日時・更新日時はDBと同様に保存時に設定する）
+            now = utc_now()
             example.id = self.next_id
+            example.created_at = now
+            example.updated_at = now
             self.next_id += 1
         self.examples[example.id] = example
+        self._index_name(example)
         return example
 
+    def update_name(self, example_id: int, name: str) -> Example | None:
+        """名前を更新"""
+        example = self.examples.get(example_id)
+        if example is None:
+            return None
+        example.name = name
+        example.updated_at = utc_now()
+        self._index_name(example)
+        return example
+
+    def save_many(self, examples: list[Example], batch_size: int) -> list[ExampleSaveResult]:
+        """複数エンティティを保存"""
+        return [ExampleSaveResult(self.save(example)) for example in examples]
+
     def clear(self):
         """テストデータをクリア（テスト用ヘルパー）"""
         self.examples = {}
         self.next_id = 1
+        self.name_index = []
+        self.indexed_names = {}
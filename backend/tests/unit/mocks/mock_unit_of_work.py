@@ -0,0 +1,52 @@
+import copy
+from collections.abc import Callable
+
+from app.domain.unit_of_work import IAsyncUnitOfWork
+from tests.unit.mocks.mock_async_email_outbox_repository import MockAsyncEmailOutboxRepository
+from tests.unit.mocks.mock_async_example_repository import MockAsyncExampleRepository
+
+
+class MockAsyncUnitOfWork(IAsyncUnitOfWork):
+    """テスト用Unit of Work（インメモリ実装）
+
+    async with文の開始時点のリポジトリの状態を保持し、commitせずに抜けた場合はその状態に戻す。
+    """
+
+    def __init__(
+        self,
+        examples: MockAsyncExampleRepository | None = None,
+        outbox: MockAsyncEmailOutboxRepository | None = None,
+    ):
+        self.examples = examples or MockAsyncExampleRepository()
+        self.outbox = outbox or MockAsyncEmailOutboxRepository()
+        self.commits = 0
+        self.after_commit_callbacks: list[Callable[[], None]] = []
+        self._snapshot: tuple[dict, dict] | None = None
+
+    async def __aenter__(self) -> "MockAsyncUnitOfWork":
+        self._snapshot = copy.deepcopy(
+            (vars(self.examples.repository), vars(self.outbox.repository))
+        )
+        return self
+
+    async def commit(self) -> None:
+        """書き込みを確定"""
+        self.commits += 1
+        self._snapshot = None
+        callbacks, self.after_commit_callbacks = self.after_commit_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        """async with文の開始時点の状態に戻す"""
+        self.after_commit_callbacks.clear()
+        if self._snapshot is None:
+            return
+        examples, outbox = self._snapshot
+        vars(self.examples.repository).update(examples)
+        vars(self.outbox.repository).update(outbox)
+        self._snapshot = None
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """次のcommitの後に実行する処理を登録"""
+        self.after_commit_callbacks.append(callback)
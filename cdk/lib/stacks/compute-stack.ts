@@ -236,7 +236,7 @@ export class ComputeStack extends Stack {
       protocol: elbv2.ApplicationProtocol.HTTP,
       targetType: elbv2.TargetType.IP,
       healthCheck: {
-        path: "/api/v1/health",
+        path: "/api/v1/health/ready",
         interval: Duration.seconds(30),
         timeout: Duration.seconds(5),
         healthyThresholdCount: 2,
@@ -583,7 +583,7 @@ export class ComputeStack extends Stack {
       healthCheck: {
         command: [
           "CMD-SHELL",
-          "python -c \"import urllib.request; urllib.request.urlopen('http://localhost:8000/api/v1/health')\" || exit 1",
+          "python -c \"import urllib.request; urllib.request.urlopen('http://localhost:8000/api/v1/health/live')\" || exit 1",
         ],
         interval: Duration.seconds(30),
         timeout: Duration.seconds(5),
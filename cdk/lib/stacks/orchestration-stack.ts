@@ -192,6 +192,8 @@ export class OrchestrationStack extends Stack {
                 {
                   Name: "backend",
                   Command: ["python", config.orchestration.batchScriptPath],
+                  // バッチは短命プロセスのためコネクションプールを使用しない
+                  Environment: [{ Name: "DB_USE_NULL_POOL", Value: "true" }],
                 },
               ],
             },